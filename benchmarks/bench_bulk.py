@@ -0,0 +1,52 @@
+"""
+Bulk create benchmark
+
+Creates N members against a mock network whose every request takes
+LATENCY seconds, once with a members.create loop and once with
+members.create_many at several concurrency levels.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_bulk.py [members]
+"""
+
+import sys
+import time
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient
+
+LATENCY = 0.005
+
+
+def handler(request):
+    time.sleep(LATENCY)
+    return httpx.Response(201, content=b'{"id": 1}')
+
+
+def rows(count: int):
+    for i in range(count):
+        yield {"email": f"member{i}@example.com", "first_name": "Member", "last_name": str(i)}
+
+
+def main(count: int = 2000) -> None:
+    client = MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+    print(f"{count:,} creates, {LATENCY * 1000:.0f} ms per request\n")
+
+    started = time.perf_counter()
+    for row in rows(count):
+        client.members.create(1, row.pop("email"), row.pop("first_name"), **row)
+    elapsed = time.perf_counter() - started
+    print(f"  {'create loop':24s} {elapsed:7.2f} s {count / elapsed:9.0f} rows/s")
+
+    for concurrency in (4, 16, 32):
+        run = client.members.create_many(1, rows(count), concurrency=concurrency)
+        run.run()
+        summary = run.summary()
+        print(f"  {f'create_many({concurrency})':24s} {summary['seconds']:7.2f} s "
+              f"{summary['per_second']:9.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
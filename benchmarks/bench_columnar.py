@@ -0,0 +1,90 @@
+"""
+Columnar collection benchmark
+
+Builds a pandas DataFrame from N purchases delivered as 100-item pages,
+comparing:
+
+- rows: every item kept as a dict, then ``pandas.DataFrame(items)`` with
+  timestamps parsed and strings made categorical afterwards
+- columns: each page streamed into typed column buffers, then ``to_pandas()``
+
+Both produce the same dtypes.
+
+Reports the time of each approach and its peak memory (measured on a
+separate run, as tracing slows Python code down).
+
+Usage:
+    pip install -e .[pandas]
+    python benchmarks/bench_columnar.py [purchases]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import pandas
+
+from mighty_networks_sdk.codec import get_codec
+from mighty_networks_sdk.columnar import Columns
+
+
+def purchase(i: int) -> dict:
+    return {
+        "id": 5_000_000 + i,
+        "member_id": 1_000_000 + i % 20_000,
+        "plan_id": 700 + i % 12,
+        "status": ("paid", "refunded", "pending")[i % 3],
+        "currency": "USD",
+        "amount": 19.99 + i % 5,
+        "product": f"Course {i % 40}",
+        "created_at": "2025-01-15T09:30:00Z",
+        "updated_at": "2025-06-01T12:00:00Z",
+    }
+
+
+def measure(label: str, build, pages) -> None:
+    started = time.perf_counter()
+    frame = build(pages)
+    elapsed = time.perf_counter() - started
+    del frame
+    tracemalloc.start()
+    frame = build(pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:8s} {elapsed * 1e3:9.1f} ms   peak {peak / 2**20:8.1f} MiB   {len(frame):,} rows")
+
+
+def by_rows(pages):
+    codec = get_codec()
+    items = []
+    for page in pages:
+        items.extend(codec.loads(page)["items"])
+    frame = pandas.DataFrame(items)
+    for name in ("created_at", "updated_at"):
+        frame[name] = pandas.to_datetime(frame[name], utc=True)
+    for name in ("status", "currency", "product"):
+        frame[name] = frame[name].astype("category")
+    return frame
+
+
+def by_columns(pages):
+    codec = get_codec()
+    columns = Columns()
+    for page in pages:
+        columns.extend(codec.loads(page)["items"])
+    return columns.to_pandas()
+
+
+def main(purchases: int = 200_000) -> None:
+    codec = get_codec()
+    pages = [
+        codec.dumps({"items": [purchase(i) for i in range(start, start + 100)], "links": {}})
+        for start in range(0, purchases, 100)
+    ]
+    print(f"Codec: {codec.name}; {purchases:,} purchases ({len(pages)} pages of 100)\n")
+    measure("rows", by_rows, pages)
+    measure("columns", by_columns, pages)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
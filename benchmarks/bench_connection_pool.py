@@ -0,0 +1,98 @@
+"""
+Connection pool benchmark
+
+Compares one ``httpx.Client`` per resource (the previous behaviour) with the
+single pool now shared by every resource of a ``MightyNetworksClient``.
+
+A local keep-alive HTTP server stands in for api.mn.co and counts accepted
+connections. The "cold" latency is the first call made through each of the
+18 resource namespaces.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_connection_pool.py
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient
+
+RESOURCES = [
+    "spaces", "members", "posts", "events", "plans", "custom_fields",
+    "comments", "tags", "subscriptions", "purchases", "polls", "invites",
+    "collections", "badges", "assets", "abuse_reports", "me", "network",
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = json.dumps({"items": [], "links": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+def _call_each_resource(sessions, base_url):
+    latencies = []
+    for session in sessions:
+        start = time.perf_counter()
+        session.get(f"{base_url}/admin/v1/networks/1/spaces")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    server = _CountingServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Previous behaviour: one pool per resource
+    sessions = [httpx.Client(http2=False) for _ in RESOURCES]
+    per_resource = _call_each_resource(sessions, base_url)
+    per_resource_connections = server.connections
+    for session in sessions:
+        session.close()
+
+    # Shared pool
+    server.connections = 0
+    with MightyNetworksClient(api_token="bench", base_url=base_url, http2=False) as client:
+        shared = _call_each_resource(
+            [getattr(client, name)._session for name in RESOURCES], base_url
+        )
+    shared_connections = server.connections
+
+    server.shutdown()
+
+    print(f"{'mode':<14}{'connections':>12}{'cold total ms':>16}{'mean ms':>10}")
+    for label, conns, lat in (
+        ("per-resource", per_resource_connections, per_resource),
+        ("shared pool", shared_connections, shared),
+    ):
+        total = sum(lat) * 1000
+        print(f"{label:<14}{conns:>12}{total:>16.2f}{total / len(lat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
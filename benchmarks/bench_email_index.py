@@ -0,0 +1,89 @@
+"""
+Email lookup benchmark
+
+Resolves a batch of emails (10% of them not members) against a mock
+network whose every request takes LATENCY seconds:
+
+- one members.get_by_email request per email
+- MemberEmailIndex: one member scan, then lookup_emails() on the batch
+- the same batch again, after a single member changed
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_email_index.py [members] [emails]
+"""
+
+import sys
+import time
+
+import httpx
+
+from mighty_networks_sdk import MemberEmailIndex, MightyNetworksClient
+from mighty_networks_sdk.codec import get_codec
+
+PER_PAGE = 100
+LATENCY = 0.002
+
+
+def make_client(members: dict) -> MightyNetworksClient:
+    codec = get_codec()
+    base = "https://api.mn.co/admin/v1/networks/1/members"
+    by_email = {member["email"]: member for member in members.values()}
+    requests = []
+
+    def handler(request):
+        requests.append(request.url)
+        time.sleep(LATENCY)
+        if request.url.path.endswith("/by_email"):
+            member = by_email.get(request.url.params["email"])
+            if member is None:
+                return httpx.Response(404, content=b'{"message": "not found"}')
+            return httpx.Response(200, content=codec.dumps(member))
+        number = int(request.url.params.get("page", 1))
+        ordered = sorted(members.values(), key=lambda m: m["updated_at"], reverse=True)
+        items = ordered[(number - 1) * PER_PAGE:number * PER_PAGE]
+        links = {"next": f"{base}?page={number + 1}"} if number * PER_PAGE < len(ordered) else {}
+        return httpx.Response(200, content=codec.dumps({"items": items, "links": links}))
+
+    client = MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+    client.bench_requests = requests
+    return client
+
+
+def member(i: int, stamp: str = "") -> dict:
+    # One member updated per second of 2025-06-01
+    stamp = stamp or f"2025-06-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z"
+    return {"id": i, "email": f"member{i}@example.com", "first_name": "Member", "updated_at": stamp}
+
+
+def timed(label: str, client: MightyNetworksClient, call) -> None:
+    del client.bench_requests[:]
+    started = time.perf_counter()
+    call()
+    print(f"  {label:34s} {time.perf_counter() - started:7.2f} s  "
+          f"{len(client.bench_requests):6,} requests")
+
+
+def main(count: int = 20_000, lookups: int = 2_000) -> None:
+    members = {i: member(i) for i in range(count)}
+    client = make_client(members)
+    step = max(count // lookups, 1)
+    emails = [f"member{i}@example.com" for i in range(0, count, step)][:lookups]
+    emails[::10] = [f"stranger{i}@example.com" for i in range(len(emails[::10]))]
+    print(f"{len(emails):,} lookups, {count:,} members, {LATENCY * 1000:.0f} ms per request\n")
+
+    timed("get_by_email per email", client,
+          lambda: [client.members.get_by_email(1, email) for email in emails])
+
+    # The mock lists newest-first, as the API does when asked to sort
+    index = MemberEmailIndex(client, network_id=1, order_param=("sort", "-updated_at"))
+    timed("index build (member scan)", client, index.build)
+    timed("lookup_emails (cold)", client, lambda: index.lookup_emails(emails))
+    timed("lookup_emails (warm)", client, lambda: index.lookup_emails(emails))
+    members[1] = member(1, "2025-06-02T08:00:00Z")
+    timed("refresh + lookup_emails", client, lambda: (index.refresh(), index.lookup_emails(emails)))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,76 @@
+"""
+Streaming export benchmark
+
+Exports networks of increasing size from a mock API (100-member pages) and
+reports the time and peak Python memory of each export. Memory stays flat
+as the network grows because only one page is held at a time.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_export.py [format] [compression]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient
+from mighty_networks_sdk.codec import get_codec
+
+BASE = "https://api.mn.co/admin/v1/networks/1/members"
+PER_PAGE = 100
+
+
+def make_client(members: int) -> MightyNetworksClient:
+    codec = get_codec()
+    pages = -(-members // PER_PAGE)
+
+    def handler(request):
+        number = int(request.url.params.get("page", 1))
+        start = (number - 1) * PER_PAGE
+        items = [
+            {
+                "id": 1_000_000 + i,
+                "email": f"member{i}@example.com",
+                "first_name": "Member",
+                "last_name": f"Number {i}",
+                "created_at": "2025-01-15T09:30:00Z",
+                "custom_fields": {"456": f"Company {i % 500}", "457": "Technology"},
+            }
+            for i in range(start, min(start + PER_PAGE, members))
+        ]
+        links = {"next": f"{BASE}?page={number + 1}"} if number < pages else {}
+        return httpx.Response(200, content=codec.dumps({"items": items, "links": links}))
+
+    return MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+
+
+def main(format: str = "ndjson", compression: str = "gzip") -> None:
+    suffix = {"ndjson": ".ndjson", "csv": ".csv", "parquet": ".parquet"}[format]
+    print(f"Export to {format}" + (f" + {compression}" if compression else "") + "\n")
+    with tempfile.TemporaryDirectory() as directory:
+        for members in (10_000, 50_000, 200_000):
+            path = os.path.join(directory, f"members-{members}{suffix}")
+            client = make_client(members)
+            tracemalloc.start()
+            started = time.perf_counter()
+            summary = client.export("members", path, network_id=1,
+                                    format=format, compression=compression or None)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size = os.path.getsize(path) if os.path.isfile(path) else sum(
+                entry.stat().st_size for entry in os.scandir(path)
+            )
+            print(
+                f"  {summary['rows']:>8,} members  {elapsed:6.2f} s  "
+                f"peak {peak / 2**20:6.1f} MiB  output {size / 2**20:6.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
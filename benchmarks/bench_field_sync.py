@@ -0,0 +1,59 @@
+"""
+Custom field sync benchmark
+
+Pushes desired custom field values for N members, one in ten of them
+changed, to a mock network whose every request takes LATENCY seconds:
+once with an update_member_values loop and once with
+custom_fields.sync_member_values.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_field_sync.py [members]
+"""
+
+import json
+import sys
+import time
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient
+
+LATENCY = 0.005
+
+
+def main(count: int = 2000) -> None:
+    stored = {user_id: {"456": f"Company {user_id}", "457": "Technology"} for user_id in range(count)}
+    desired = {
+        user_id: {**values, "457": "Finance" if user_id % 10 == 0 else values["457"]}
+        for user_id, values in stored.items()
+    }
+    patches = []
+
+    def handler(request):
+        time.sleep(LATENCY)
+        user_id = int(request.url.path.strip("/").split("/")[-2])
+        if request.method == "PATCH":
+            patches.append(user_id)
+            stored[user_id].update(json.loads(request.content))
+        return httpx.Response(200, json=stored[user_id])
+
+    client = MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+    print(f"{count:,} members, 10% changed, {LATENCY * 1000:.0f} ms per request\n")
+
+    started = time.perf_counter()
+    for user_id, values in desired.items():
+        client.custom_fields.update_member_values(1, user_id, values)
+    elapsed = time.perf_counter() - started
+    print(f"  {'update loop':24s} {elapsed:7.2f} s {len(patches):6,} PATCHes")
+
+    for user_id in range(0, count, 10):
+        stored[user_id]["457"] = "Technology"
+    patches.clear()
+    report = client.custom_fields.sync_member_values(1, desired, concurrency=8)
+    print(f"  {'sync_member_values(8)':24s} {report['seconds']:7.2f} s {len(patches):6,} PATCHes "
+          f"({report['writes_skipped']:,} skipped)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,93 @@
+"""
+JSON codec benchmark
+
+Compares the installed JSON codecs on realistic payloads:
+
+- decoding a 100-member page with nested custom fields
+- encoding a large ``collections.reorder_spaces`` list
+- encoding an ``invites.create`` email array
+- encoding a ``custom_fields.update_member_values`` map
+
+Codecs that are not installed are skipped (``pip install orjson msgspec``).
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_json_codecs.py
+"""
+
+import timeit
+
+from mighty_networks_sdk.codec import CODECS, get_codec
+
+
+def member_page(size: int = 100) -> dict:
+    return {
+        "items": [
+            {
+                "id": 1_000_000 + i,
+                "email": f"member{i}@example.com",
+                "first_name": "Member",
+                "last_name": f"Number {i}",
+                "avatar": f"https://cdn.example.com/avatars/{i}.png",
+                "created_at": "2025-01-15T09:30:00Z",
+                "updated_at": "2025-06-01T12:00:00Z",
+                "permalink": f"https://example.mn.co/members/{1_000_000 + i}",
+                "custom_fields": [
+                    {
+                        "id": 450 + f,
+                        "title": f"Field {f}",
+                        "type": "text" if f % 2 else "multi_select",
+                        "value": f"Value {i}-{f}" if f % 2 else ["Option A", "Option B"],
+                    }
+                    for f in range(8)
+                ],
+                "plans": [{"id": 77, "name": "Premium", "active": True}],
+            }
+            for i in range(size)
+        ],
+        "links": {"next": "https://api.mn.co/admin/v1/networks/1/members/?page=2"},
+    }
+
+
+PAYLOADS = {
+    "reorder_spaces (500 spaces)": {
+        "spaces": [{"space_id": 10_000 + i, "position": i + 1} for i in range(500)]
+    },
+    "invites.create (1000 emails)": {
+        "recipients": [f"invitee{i}@example.com" for i in range(1000)],
+        "message": "Join our community!",
+    },
+    "update_member_values (200 fields)": {
+        "custom_fields": {str(456 + i): f"Value {i}" for i in range(200)}
+    },
+}
+
+
+def bench(statement, number: int) -> float:
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    page = get_codec("json").dumps(member_page())
+    print(f"\nDecode 100-member page ({len(page) / 1024:.0f} KiB), us per page")
+    for codec in codecs:
+        print(f"  {codec.name:10s} {bench(lambda: codec.loads(page), 200):10.1f}")
+
+    for label, payload in PAYLOADS.items():
+        print(f"\nEncode {label}, us per body")
+        for codec in codecs:
+            print(f"  {codec.name:10s} {bench(lambda: codec.dumps(payload), 500):10.1f}")
+
+    print(f"\nAuto-detected codec: {get_codec().name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Lazy response benchmark
+
+A scan that reads only ``id``, ``email`` and ``updated_at`` of each member
+on 100-member pages with nested custom fields, comparing:
+
+- dict mode: the whole page decoded by the default JSON codec
+- lazy mode: the page split into raw fields by msgspec, three fields decoded
+
+Reports time per page and the peak memory of decoding one page.
+
+Usage:
+    pip install -e . msgspec
+    python benchmarks/bench_lazy.py
+"""
+
+import timeit
+import tracemalloc
+
+from mighty_networks_sdk import lazy
+from mighty_networks_sdk.codec import get_codec
+
+FIELDS = ("id", "email", "updated_at")
+
+
+def member_page(size: int = 100) -> dict:
+    return {
+        "items": [
+            {
+                "id": 1_000_000 + i,
+                "email": f"member{i}@example.com",
+                "first_name": "Member",
+                "last_name": f"Number {i}",
+                "bio": "Community builder. " * 10,
+                "avatar": f"https://cdn.example.com/avatars/{i}.png",
+                "created_at": "2025-01-15T09:30:00Z",
+                "updated_at": "2025-06-01T12:00:00Z",
+                "custom_fields": [
+                    {"id": 450 + f, "title": f"Field {f}", "value": [f"Option {o}" for o in range(4)]}
+                    for f in range(12)
+                ],
+                "spaces": [{"id": 9000 + s, "role": "member"} for s in range(10)],
+            }
+            for i in range(size)
+        ],
+        "links": {"next": "https://api.mn.co/admin/v1/networks/1/members/?page=2"},
+    }
+
+
+def scan_dict(codec, content):
+    return [tuple(item[f] for f in FIELDS) for item in codec.loads(content)["items"]]
+
+
+def scan_lazy(content):
+    items, _ = lazy.lazy_body(content)
+    return [tuple(item[f] for f in FIELDS) for item in items]
+
+
+def measure(label, scan):
+    per_page = min(timeit.repeat(scan, number=100, repeat=5)) / 100
+    tracemalloc.start()
+    scan()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:24s} {per_page * 1e6:9.1f} us/page   peak {peak / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    codec = get_codec()
+    content = codec.dumps(member_page())
+    print(f"Page: {len(content) / 1024:.0f} KiB, reading {', '.join(FIELDS)}\n")
+
+    measure(f"dict ({codec.name})", lambda: scan_dict(codec, content))
+    lazy.require_msgspec()
+    measure("lazy", lambda: scan_lazy(content))
+
+
+if __name__ == "__main__":
+    main()
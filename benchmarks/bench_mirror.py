@@ -0,0 +1,93 @@
+"""
+Mirror lookup benchmark
+
+Syncs a mock network of N members into a SQLite mirror, then times common
+reads served locally instead of by the API:
+
+- member by ID, member by email (case-insensitive)
+- 20 most recently updated members
+- memberships of a space
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_mirror.py [members]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient, Mirror
+from mighty_networks_sdk.codec import get_codec
+
+PER_PAGE = 100
+
+
+def make_client(members: int) -> MightyNetworksClient:
+    codec = get_codec()
+    base = "https://api.mn.co/admin/v1/networks/1"
+
+    def page(url_path, items, number, total):
+        links = {"next": f"{base}{url_path}?page={number + 1}"} if number * PER_PAGE < total else {}
+        return httpx.Response(200, content=codec.dumps({"items": items, "links": links}))
+
+    def handler(request):
+        number = int(request.url.params.get("page", 1))
+        start = (number - 1) * PER_PAGE
+        path = request.url.path.rstrip("/")[len("/admin/v1/networks/1"):]
+        if path == "/members":
+            items = [
+                {
+                    "id": i,
+                    "email": f"member{i}@example.com",
+                    "first_name": "Member",
+                    "last_name": f"Number {i}",
+                    "created_at": "2025-01-15T09:30:00Z",
+                    "updated_at": f"2025-06-01T12:{i // 60 % 60:02d}:{i % 60:02d}Z",
+                }
+                for i in range(start, min(start + PER_PAGE, members))
+            ]
+            return page(path, items, number, members)
+        if path == "/spaces":
+            return page(path, [{"id": s, "name": f"Space {s}"} for s in range(10)], 1, 10)
+        if path.endswith("/members"):
+            space = int(path.split("/")[2])
+            ids = range(space, members, 10)[start:start + PER_PAGE]
+            return page(path, [{"id": i, "role": "member"} for i in ids], number, len(range(space, members, 10)))
+        return page(path, [], 1, 0)
+
+    return MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+
+
+def bench(label: str, call, number: int = 2000) -> None:
+    per_call = min(timeit.repeat(call, number=number, repeat=5)) / number
+    print(f"  {label:32s} {per_call * 1e6:8.1f} us")
+
+
+def main(members: int = 50_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        mirror = Mirror(make_client(members), os.path.join(directory, "mirror.sqlite3"), network_id=1)
+        started = time.perf_counter()
+        stats = mirror.sync(["members", "space_members"])
+        print(f"Synced {stats['members']['fetched']:,} members and "
+              f"{stats['space_members']['fetched']:,} memberships in {time.perf_counter() - started:.1f} s")
+        started = time.perf_counter()
+        stats = mirror.sync(["members"])
+        print(f"Unchanged re-sync: {stats['members']['unchanged']:,} rows in "
+              f"{time.perf_counter() - started:.1f} s\n")
+
+        target = members // 2
+        bench("get('members', id)", lambda: mirror.get("members", target))
+        bench("member_by_email", lambda: mirror.member_by_email(f"MEMBER{target}@example.com"))
+        bench("find(order_by='-updated_at', 20)",
+              lambda: mirror.find("members", order_by="-updated_at", limit=20), 500)
+        bench("member_spaces", lambda: mirror.member_spaces(target))
+        mirror.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
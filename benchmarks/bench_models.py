@@ -0,0 +1,105 @@
+"""
+Typed model benchmark
+
+Compares ``response_mode="dict"`` with ``response_mode="typed"``:
+
+- memory retained by N decoded members (dicts vs slotted ``Member``)
+- decode time and peak memory of a 100-member page, with and without
+  fields outside the model. With msgspec installed, a page whose fields all
+  match ``Member`` is decoded straight into models; a page with other
+  fields (kept in ``extra``) is decoded to dicts and then converted
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_models.py [members]
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from mighty_networks_sdk import Member
+from mighty_networks_sdk.codec import get_codec
+from mighty_networks_sdk.models import decode_models
+
+
+def member(i: int) -> dict:
+    return {
+        "id": 1_000_000 + i,
+        "email": f"member{i}@example.com",
+        "first_name": "Member",
+        "last_name": f"Number {i}",
+        "time_zone": "America/New_York",
+        "avatar": f"https://cdn.example.com/avatars/{i}.png",
+        "created_at": "2025-01-15T09:30:00Z",
+        "updated_at": "2025-06-01T12:00:00Z",
+        "permalink": f"https://example.mn.co/members/{1_000_000 + i}",
+        "referral_count": i % 7,
+        "custom_fields": {"456": f"Company {i % 500}", "457": "Technology"},
+    }
+
+
+def known_fields(i: int) -> dict:
+    data = member(i)
+    del data["custom_fields"]
+    return data
+
+
+def peak(build, payload: bytes) -> int:
+    """Return the peak bytes allocated while decoding one page."""
+    gc.collect()
+    tracemalloc.start()
+    build(payload)
+    _, size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def retained(build, payload: bytes, pages: int) -> int:
+    """Return the bytes still allocated after decoding ``pages`` copies of a page."""
+    gc.collect()
+    tracemalloc.start()
+    held = [build(payload) for _ in range(pages)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main(members: int = 200_000) -> None:
+    codec = get_codec()
+    page = codec.dumps({"items": [member(i) for i in range(100)], "links": {}})
+    pages = max(1, members // 100)
+
+    def as_dicts(payload):
+        return codec.loads(payload)["items"]
+
+    def from_dicts(payload):
+        return [Member.from_dict(item) for item in codec.loads(payload)["items"]]
+
+    def as_models(payload):
+        # What response_mode="typed" does
+        decoded = decode_models(payload, Member)
+        return from_dicts(payload) if decoded is None else decoded[0]
+
+    print(f"Codec: {codec.name}; {pages * 100:,} members ({pages} pages of 100)")
+
+    dict_bytes = retained(as_dicts, page, pages)
+    model_bytes = retained(as_models, page, pages)
+    print("\nRetained memory")
+    print(f"  dict    {dict_bytes / 2**20:8.1f} MiB  ({dict_bytes / (pages * 100):6.0f} B/member)")
+    print(f"  typed   {model_bytes / 2**20:8.1f} MiB  ({model_bytes / (pages * 100):6.0f} B/member)")
+
+    number = 500
+    exact = codec.dumps({"items": [known_fields(i) for i in range(100)], "links": {}})
+    for label, payload in (("with custom fields", page), ("model fields only", exact)):
+        print(f"\nPer 100-member page, {label}")
+        for name, build in (("dict", as_dicts), ("from_dict", from_dicts), ("typed", as_models)):
+            seconds = min(timeit.repeat(lambda: build(payload), number=number, repeat=5)) / number
+            print(f"  {name:9s} {seconds * 1e6:8.1f} us  peak {peak(build, payload) / 1024:6.1f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,90 @@
+"""
+Space membership index benchmark
+
+Crawls a mock network of S spaces and N members, each request taking
+LATENCY seconds, into a SpaceMembershipIndex, then times queries answered
+from the bitsets against re-scanning spaces.iter_members:
+
+- spaces of a member
+- members shared by two spaces
+- members of one space missing from another
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_space_index.py [members] [spaces]
+"""
+
+import random
+import sys
+import time
+import timeit
+
+import httpx
+
+from mighty_networks_sdk import MightyNetworksClient, SpaceMembershipIndex
+from mighty_networks_sdk.codec import get_codec
+
+PER_PAGE = 100
+LATENCY = 0.002
+
+
+def make_client(memberships: dict) -> MightyNetworksClient:
+    codec = get_codec()
+    base = "https://api.mn.co/admin/v1/networks/1"
+
+    def handler(request):
+        time.sleep(LATENCY)
+        number = int(request.url.params.get("page", 1))
+        path = request.url.path[len("/admin/v1/networks/1"):]
+        if path == "/spaces":
+            items = [{"id": space} for space in memberships]
+        else:
+            items = [{"id": member} for member in memberships[int(path.split("/")[2])]]
+        chunk = items[(number - 1) * PER_PAGE:number * PER_PAGE]
+        links = {"next": f"{base}{path}?page={number + 1}"} if number * PER_PAGE < len(items) else {}
+        return httpx.Response(200, content=codec.dumps({"items": chunk, "links": links}))
+
+    return MightyNetworksClient(api_token="bench", transport=httpx.MockTransport(handler))
+
+
+def bench(label: str, call, number: int = 200) -> None:
+    per_call = min(timeit.repeat(call, number=number, repeat=3)) / number
+    print(f"  {label:34s} {per_call * 1e6:10.1f} us")
+
+
+def main(members: int = 50_000, spaces: int = 50) -> None:
+    rng = random.Random(7)
+    memberships = {
+        space: sorted(rng.sample(range(members), rng.randint(members // 50, members // 5)))
+        for space in range(1, spaces + 1)
+    }
+    client = make_client(memberships)
+    total = sum(map(len, memberships.values()))
+    print(f"{spaces} spaces, {members:,} members, {total:,} memberships, "
+          f"{LATENCY * 1000:.0f} ms per request\n")
+
+    for workers in (1, 8):
+        index = SpaceMembershipIndex(client, network_id=1, max_workers=workers)
+        started = time.perf_counter()
+        index.build()
+        print(f"  {f'build, {workers} worker(s)':34s} {time.perf_counter() - started:10.2f} s")
+        index.close()
+
+    def rescan_shared():
+        first = {m["id"] for m in client.spaces.iter_members(1, 1)}
+        return [m["id"] for m in client.spaces.iter_members(1, 2) if m["id"] in first]
+
+    started = time.perf_counter()
+    rescan_shared()
+    print(f"  {'shared members by rescanning':34s} {time.perf_counter() - started:10.2f} s\n")
+
+    member = memberships[1][0]
+    bench("spaces_of(member)", lambda: index.spaces_of(member), 2000)
+    bench("shared_members(A, B)", lambda: index.shared_members(1, 2))
+    bench("members_only_in(A, B)", lambda: index.members_only_in(1, 2))
+    bench("count(A)", lambda: index.count(1), 2000)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
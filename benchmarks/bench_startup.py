@@ -0,0 +1,68 @@
+"""
+Startup benchmark
+
+Measures what a serverless handler or CLI invocation pays before its first
+request: ``import mighty_networks_sdk`` plus ``MightyNetworksClient(...)``.
+Each sample runs in a fresh interpreter so nothing is already imported.
+
+For comparison, the "eager" row also touches all 18 resources and creates
+the connection pool, which is what construction used to cost.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+RESOURCES = [
+    "spaces", "members", "posts", "events", "plans", "custom_fields",
+    "comments", "tags", "subscriptions", "purchases", "polls", "invites",
+    "collections", "badges", "assets", "abuse_reports", "me", "network",
+]
+
+_SNIPPET = """
+import time
+started = time.perf_counter()
+import mighty_networks_sdk
+imported = time.perf_counter()
+client = mighty_networks_sdk.MightyNetworksClient(api_token="token")
+constructed = time.perf_counter()
+client.members
+first_resource = time.perf_counter()
+if {eager}:
+    for name in {resources!r}:
+        getattr(client, name)
+    client._session
+eager = time.perf_counter()
+print(imported - started, constructed - imported, first_resource - constructed, eager - started)
+"""
+
+
+def sample(eager: bool):
+    code = _SNIPPET.format(eager=eager, resources=RESOURCES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return [float(value) * 1000 for value in output.split()]
+
+
+def main(runs: int = 20) -> None:
+    lazy = [sample(False) for _ in range(runs)]
+    eager = [sample(True) for _ in range(runs)]
+
+    def median(rows, column):
+        return statistics.median(row[column] for row in rows)
+
+    print(f"Startup over {runs} fresh interpreters (median, ms)")
+    print(f"  import mighty_networks_sdk      {median(lazy, 0):8.2f}")
+    print(f"  MightyNetworksClient(...)       {median(lazy, 1):8.2f}")
+    print(f"  import + construct              {median(lazy, 0) + median(lazy, 1):8.2f}")
+    print(f"  first resource access           {median(lazy, 2):8.2f}")
+    print(f"  eager (all resources + pool)    {median(eager, 3):8.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
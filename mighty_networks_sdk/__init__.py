@@ -20,7 +20,16 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __license__ = "MIT"
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .client import MightyNetworksClient
+from .async_client import AsyncMightyNetworksClient
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter, TokenBucket, FileTokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .codec import JSONCodec, StdlibCodec, OrjsonCodec, MsgspecCodec, get_codec
+from .lazy import LazyItem
 from .exceptions import (
     MightyNetworksException,
     AuthenticationError,
@@ -30,6 +39,7 @@ from .exceptions import (
     APIError
 )
 from .models import (
+    Model,
     Member,
     Space,
     Post,
@@ -39,9 +49,68 @@ from .models import (
     Badge
 )
 
+# Imported on first access, so that importing the package does not load
+# sqlite3 or concurrent.futures for callers that never cache or mirror
+_LAZY_ATTRIBUTES = {
+    'DiskCache': 'cache',
+    'ResponseCache': 'cache',
+    'ETagCache': 'cache',
+    'SingleFlight': 'singleflight',
+    'Columns': 'columnar',
+    'Mirror': 'mirror',
+    'IncrementalSync': 'watermark',
+    'WatermarkStore': 'watermark',
+    'MemberEmailIndex': 'indexes',
+    'SpaceMembershipIndex': 'indexes',
+}
+
+if TYPE_CHECKING:
+    from .cache import DiskCache, ResponseCache, ETagCache
+    from .singleflight import SingleFlight
+    from .columnar import Columns
+    from .mirror import Mirror
+    from .watermark import IncrementalSync, WatermarkStore
+    from .indexes import MemberEmailIndex, SpaceMembershipIndex
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
-    # Main client
+    # Main clients
     'MightyNetworksClient',
+    'AsyncMightyNetworksClient',
+
+    # Request policies
+    'RetryPolicy',
+    'RateLimiter',
+    'TokenBucket',
+    'FileTokenBucket',
+    'AdaptiveConcurrencyLimiter',
+    'ResponseCache',
+    'DiskCache',
+    'ETagCache',
+    'SingleFlight',
+    'JSONCodec',
+    'StdlibCodec',
+    'OrjsonCodec',
+    'MsgspecCodec',
+    'get_codec',
+    'Mirror',
+    'IncrementalSync',
+    'WatermarkStore',
+    'MemberEmailIndex',
+    'SpaceMembershipIndex',
 
     # Exceptions
     'MightyNetworksException',
@@ -52,6 +121,9 @@ __all__ = [
     'APIError',
 
     # Models
+    'Model',
+    'LazyItem',
+    'Columns',
     'Member',
     'Space',
     'Post',
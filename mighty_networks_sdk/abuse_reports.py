@@ -6,6 +6,8 @@ Handles all abuse report-related API operations.
 
 from typing import Dict, Any
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class AbuseReportsResource(BaseResource):
@@ -37,6 +39,26 @@ class AbuseReportsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every abuse report in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one report at a time
+
+        Example:
+            >>> for report in client.abuse_reports.iter_all(network_id=12345):
+            ...     print(report["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/abuse_reports"
+        return self._paginate(endpoint)
+
     def get(
         self,
         network_id: int,
@@ -91,3 +113,7 @@ class AbuseReportsResource(BaseResource):
         endpoint = f"/admin/v1/networks/{network_id}/abuse_reports/{report_id}/resolve"
         data = {"action": action, "notes": notes}
         return self._post(endpoint, json=data)
+
+
+class AsyncAbuseReportsResource(AsyncBaseResource, AbuseReportsResource):
+    """Async variant of :class:`AbuseReportsResource`; every method is awaitable."""
@@ -1,6 +1,7 @@
 import os
 from .base_resource import BaseResource
-from typing import Dict, Any, Optional, Union
+from .async_base_resource import AsyncBaseResource
+from typing import Dict, Any, Optional, Tuple, Union
 
 """
 Assets Resource
@@ -45,7 +46,27 @@ class AssetsResource(BaseResource):
             ...     asset_type="image"
             ... )
         """
-        
+        endpoint, data = self._prepare_upload(
+            network_id, file_path, asset_style, source_url,
+            input_type, original_aspect_ratio, metadata
+        )
+        if not file_path:
+            return self._post(endpoint, data=data)
+
+        with open(file_path, "rb") as asset_file:
+            return self._post(endpoint, data=data, files={"asset_file": asset_file})
+
+    def _prepare_upload(
+        self,
+        network_id: int,
+        file_path: Optional[str],
+        asset_style: str,
+        source_url: Optional[str],
+        input_type: Optional[Union[int, str]],
+        original_aspect_ratio: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate upload arguments and build the endpoint and form data."""
         endpoint = f"/admin/v1/networks/{network_id}/assets"
         if not file_path and not source_url:
             raise ValueError("Provide file_path or source_url")
@@ -61,15 +82,37 @@ class AssetsResource(BaseResource):
             import json as _json
             data["metadata"] = _json.dumps(metadata)
 
-        files = None
-        if file_path:
-            if not os.path.exists(file_path):
-                raise ValueError("file_path does not exist")
-            files = {"asset_file": open(file_path, "rb")}
+        if file_path and not os.path.exists(file_path):
+            raise ValueError("file_path does not exist")
+
+        return endpoint, data
+
+
+class AsyncAssetsResource(AsyncBaseResource, AssetsResource):
+    """Async variant of :class:`AssetsResource`; every method is awaitable."""
+
+    async def upload(
+        self,
+        network_id: int,
+        file_path: Optional[str] = None,
+        asset_style: str = "post",
+        source_url: Optional[str] = None,
+        input_type: Optional[Union[int, str]] = None,
+        original_aspect_ratio: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Upload an asset file.
 
-        try:
-            return self._post(endpoint, data=data, files=files)
-        finally:
-            if files:
-                files["asset_file"].close()
+        The file is kept open until the upload has been awaited.
+        See :meth:`AssetsResource.upload`.
+        """
+        endpoint, data = self._prepare_upload(
+            network_id, file_path, asset_style, source_url,
+            input_type, original_aspect_ratio, metadata
+        )
+        if not file_path:
+            return await self._post(endpoint, data=data)
 
+        with open(file_path, "rb") as asset_file:
+            return await self._post(endpoint, data=data, files={"asset_file": asset_file})
@@ -0,0 +1,135 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type
+from .base_resource import BaseResource
+from .bulk import AsyncBulkRun
+from .cache import cache_key
+from .models import Model
+from .pagination import AsyncPaginator
+
+if TYPE_CHECKING:  # httpx is imported on the first request
+    import httpx
+
+
+class AsyncBaseResource(BaseResource):
+    """
+    Base class for resources of the async client.
+
+    Resource methods are inherited unchanged from their sync counterparts;
+    because ``_request`` is a coroutine here, every method returns an
+    awaitable instead of a result.
+    """
+
+    async def _send(self, method: str, url: str, **kwargs) -> "httpx.Response":  # type: ignore[override]
+        """Send one attempt through the client's rate and concurrency limiters."""
+        rate_limiter = self.client.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+
+        concurrency = self.client.concurrency_limiter
+        if concurrency is None:
+            return await self._session.request(method, url, **kwargs)
+
+        started = await concurrency.acquire_async()
+        status_code = None
+        try:
+            response = await self._session.request(method, url, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            concurrency.release(started, status_code)
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Dict[str, Any]:
+        url, headers = self._prepare_request(endpoint, json=json, files=files)
+        content = None
+        if json is not None and files is None:
+            # Encode once with the client's codec rather than on every attempt
+            content = self.client.json_codec.dumps(json)
+            json = None
+
+        key, cached = self._cache_lookup(method, url, params)
+        if cached is not None:
+            return self._shape(cached, model)
+
+        async def perform():
+            headers.update(self._conditional_headers(method, url, params))
+            result = await self._execute(method, url, headers, params, data, json, files, content, model)
+            self._cache_update(method, url, key, result)
+            self._notify_write(method, url, result)
+            return result
+
+        flights = self.client.single_flight
+        if flights is not None and method == "GET":
+            result = await flights.do_async(cache_key(url, params), perform)
+        else:
+            result = await perform()
+        return self._shape(result, model)
+
+    async def _execute(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[bytes] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Dict[str, Any]:
+        import httpx  # Already loaded by the session
+
+        retry = self.client.retry
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    content=content,
+                    data=data,
+                    files=files,
+                )
+            except httpx.RequestError as e:
+                delay = retry.retry_delay(method, attempt, error=e)
+                if delay is None:
+                    return self._network_error(e)
+                await asyncio.sleep(delay)
+                continue
+
+            delay = retry.retry_delay(method, attempt, response=response)
+            if delay is None:
+                return self._finish_response(method, url, params, response, model)
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> AsyncPaginator:
+        return AsyncPaginator(self, endpoint, params=params, model=model)
+
+    def _bulk(
+        self,
+        rows: Iterable[Any],
+        call: Callable[[Any], Any],
+        concurrency: int,
+        key: Optional[Callable[[Any], Any]] = None,
+        checkpoint: Optional[str] = None,
+    ) -> AsyncBulkRun:  # type: ignore[override]
+        return AsyncBulkRun(rows, call, concurrency=concurrency, key=key, checkpoint=checkpoint)
@@ -0,0 +1,84 @@
+"""
+Mighty Networks SDK Async Client
+
+The asyncio client for interacting with the Mighty Networks API.
+"""
+
+from typing import Any, Dict, List, Optional
+from .client import BaseClient
+
+
+class AsyncMightyNetworksClient(BaseClient):
+    """
+    Asyncio client for the Mighty Networks API.
+
+    Exposes the same resource namespaces and method signatures as
+    :class:`MightyNetworksClient`, backed by a shared ``httpx.AsyncClient``.
+    Every resource method returns an awaitable.
+
+    Example:
+        >>> import asyncio
+        >>> from mighty_networks_sdk import AsyncMightyNetworksClient
+        >>>
+        >>> async def main():
+        ...     async with AsyncMightyNetworksClient(api_token="your_api_token_here") as client:
+        ...         spaces, plans = await asyncio.gather(
+        ...             client.spaces.list(network_id=12345),
+        ...             client.plans.list(network_id=12345),
+        ...         )
+        >>>
+        >>> asyncio.run(main())
+    """
+
+    _session_class = "AsyncClient"
+    _resource_classes = {
+        "spaces": ("spaces", "AsyncSpacesResource"),
+        "members": ("members", "AsyncMembersResource"),
+        "posts": ("posts", "AsyncPostsResource"),
+        "events": ("events", "AsyncEventsResource"),
+        "plans": ("plans", "AsyncPlansResource"),
+        "custom_fields": ("custom_fields", "AsyncCustomFieldsResource"),
+        "comments": ("comments", "AsyncCommentsResource"),
+        "tags": ("tags", "AsyncTagsResource"),
+        "subscriptions": ("subscriptions", "AsyncSubscriptionsResource"),
+        "purchases": ("purchases", "AsyncPurchasesResource"),
+        "polls": ("polls", "AsyncPollsResource"),
+        "invites": ("invites", "AsyncInvitesResource"),
+        "collections": ("collections", "AsyncCollectionsResource"),
+        "badges": ("badges", "AsyncBadgesResource"),
+        "assets": ("assets", "AsyncAssetsResource"),
+        "abuse_reports": ("abuse_reports", "AsyncAbuseReportsResource"),
+        "me": ("me", "AsyncMeResource"),
+        "network": ("network", "AsyncNetworkResource"),
+    }
+
+    async def export(
+        self,
+        source: Any,
+        path: str,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        resume: bool = False,
+        fields: Optional[List[str]] = None,
+        prefetch: int = 0,
+        **params: Any,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`MightyNetworksClient.export`."""
+        from .export import export_async
+
+        paginator = self._export_source(source, prefetch, params)
+        return await export_async(paginator, path, format=format, compression=compression,
+                                  resume=resume, fields=fields)
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool; a later request opens a new one."""
+        with self._session_lock:
+            session, self._session_instance = self._session_instance, None
+        if session is not None:
+            await session.aclose()
+
+    async def __aenter__(self) -> "AsyncMightyNetworksClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -1,5 +1,10 @@
-import httpx
-from typing import Dict, Any, Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple, Type
+from .bulk import BulkRun
+from .cache import cache_key
+from .lazy import is_object, lazy_body
+from .models import Model, decode_models
+from .pagination import Paginator
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -8,115 +13,303 @@ from .exceptions import (
     RateLimitError,
 )
 
+if TYPE_CHECKING:  # httpx is imported on the first request
+    import httpx
+
 
 class BaseResource:
     def __init__(self, client):
         self.client = client
 
-        # HTTP/2 client solves Cloudflare fingerprint blocking
-        self._session = httpx.Client(http2=True, timeout=getattr(client, "timeout", 30))
-
-        # Chrome-like headers to bypass Cloudflare bot detection
-        self._default_headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache",
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            # Admin API uses Token auth (not Bearer)
-            "Authorization": f"Bearer {self.client.api_token}",
-        }
+    @property
+    def _session(self) -> "httpx.Client":
+        # Every resource shares the connection pool owned by the client
+        return self.client._session
 
-    def _request(
+    @property
+    def _default_headers(self) -> Dict[str, str]:
+        return self.client._default_headers
+
+    def _prepare_request(
         self,
-        method: str,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-
-        # Clean base URL
-        base_url = self.client.base_url.rstrip("/")
-        url = f"{base_url}{endpoint}"
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build the absolute URL and headers for a request."""
+        if endpoint.startswith(("http://", "https://")):
+            # Absolute URLs, e.g. pagination "next" links
+            url = endpoint
+        else:
+            # Clean base URL
+            base_url = self.client.base_url.rstrip("/")
+            url = f"{base_url}{endpoint}"
 
         headers = dict(self._default_headers)
 
         if json is not None and files is None:
             headers["Content-Type"] = "application/json"
 
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json,
-                data=data,
-                files=files,
-            )
-
-            # -------------------------
-            # Handle non-success codes
-            # -------------------------
-            if response.status_code == 401:
-                return {"status": False, "data": [], "message": "Unauthorized (401)"}
-
-            if response.status_code == 403:
-                return {"status": False, "data": [], "message": "Forbidden (403): Access denied"}
-
-            if response.status_code == 404:
-                return {"status": False, "data": [], "message": f"Not found: {url}"}
-
-            if response.status_code == 429:
-                return {"status": False, "data": [], "message": "Rate limit exceeded"}
-
-            if response.status_code >= 400:
-                try:
-                    err = response.json()
-                except Exception:
-                    err = response.text
-                return {"status": False, "data": [], "message": f"Error {response.status_code}: {err}"}
-
-            # -------------------------
-            # Parse successful response
-            # -------------------------
+        return url, headers
+
+    def _handle_response(
+        self, response: "httpx.Response", url: str, model: Optional[Type[Model]] = None
+    ) -> Dict[str, Any]:
+        """Normalize an HTTP response into the SDK result dict."""
+        # -------------------------
+        # Handle non-success codes
+        # -------------------------
+        if response.status_code == 401:
+            return {"status": False, "data": [], "message": "Unauthorized (401)"}
+
+        if response.status_code == 403:
+            return {"status": False, "data": [], "message": "Forbidden (403): Access denied"}
+
+        if response.status_code == 404:
+            return {"status": False, "data": [], "message": f"Not found: {url}"}
+
+        if response.status_code == 429:
+            return {"status": False, "data": [], "message": "Rate limit exceeded"}
+
+        if response.status_code >= 400:
+            try:
+                err = self.client.json_codec.loads(response.content)
+            except Exception:
+                err = response.text
+            return {"status": False, "data": [], "message": f"Error {response.status_code}: {err}"}
+
+        # -------------------------
+        # Parse successful response
+        # -------------------------
+        content = response.content
+        mode = self.client.response_mode
+        if mode == "lazy" and is_object(content):
             try:
-                body = response.json()
+                items, links = lazy_body(content)
             except Exception:
-                body = {}
+                pass
+            else:
+                return {"status": True, "data": items, "message": "success", "links": links}
+        if mode == "typed" and model is not None:
+            decoded = decode_models(content, model)
+            if decoded is not None:
+                items, links = decoded
+                return {"status": True, "data": items, "message": "success", "links": links}
 
-            # Normalize items
-            items = []
+        try:
+            body = self.client.json_codec.loads(content)
+        except Exception:
+            body = {}
 
-            if isinstance(body, dict):
-                if "items" in body:
-                    items = body["items"]
+        # Normalize items
+        items = []
+        links = {}
+
+        if isinstance(body, dict):
+            links = body.get("links") or {}
+            if "items" in body:
+                items = body["items"]
+            else:
+                # fallback: treat whole body as list or single item
+                if isinstance(body, list):
+                    items = body
                 else:
-                    # fallback: treat whole body as list or single item
-                    if isinstance(body, list):
-                        items = body
-                    else:
-                        items = body
+                    items = body
+
+        return {"status": True, "data": items, "message": "success", "links": links}
+
+    def _conditional_headers(
+        self, method: str, url: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a known GET."""
+        etags = self.client.etag_cache
+        if etags is None or method != "GET":
+            return {}
+        return etags.conditional_headers(cache_key(url, params))
+
+    def _finish_response(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        response: "httpx.Response",
+        model: Optional[Type[Model]] = None,
+    ) -> Dict[str, Any]:
+        """Normalize the final response, serving 304s from the ETag cache."""
+        etags = self.client.etag_cache
+        if etags is None or method != "GET":
+            return self._handle_response(response, url, model)
+
+        key = cache_key(url, params)
+        if response.status_code == 304:
+            stored = etags.revalidated(key)
+            if stored is None:
+                # Validators were evicted while the request was in flight
+                return {"status": False, "data": [], "message": "Not modified (304): no stored body"}
+            stored["not_modified"] = True
+            return stored
+
+        result = self._handle_response(response, url, model)
+        if result["status"]:
+            etags.store(key, response.headers, result)
+            result["not_modified"] = False
+        return result
+
+    def _shape(self, result: Dict[str, Any], model: Optional[Type[Model]]) -> Dict[str, Any]:
+        """In typed mode, convert the items of a successful result into ``model`` instances."""
+        if model is None or not result["status"] or self.client.response_mode != "typed":
+            return result
+        data = result["data"]
+        if isinstance(data, list):
+            result["data"] = [
+                model.from_dict(item) if isinstance(item, dict) else item for item in data
+            ]
+        elif isinstance(data, dict) and data:
+            result["data"] = model.from_dict(data)
+        return result
+
+    def _network_error(self, error: Exception) -> Dict[str, Any]:
+        return {
+            "status": False,
+            "data": [],
+            "message": f"Network error: {str(error)}"
+        }
+
+    def _send(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """Send one attempt through the client's rate and concurrency limiters."""
+        rate_limiter = self.client.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        concurrency = self.client.concurrency_limiter
+        if concurrency is None:
+            return self._session.request(method, url, **kwargs)
 
-            return {"status": True, "data": items, "message": "success"}
+        started = concurrency.acquire()
+        status_code = None
+        try:
+            response = self._session.request(method, url, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            concurrency.release(started, status_code)
+
+    def _cache_lookup(
+        self, method: str, url: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return the cache key and cached result (if any) of a GET request."""
+        cache = self.client.cache
+        if cache is None or method != "GET":
+            return None, None
+        key = cache_key(url, params)
+        return key, cache.get(key)
+
+    def _cache_update(
+        self, method: str, url: str, key: Optional[str], result: Dict[str, Any]
+    ) -> None:
+        """Store a successful GET result, or invalidate after a successful write."""
+        cache = self.client.cache
+        if cache is None or not result["status"]:
+            return
+        if key is not None:
+            cache.set(key, result, url)
+        elif method != "GET":
+            cache.invalidate(url)
+
+    def _notify_write(self, method: str, url: str, result: Dict[str, Any]) -> None:
+        """Pass a successful write to the client's write listeners."""
+        if method == "GET" or not result["status"]:
+            return
+        for listener in list(self.client.write_listeners):
+            listener(method, url, result)
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Dict[str, Any]:
+        url, headers = self._prepare_request(endpoint, json=json, files=files)
+        content = None
+        if json is not None and files is None:
+            # Encode once with the client's codec rather than on every attempt
+            content = self.client.json_codec.dumps(json)
+            json = None
+
+        key, cached = self._cache_lookup(method, url, params)
+        if cached is not None:
+            return self._shape(cached, model)
+
+        def perform():
+            headers.update(self._conditional_headers(method, url, params))
+            result = self._execute(method, url, headers, params, data, json, files, content, model)
+            self._cache_update(method, url, key, result)
+            self._notify_write(method, url, result)
+            return result
 
-        except httpx.RequestError as e:
-            return {
-                "status": False,
-                "data": [],
-                "message": f"Network error: {str(e)}"
-            }
+        flights = self.client.single_flight
+        if flights is not None and method == "GET":
+            result = flights.do(cache_key(url, params), perform)
+        else:
+            result = perform()
+        return self._shape(result, model)
 
+    def _execute(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[bytes] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying per the client's policy, and normalize the result."""
+        import httpx  # Already loaded by the session
+
+        retry = self.client.retry
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = self._send(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    content=content,
+                    data=data,
+                    files=files,
+                )
+            except httpx.RequestError as e:
+                delay = retry.retry_delay(method, attempt, error=e)
+                if delay is None:
+                    return self._network_error(e)
+                time.sleep(delay)
+                continue
+
+            delay = retry.retry_delay(method, attempt, response=response)
+            if delay is None:
+                return self._finish_response(method, url, params, response, model)
+            response.close()
+            time.sleep(delay)
 
     # Public request helpers
-    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None):
-        return self._request("GET", endpoint, params=params)
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+    ):
+        return self._request("GET", endpoint, params=params, model=model)
 
     def _post(
         self,
@@ -135,3 +328,21 @@ class BaseResource:
 
     def _delete(self, endpoint: str):
         return self._request("DELETE", endpoint)
+
+    def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+    ) -> Paginator:
+        return Paginator(self, endpoint, params=params, model=model)
+
+    def _bulk(
+        self,
+        rows: Iterable[Any],
+        call: Callable[[Any], Any],
+        concurrency: int,
+        key: Optional[Callable[[Any], Any]] = None,
+        checkpoint: Optional[str] = None,
+    ) -> BulkRun:
+        return BulkRun(rows, call, concurrency=concurrency, key=key, checkpoint=checkpoint)
@@ -0,0 +1,274 @@
+"""
+Mighty Networks SDK Bulk Operations
+
+Lazy runners that apply one API call per input row with bounded
+concurrency over the client's shared connection pool, yielding per-row
+results in input order.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Rows submitted ahead of the oldest unfinished one, per unit of concurrency,
+# so one slow request does not stall the others
+WINDOW = 4
+
+
+def _failure(error: Exception) -> Dict[str, Any]:
+    return {"status": False, "data": [], "message": f"{type(error).__name__}: {error}"}
+
+
+class BulkCheckpoint:
+    """
+    Append-only file of the keys of rows completed successfully.
+
+    One key per line, flushed as each row succeeds, so an interrupted run
+    resumed with the same file skips the rows already done. A partly
+    written last line is ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        self.done: Set[str] = set()
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                self.done = {line[:-1] for line in file if line.endswith("\n")}
+        self._file = None
+
+    def __contains__(self, key: Any) -> bool:
+        return str(key) in self.done
+
+    def add(self, key: Any) -> None:
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(f"{key}\n")
+            self._file.flush()
+            self.done.add(str(key))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class BulkStats:
+    """Counters and throughput of one bulk run."""
+
+    def __init__(self):
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def record(self, result: Dict[str, Any]) -> None:
+        self.total += 1
+        if result["status"]:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.elapsed = time.monotonic() - self.started
+
+    @property
+    def per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "seconds": round(self.elapsed, 3),
+            "per_second": round(self.per_second, 1),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkStats(total={self.total}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, per_second={self.per_second:.1f})"
+        )
+
+
+class BulkRun:
+    """
+    Apply ``call`` to every row of ``rows``, ``concurrency`` calls at a time.
+
+    Nothing is sent until the run is iterated (or :meth:`run` is called).
+    Rows are read lazily, so a generator over a huge CSV streams through.
+    Iterating yields one result per row, in input order: the call's result
+    dict plus ``index`` (position in the input) and ``row``. A call raising
+    an exception, e.g. on a malformed row, yields a failed result instead of
+    stopping the run. Every request still goes through the client's retry
+    policy and rate and concurrency limiters.
+
+    With a ``key`` function, rows whose key was already seen are skipped.
+    With a ``checkpoint`` file, the key of every successful row is recorded
+    and rows recorded by an earlier run are skipped; skipped rows yield no
+    result and are counted in ``stats.skipped``.
+
+    Throughput of the run so far is available on :attr:`stats`.
+
+    Example:
+        >>> run = client.members.create_many(network_id=12345, rows=rows)
+        >>> for result in run:
+        ...     if not result["status"]:
+        ...         print(result["index"], result["message"])
+        >>> run.stats
+        BulkStats(total=20000, succeeded=19987, failed=13, per_second=180.2)
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Any],
+        call: Callable[[Any], Any],
+        concurrency: int = 8,
+        key: Optional[Callable[[Any], Any]] = None,
+        checkpoint: Optional[str] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if checkpoint is not None and key is None:
+            raise ValueError("a checkpoint needs a key function")
+        self.rows = rows
+        self.call = call
+        self.concurrency = concurrency
+        self.key = key
+        self.checkpoint = checkpoint
+        self.stats = BulkStats()
+        self._seen: Set[Any] = set()
+        self._done: Optional[BulkCheckpoint] = None
+
+    def _start(self) -> None:
+        self.stats = BulkStats()
+        self._seen = set()
+        self._done = BulkCheckpoint(self.checkpoint) if self.checkpoint else None
+
+    def _stop(self) -> None:
+        if self._done is not None:
+            self._done.close()
+
+    def _skip(self, row: Any) -> bool:
+        """Return whether ``row`` is a duplicate or already checkpointed."""
+        if self.key is None:
+            return False
+        key = self.key(row)
+        if key in self._seen or (self._done is not None and key in self._done):
+            self.stats.skipped += 1
+            return True
+        self._seen.add(key)
+        return False
+
+    def _record(self, row: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+        if self._done is not None and result["status"]:
+            self._done.add(self.key(row))  # type: ignore[misc]
+        return result
+
+    def _finish(self, index: int, row: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+        result = {"index": index, "row": row, **result}
+        self.stats.record(result)
+        return result
+
+    def _call(self, row: Any) -> Dict[str, Any]:
+        try:
+            return self._record(row, self.call(row))
+        except Exception as e:
+            return _failure(e)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._start()
+        pending: Deque[Tuple[int, Any, Any]] = deque()
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            for index, row in enumerate(self.rows):
+                if self._skip(row):
+                    continue
+                pending.append((index, row, pool.submit(self._call, row)))
+                if len(pending) >= self.concurrency * WINDOW:
+                    index, row, future = pending.popleft()
+                    yield self._finish(index, row, future.result())
+            while pending:
+                index, row, future = pending.popleft()
+                yield self._finish(index, row, future.result())
+        finally:
+            # Abandoned early: drop the rows not started yet
+            for _, _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+            self._stop()
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Run to the end and return every result, in input order."""
+        return list(self)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the counts and throughput of the run so far."""
+        return self.stats.as_dict()
+
+
+class AsyncBulkRun(BulkRun):
+    """
+    Async variant of :class:`BulkRun` for the async client.
+
+    ``call`` returns a coroutine; up to ``concurrency`` of them run at once
+    on the event loop. ``rows`` may be an iterable or an async iterable.
+
+    Example:
+        >>> async for result in client.members.create_many(12345, rows):
+        ...     print(result["index"], result["status"])
+    """
+
+    async def _call(self, row: Any) -> Dict[str, Any]:  # type: ignore[override]
+        async with self._semaphore:
+            try:
+                return self._record(row, await self.call(row))
+            except Exception as e:
+                return _failure(e)
+
+    async def _rows(self) -> AsyncIterator[Any]:
+        if hasattr(self.rows, "__aiter__"):
+            async for row in self.rows:  # type: ignore[union-attr]
+                yield row
+        else:
+            for row in self.rows:
+                yield row
+
+    def __iter__(self):
+        raise TypeError("AsyncBulkRun is iterated with 'async for'")
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        self._start()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        pending: Deque[Tuple[int, Any, "asyncio.Future[Dict[str, Any]]"]] = deque()
+        try:
+            index = -1
+            async for row in self._rows():
+                # Position in the input, counting skipped rows as the sync run does
+                index += 1
+                if self._skip(row):
+                    continue
+                pending.append((index, row, asyncio.ensure_future(self._call(row))))
+                if len(pending) >= self.concurrency * WINDOW:
+                    done_index, done_row, task = pending.popleft()
+                    yield self._finish(done_index, done_row, await task)
+            while pending:
+                done_index, done_row, task = pending.popleft()
+                yield self._finish(done_index, done_row, await task)
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+            self._stop()
+
+    async def run(self) -> List[Dict[str, Any]]:  # type: ignore[override]
+        """Run to the end and return every result, in input order."""
+        return [result async for result in self]
+
@@ -0,0 +1,463 @@
+"""
+Mighty Networks SDK Response Cache
+
+An optional in-memory cache for GET responses with per-resource TTLs, a
+bounded LRU size and write-through invalidation, an optional SQLite tier
+that persists entries across processes, plus validator storage for
+conditional GET requests.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .codec import JSONCodec, get_codec
+from .lazy import LazyItem
+from .models import Model
+
+if TYPE_CHECKING:  # sqlite3 is imported by the first DiskCache connection
+    import sqlite3
+
+# Path of an admin endpoint: /admin/v1/networks/{network_id}/{resource}/...
+_RESOURCE_INDEX = 5
+
+
+_codec: Optional[JSONCodec] = None
+
+
+def _snapshot_codec() -> JSONCodec:
+    # Fastest installed codec, imported on the first snapshot
+    global _codec
+    if _codec is None:
+        _codec = get_codec()
+    return _codec
+
+
+def freeze(result: Dict[str, Any]) -> bytes:
+    """
+    Snapshot a result so later changes by the caller cannot leak into a cache.
+
+    Snapshots are JSON, never pickle, so a cache file written by someone
+    else cannot run code when read. Lazy items are stored decoded and
+    rebuilt as :class:`~mighty_networks_sdk.lazy.LazyItem` by :func:`thaw`.
+    Typed models are stored as dicts; the resource builds them again.
+    """
+    data = result.get("data")
+    objects = (LazyItem, Model)
+    lazy = False
+    if isinstance(data, objects):
+        result = {**result, "data": data.to_dict()}
+        lazy = isinstance(data, LazyItem)
+    elif isinstance(data, list) and any(isinstance(item, objects) for item in data):
+        result = {**result, "data": [
+            item.to_dict() if isinstance(item, objects) else item for item in data
+        ]}
+        lazy = any(isinstance(item, LazyItem) for item in data)
+    return _snapshot_codec().dumps({"lazy": lazy, "result": result})
+
+
+def thaw(snapshot: bytes) -> Dict[str, Any]:
+    """Return a fresh copy of a snapshotted result."""
+    codec = _snapshot_codec()
+    frozen = codec.loads(snapshot)
+    result = frozen["result"]
+    if frozen["lazy"]:
+        data = result["data"]
+        if isinstance(data, dict):
+            result["data"] = LazyItem.from_json(codec.dumps(data))
+        else:
+            result["data"] = [
+                LazyItem.from_json(codec.dumps(item)) if isinstance(item, dict) else item
+                for item in data
+            ]
+    return result
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Return the cache key of a GET request."""
+    if not params:
+        return url
+    separator = "&" if urlsplit(url).query else "?"
+    return url + separator + urlencode(sorted(params.items()), doseq=True)
+
+
+def resource_scope(url: str) -> Tuple[str, str]:
+    """
+    Return the resource name and invalidation scope of a URL.
+
+    The scope is the resource collection inside its network, e.g.
+    ``/admin/v1/networks/1/spaces`` for both ``spaces.list`` and
+    ``spaces.get``. A write anywhere below a scope evicts the whole scope.
+    """
+    parts = urlsplit(url).path.rstrip("/").split("/")
+    if len(parts) > _RESOURCE_INDEX:
+        return parts[_RESOURCE_INDEX], "/".join(parts[:_RESOURCE_INDEX + 1])
+    return "network", "/".join(parts)
+
+
+class DiskCache:
+    """
+    SQLite-backed cache tier shared by processes and kept across restarts.
+
+    Plugged into :class:`ResponseCache` through its ``disk`` argument: misses
+    in memory fall through to disk, and every entry cached in memory is also
+    written to disk with the same expiry. The database runs in WAL mode, so
+    any number of processes can read while one writes; each thread uses its
+    own connection. Expired rows are pruned every ``prune_interval`` writes.
+
+    Entries are keyed by URL only; do not share a directory between API
+    tokens that may see different data.
+
+    Attributes:
+        directory: Directory holding ``responses.sqlite3`` (created if missing)
+
+    Example:
+        >>> from mighty_networks_sdk import DiskCache, MightyNetworksClient, ResponseCache
+        >>>
+        >>> cache = ResponseCache(
+        ...     ttls={"spaces": 3600, "plans": 3600, "members": 0},
+        ...     disk=DiskCache("~/.cache/mighty_networks"),
+        ... )
+        >>> client = MightyNetworksClient(api_token="your_api_token_here", cache=cache)
+    """
+
+    FILENAME = "responses.sqlite3"
+
+    def __init__(self, directory: str, timeout: float = 30.0, prune_interval: int = 256):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, self.FILENAME)
+        self.timeout = timeout
+        self.prune_interval = prune_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, scope TEXT NOT NULL, "
+                "expires REAL NOT NULL, result BLOB NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)"
+            )
+
+    def _connection(self) -> "sqlite3.Connection":
+        # sqlite3 connections must not cross threads or a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            import sqlite3
+
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def load(self, key: str) -> Optional[Tuple[float, str, bytes]]:
+        """Return ``(expires, scope, snapshot)`` for a live entry, or None."""
+        row = self._connection().execute(
+            "SELECT expires, scope, result FROM responses WHERE key = ? AND expires > ?",
+            (key, time.time()),
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0], row[1], bytes(row[2])
+
+    def store(self, key: str, scope: str, expires: float, snapshot: bytes) -> None:
+        """Write an entry expiring at the wall-clock time ``expires``."""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, scope, expires, result) "
+                "VALUES (?, ?, ?, ?)",
+                (key, scope, expires, snapshot),
+            )
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_interval == 0
+        if prune:
+            self.prune()
+
+    def invalidate(self, scope: str) -> int:
+        """Delete every entry in ``scope``; return the count."""
+        connection = self._connection()
+        with connection:
+            return connection.execute(
+                "DELETE FROM responses WHERE scope = ?", (scope,)
+            ).rowcount
+
+    def prune(self) -> int:
+        """Delete expired entries; return the count."""
+        connection = self._connection()
+        with connection:
+            return connection.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time.time(),)
+            ).rowcount
+
+    def clear(self) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM responses WHERE expires > ?", (time.time(),)
+        ).fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"DiskCache(directory={self.directory!r})"
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL/LRU cache for successful GET results.
+
+    Entries expire after the TTL of their resource (``ttls``, falling back to
+    ``default_ttl``); a TTL of 0 disables caching for that resource. When
+    more than ``max_size`` entries are held, the least recently used one is
+    evicted. Writes (POST/PUT/PATCH/DELETE) made through the client evict
+    every cached entry of the same resource in the same network, e.g.
+    ``spaces.update`` invalidates ``spaces.get`` and ``spaces.list``.
+
+    Results are stored as snapshots and each hit returns a fresh copy, so
+    callers may modify what they receive. With a :class:`DiskCache` as
+    ``disk``, entries are also persisted with the same TTL and memory misses
+    are served from disk, so short-lived processes start warm.
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, ResponseCache
+        >>>
+        >>> cache = ResponseCache(max_size=2048, default_ttl=60, ttls={"network": 600})
+        >>> client = MightyNetworksClient(api_token="your_api_token_here", cache=cache)
+        >>> client.network.show(network_id=12345)  # miss
+        >>> client.network.show(network_id=12345)  # hit
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        disk: Optional[DiskCache] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.disk = disk
+
+        self._entries: "OrderedDict[str, Tuple[float, str, bytes]]" = OrderedDict()
+        self._scopes: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, resource: str) -> float:
+        return self.ttls.get(resource, self.default_ttl)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return thaw(entry[2])
+            if self.disk is None:
+                self.misses += 1
+                return None
+
+        stored = self.disk.load(key)
+        result = None
+        if stored is not None:
+            try:
+                result = thaw(stored[2])
+            except Exception:
+                pass  # Unreadable, e.g. written by an older version: a miss
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        expires, scope, snapshot = stored
+        # Promote into memory for the rest of the entry's lifetime
+        self._insert(key, scope, time.monotonic() + expires - time.time(), snapshot)
+        return result
+
+    def set(self, key: str, result: Dict[str, Any], url: str) -> None:
+        """Cache ``result`` under ``key`` for the TTL of its resource."""
+        resource, scope = resource_scope(url)
+        ttl = self.ttl_for(resource)
+        if ttl <= 0:
+            return
+        snapshot = freeze(result)
+        self._insert(key, scope, time.monotonic() + ttl, snapshot)
+        if self.disk is not None:
+            self.disk.store(key, scope, time.time() + ttl, snapshot)
+
+    def _insert(self, key: str, scope: str, expires: float, snapshot: bytes) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, scope, snapshot)
+            self._scopes.setdefault(scope, set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, url: str) -> int:
+        """Evict every entry in the resource scope of ``url``; return the count."""
+        _, scope = resource_scope(url)
+        with self._lock:
+            keys = self._scopes.get(scope, ())
+            count = len(keys)
+            for key in list(keys):
+                self._remove(key)
+        if self.disk is not None:
+            # Other processes may have cached entries this one never saw
+            count = max(count, self.disk.invalidate(scope))
+        with self._lock:
+            self.invalidations += count
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def _remove(self, key: str) -> None:
+        _, scope, _ = self._entries.pop(key)
+        keys = self._scopes.get(scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[scope]
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss, eviction and invalidation counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(max_size={self.max_size}, size={len(self._entries)})"
+
+
+class ETagCache:
+    """
+    Validators and bodies for conditional GET requests.
+
+    After a successful GET, the response's ``ETag`` and ``Last-Modified``
+    headers are kept with a snapshot of the result. Later GETs of the same
+    URL send ``If-None-Match`` / ``If-Modified-Since``; when the API answers
+    304 Not Modified, the stored result is returned with
+    ``result["not_modified"] = True`` instead of downloading and decoding the
+    body again. At most ``max_size`` URLs are tracked (least recently used
+    are dropped).
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, ETagCache
+        >>>
+        >>> etags = ETagCache(max_size=4096)
+        >>> client = MightyNetworksClient(api_token="your_api_token_here", etag_cache=etags)
+        >>> result = client.posts.list(network_id=12345, space_id=67890)
+        >>> result = client.posts.list(network_id=12345, space_id=67890)
+        >>> result["not_modified"]
+        True
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.modified = 0
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Return the validator headers to send for ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def store(self, key: str, response_headers: Any, result: Dict[str, Any]) -> None:
+        """Remember the validators of a fresh response, if it has any."""
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        with self._lock:
+            self.modified += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (etag, last_modified, freeze(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the stored result after a 304, or None if unknown."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.not_modified += 1
+        return thaw(entry[2])
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many GETs were answered 304 versus with a new body."""
+        with self._lock:
+            return {
+                "not_modified": self.not_modified,
+                "modified": self.modified,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ETagCache(max_size={self.max_size}, size={len(self._entries)})"
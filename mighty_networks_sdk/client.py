@@ -4,28 +4,224 @@ Mighty Networks SDK Client
 The main client class for interacting with the Mighty Networks API.
 """
 
-from typing import Optional
-from .spaces import SpacesResource
-from .members import MembersResource
-from .posts import PostsResource
-from .events import EventsResource
-from .plans import PlansResource
-from .custom_fields import CustomFieldsResource
-from .comments import CommentsResource
-from .tags import TagsResource
-from .subscriptions import SubscriptionsResource
-from .purchases import PurchasesResource
-from .polls import PollsResource
-from .invites import InvitesResource
-from .collections import CollectionsResource
-from .badges import BadgesResource
-from .assets import AssetsResource
-from .abuse_reports import AbuseReportsResource
-from .me import MeResource
-from .network import NetworkResource
-
-
-class MightyNetworksClient:
+import importlib
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .codec import CODECS, JSONCodec, get_codec
+from .lazy import require_msgspec
+
+if TYPE_CHECKING:  # The caller imports these when it configures them
+    from .cache import ETagCache, ResponseCache
+    from .singleflight import SingleFlight
+
+# Shapes of the items returned by list and get methods
+RESPONSE_MODES = ("dict", "typed", "lazy")
+
+
+class BaseClient:
+    """
+    Configuration and resource wiring shared by the sync and async clients.
+
+    Subclasses choose the httpx session class and the resource classes
+    bound to each attribute. Both are named rather than imported: a resource
+    module is imported and its resource created on first attribute access,
+    and httpx and the connection pool are only loaded on the first request,
+    which keeps ``import`` plus construction cheap for short-lived processes.
+    """
+
+    # Name of the httpx session class
+    _session_class: str = "Client"
+    # Attribute name -> (module, class) of each resource
+    _resource_classes: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: str = "https://api.mn.co",
+        timeout: int = 30,
+        http2: bool = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        transport: Optional[Any] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        cache: Optional["ResponseCache"] = None,
+        etag_cache: Optional["ETagCache"] = None,
+        single_flight: Optional["SingleFlight"] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        response_mode: str = "dict",
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_token: Your Mighty Networks API token (required)
+            base_url: The API base URL (default: https://api.mn.co)
+            timeout: Request timeout in seconds (default: 30)
+            http2: Negotiate HTTP/2 on the shared pool (default: True)
+            max_connections: Maximum number of open connections (default: 100)
+            max_keepalive_connections: Maximum idle connections kept alive (default: 20)
+            keepalive_expiry: Seconds an idle connection is kept alive (default: 5.0)
+            transport: Custom httpx transport, e.g. for proxies or testing (optional).
+                Must match the session class (sync or async transport).
+            retry: Retry policy for failed requests (default: RetryPolicy(),
+                which retries idempotent methods up to 3 attempts)
+            rate_limiter: Client-side rate limiter applied to every attempt,
+                e.g. TokenBucket or FileTokenBucket (optional)
+            concurrency_limiter: Adaptive limit on in-flight requests (optional)
+            cache: Response cache for GET requests, invalidated by writes (optional)
+            etag_cache: Validator store enabling conditional GET requests (optional)
+            single_flight: Coalescer sharing one call between concurrent
+                identical GET requests (optional)
+            json_codec: JSON codec for request and response bodies: a
+                JSONCodec, "orjson", "msgspec" or "json" (default: the
+                fastest installed). Resolved on first use, so the library
+                is not imported until a body is encoded or decoded
+            response_mode: "dict" returns items as dicts; "typed" returns
+                list and get results as slotted models such as Member;
+                "lazy" returns LazyItem mappings that decode fields on
+                access, and requires msgspec (default: "dict")
+
+        Raises:
+            ValueError: If api_token is not provided, or response_mode or
+                json_codec is unknown
+            ImportError: If response_mode is "lazy" and msgspec is not installed
+
+        Example:
+            >>> client = MightyNetworksClient(
+            ...     api_token="your_api_token_here",
+            ...     timeout=60
+            ... )
+        """
+        if not api_token:
+            raise ValueError("API token is required")
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
+        if isinstance(json_codec, str) and json_codec != "auto" and json_codec not in CODECS:
+            raise ValueError(f"Unknown JSON codec {json_codec!r}; expected one of {sorted(CODECS)}")
+        if response_mode == "lazy":
+            require_msgspec()
+
+        self.api_token = api_token
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.http2 = http2
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.cache = cache
+        self.etag_cache = etag_cache
+        self.single_flight = single_flight
+        self._json_codec_spec = json_codec
+        self._json_codec: Optional[JSONCodec] = None
+        self._json_codec_lock = threading.Lock()
+        self.response_mode = response_mode
+        # Called as listener(method, url, result) after each successful write,
+        # e.g. by indexes that keep themselves in step with the API
+        self.write_listeners: List[Callable[[str, str, Dict[str, Any]], None]] = []
+
+        self._pool_limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._transport = transport
+        self._session_instance: Optional[Any] = None
+        self._session_lock = threading.Lock()
+        self._default_headers = self._build_default_headers()
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The JSON codec, resolved (and its library imported) on first use."""
+        codec = self._json_codec
+        if codec is None:
+            with self._json_codec_lock:
+                codec = self._json_codec
+                if codec is None:
+                    codec = self._json_codec = get_codec(self._json_codec_spec)
+        return codec
+
+    @property
+    def _session(self) -> Any:
+        """The shared httpx session, created on first use."""
+        session = self._session_instance
+        if session is None:
+            with self._session_lock:
+                session = self._session_instance
+                if session is None:
+                    session = self._session_instance = self._create_session()
+        return session
+
+    def _create_session(self) -> Any:
+        import httpx
+
+        # One pool shared by every resource: a single TLS handshake and a
+        # single multiplexed HTTP/2 connection instead of one per resource.
+        # HTTP/2 also solves Cloudflare fingerprint blocking.
+        return getattr(httpx, self._session_class)(
+            http2=self.http2,
+            timeout=self.timeout,
+            limits=httpx.Limits(**self._pool_limits),
+            transport=self._transport,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes: create the resource once
+        try:
+            module_name, class_name = type(self)._resource_classes[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        module = importlib.import_module(f".{module_name}", __package__)
+        resource = getattr(module, class_name)(self)
+        setattr(self, name, resource)
+        return resource
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self._resource_classes))
+
+    def _export_source(self, source: Any, prefetch: int, params: Dict[str, Any]) -> Any:
+        """Resolve ``"members"`` or ``"plans.iter_subscribers"`` to a paginator."""
+        if isinstance(source, str):
+            name, _, method = source.partition(".")
+            if name not in self._resource_classes:
+                raise ValueError(f"Unknown resource {name!r}")
+            iterator = getattr(getattr(self, name), method or "iter_all", None)
+            if iterator is None or not (method or "iter_all").startswith("iter_"):
+                raise ValueError(f"{source!r} is not a paginated iterator")
+            source = iterator(**params)
+        elif params:
+            raise TypeError("Endpoint arguments are only accepted with a resource name")
+        return source.prefetch(prefetch) if prefetch else source
+
+    def _build_default_headers(self) -> Dict[str, str]:
+        """Build the headers sent with every request."""
+        return {
+            # Chrome-like headers to bypass Cloudflare bot detection
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Cache-Control": "no-cache",
+            "Pragma": "no-cache",
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Authorization": f"Bearer {self.api_token}",
+        }
+
+    def __repr__(self) -> str:
+        """Return string representation of the client."""
+        return f"{type(self).__name__}(base_url='{self.base_url}')"
+
+
+class MightyNetworksClient(BaseClient):
     """
     Main client for interacting with the Mighty Networks API.
 
@@ -36,6 +232,7 @@ class MightyNetworksClient:
         api_token: Your Mighty Networks API token
         base_url: The API base URL (default: https://api.mn.co)
         timeout: Request timeout in seconds (default: 30)
+        http2: Whether the shared connection pool negotiates HTTP/2 (default: True)
         spaces: Access to spaces resource
         members: Access to members resource
         posts: Access to posts resource
@@ -65,58 +262,92 @@ class MightyNetworksClient:
         >>> spaces = client.spaces.list(network_id=12345)
         >>> members = client.members.list(network_id=12345, space_id=67890)
         >>> plans = client.plans.list(network_id=12345)
+        >>>
+        >>> # Release pooled connections when done
+        >>> client.close()
+
+        All resources share a single connection pool, so one multiplexed
+        HTTP/2 connection serves ``client.members``, ``client.spaces`` and
+        the rest. The client can also be used as a context manager:
+
+        >>> with MightyNetworksClient(api_token="your_api_token_here") as client:
+        ...     client.network.show(network_id=12345)
     """
 
-    def __init__(
+    _session_class = "Client"
+    _resource_classes = {
+        "spaces": ("spaces", "SpacesResource"),
+        "members": ("members", "MembersResource"),
+        "posts": ("posts", "PostsResource"),
+        "events": ("events", "EventsResource"),
+        "plans": ("plans", "PlansResource"),
+        "custom_fields": ("custom_fields", "CustomFieldsResource"),
+        "comments": ("comments", "CommentsResource"),
+        "tags": ("tags", "TagsResource"),
+        "subscriptions": ("subscriptions", "SubscriptionsResource"),
+        "purchases": ("purchases", "PurchasesResource"),
+        "polls": ("polls", "PollsResource"),
+        "invites": ("invites", "InvitesResource"),
+        "collections": ("collections", "CollectionsResource"),
+        "badges": ("badges", "BadgesResource"),
+        "assets": ("assets", "AssetsResource"),
+        "abuse_reports": ("abuse_reports", "AbuseReportsResource"),
+        "me": ("me", "MeResource"),
+        "network": ("network", "NetworkResource"),
+    }
+
+    def export(
         self,
-        api_token: str,
-        base_url: str = "https://api.mn.co",
-        timeout: int = 30
-    ):
+        source: Any,
+        path: str,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        resume: bool = False,
+        fields: Optional[List[str]] = None,
+        prefetch: int = 0,
+        **params: Any,
+    ) -> Dict[str, Any]:
         """
-        Initialize the Mighty Networks client.
+        Stream every item of a paginated endpoint to an NDJSON, CSV or Parquet file.
+
+        Only one page is held in memory at a time (one Parquet part for
+        Parquet). Progress is checkpointed after each page; with
+        ``resume=True`` an interrupted export continues where it stopped.
 
         Args:
-            api_token: Your Mighty Networks API token (required)
-            base_url: The API base URL (default: https://api.mn.co)
-            timeout: Request timeout in seconds (default: 30)
+            source: Resource name (``"members"``), ``"<resource>.<iterator>"``
+                (``"plans.iter_subscribers"``) or a paginator
+            path: Output file; Parquet writes a directory of part files
+            format: "ndjson", "csv" or "parquet" (default: from the file name)
+            compression: "gzip" or "zstd" (default: from a .gz / .zst suffix)
+            resume: Continue an interrupted export of the same source and path
+            fields: CSV columns (default: keys of the first page)
+            prefetch: Pages to download ahead (see :meth:`Paginator.prefetch`)
+            **params: Arguments of the iterator, e.g. ``network_id``
 
-        Raises:
-            ValueError: If api_token is not provided
+        Returns:
+            Summary with ``path``, ``format``, ``compression``, ``rows``,
+            ``pages`` and ``resumed``
 
         Example:
-            >>> client = MightyNetworksClient(
-            ...     api_token="your_api_token_here",
-            ...     timeout=60
-            ... )
+            >>> client.export("members", "members.ndjson.gz", network_id=12345)
+            >>> client.export("posts", "posts.csv", network_id=12345, space_id=67890, resume=True)
         """
-        if not api_token:
-            raise ValueError("API token is required")
+        from .export import export
 
-        self.api_token = api_token
-        self.base_url = base_url.rstrip('/')
-        self.timeout = timeout
+        paginator = self._export_source(source, prefetch, params)
+        return export(paginator, path, format=format, compression=compression,
+                      resume=resume, fields=fields)
 
-        # Initialize all resource instances
-        self.spaces = SpacesResource(self)
-        self.members = MembersResource(self)
-        self.posts = PostsResource(self)
-        self.events = EventsResource(self)
-        self.plans = PlansResource(self)
-        self.custom_fields = CustomFieldsResource(self)
-        self.comments = CommentsResource(self)
-        self.tags = TagsResource(self)
-        self.subscriptions = SubscriptionsResource(self)
-        self.purchases = PurchasesResource(self)
-        self.polls = PollsResource(self)
-        self.invites = InvitesResource(self)
-        self.collections = CollectionsResource(self)
-        self.badges = BadgesResource(self)
-        self.assets = AssetsResource(self)
-        self.abuse_reports = AbuseReportsResource(self)
-        self.me = MeResource(self)
-        self.network = NetworkResource(self)
+    def close(self) -> None:
+        """Close the shared connection pool; a later request opens a new one."""
+        with self._session_lock:
+            session, self._session_instance = self._session_instance, None
+        if session is not None:
+            session.close()
 
-    def __repr__(self) -> str:
-        """Return string representation of the client."""
-        return f"MightyNetworksClient(base_url='{self.base_url}')"
+    def __enter__(self) -> "MightyNetworksClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
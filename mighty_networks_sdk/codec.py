@@ -0,0 +1,116 @@
+"""
+Mighty Networks SDK JSON Codecs
+
+Pluggable JSON encoding and decoding of request and response bodies. The
+fastest installed library is picked automatically: orjson, then msgspec,
+then the standard library.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class JSONCodec:
+    """
+    Interface for JSON codecs.
+
+    Subclasses implement :meth:`dumps` (object to UTF-8 bytes) and
+    :meth:`loads` (bytes to object). Non-string dictionary keys, e.g. field
+    IDs in ``custom_fields.update_member_values``, are encoded as strings
+    like the standard library does.
+    """
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson`` (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, option=self._option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by ``msgspec`` (``pip install msgspec``)."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+# Order tried by get_codec("auto")
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Return a JSON codec.
+
+    Args:
+        codec: A codec instance, a codec name ("orjson", "msgspec", "json"),
+            or None / "auto" for the fastest installed one
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None or codec == "auto":
+        for name in _PREFERENCE:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected one of {sorted(CODECS)}")
+    return CODECS[codec]()
@@ -6,6 +6,8 @@ Handles all collection-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class CollectionsResource(BaseResource):
@@ -35,6 +37,26 @@ class CollectionsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every collection in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one collection at a time
+
+        Example:
+            >>> for collection in client.collections.iter_all(network_id=12345):
+            ...     print(collection["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/collections"
+        return self._paginate(endpoint)
+
     def get(
         self,
         network_id: int,
@@ -232,3 +254,7 @@ class CollectionsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/collections/{collection_id}/items/{item_id}/"
         return self._delete(endpoint)
+
+
+class AsyncCollectionsResource(AsyncBaseResource, CollectionsResource):
+    """Async variant of :class:`CollectionsResource`; every method is awaitable."""
@@ -0,0 +1,398 @@
+"""
+Mighty Networks SDK Columnar Results
+
+Collects paginated items straight into typed column buffers and converts
+them to NumPy arrays, a pyarrow Table or a pandas DataFrame. numpy, pyarrow
+and pandas are optional and only imported by the matching conversion.
+"""
+
+import importlib
+import json
+import re
+from array import array
+from collections.abc import Mapping
+from itertools import islice, repeat
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# ISO 8601 timestamps as returned by the API, e.g. 2025-01-15T09:30:00Z
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Column kinds and the array typecode of their buffer
+_TYPECODES = {"int": "q", "float": "d", "bool": "b", "timestamp": "q", "string": "i"}
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required for this conversion "
+            f"(pip install mighty-networks-sdk[{extra}])"
+        ) from None
+
+
+_INT64 = (-(2 ** 63), 2 ** 63)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _parse_timestamp(value: str) -> int:
+    """Return microseconds since the epoch (UTC) of an ISO 8601 timestamp."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def _json_default(value: Any) -> Any:
+    # Timestamp columns demoted to objects hold datetimes
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _kind_of(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "timestamp" if _TIMESTAMP.match(value) else "string"
+    return "object"
+
+
+def _validity(values: List[Any]) -> bytes:
+    if None in values:
+        return bytes([value is not None for value in values])
+    return b"\x01" * len(values)
+
+
+class Column:
+    """
+    One column being filled: a typed buffer plus a validity mask.
+
+    The kind is taken from the first non-null value. Integers widen to
+    floats when a float appears; any other mismatch turns the column into a
+    plain list of Python objects. Strings are dictionary-encoded as int32
+    codes into :attr:`uniques`; timestamps are int64 microseconds since the
+    epoch. Null slots hold 0 (-1 for string codes).
+    """
+
+    __slots__ = ("kind", "data", "valid", "_index")
+
+    def __init__(self, nulls: int = 0):
+        self.kind: Optional[str] = None
+        self.data: Any = None
+        self.valid = bytearray(nulls)
+        # String -> code; None maps to the null code
+        self._index: Dict[Any, int] = {None: -1}
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def uniques(self) -> List[str]:
+        """The distinct strings of a string column, in code order."""
+        return list(islice(self._index, 1, None))
+
+    def _start(self, kind: str) -> None:
+        self.kind = kind
+        nulls = len(self.valid)
+        if kind == "object":
+            self.data = [None] * nulls
+        elif kind == "string":
+            self.data = array("i", [-1]) * nulls
+        else:
+            self.data = array(_TYPECODES[kind], [0]) * nulls
+
+    def _demote(self, value: Any) -> None:
+        """Convert the buffer so it can also hold ``value``."""
+        if self.kind == "int" and isinstance(value, float):
+            self.kind = "float"
+            self.data = array("d", self.data)
+            return
+        self.data = self.values()
+        self.kind = "object"
+        self._index = {None: -1}
+
+    def _encode(self, value: Any) -> Any:
+        """Return ``value`` as stored in the buffer; raise TypeError if it does not fit."""
+        kind = self.kind
+        if kind == "object":
+            return value
+        if kind == "string" and type(value) is str:
+            index = self._index
+            return index.setdefault(value, len(index) - 1)
+        if kind == "timestamp" and type(value) is str:
+            try:
+                return _parse_timestamp(value)
+            except ValueError:
+                raise TypeError(value) from None
+        if kind == "int" and type(value) is int and _INT64[0] <= value < _INT64[1]:
+            return value
+        if kind == "float" and type(value) in (float, int):
+            return float(value)
+        if kind == "bool" and type(value) is bool:
+            return value
+        raise TypeError(value)
+
+    def append(self, value: Any) -> None:
+        """Append one value, widening the column if it does not fit."""
+        if value is None:
+            self.valid.append(0)
+            if self.kind is not None:
+                self.data.append(-1 if self.kind == "string" else None if self.kind == "object" else 0)
+            return
+        if self.kind is None:
+            self._start(_kind_of(value))
+        try:
+            encoded = self._encode(value)
+        except TypeError:
+            self._demote(value)
+            encoded = self._encode(value)
+        self.data.append(encoded)
+        self.valid.append(1)
+
+    def extend(self, values: List[Any]) -> None:
+        """
+        Append a batch of values.
+
+        Homogeneous batches are converted in one step; a batch that does not
+        fit the column's kind falls back to :meth:`append` value by value.
+        """
+        if self.kind is None:
+            first = next((value for value in values if value is not None), None)
+            if first is None:
+                self.valid.extend(bytes(len(values)))
+                return
+            self._start(_kind_of(first))
+        try:
+            data = self._encode_batch(values)
+        except (TypeError, ValueError, AttributeError, OverflowError):
+            for value in values:
+                self.append(value)
+            return
+        self.data.extend(data)
+        self.valid.extend(_validity(values))
+
+    def _encode_batch(self, values: List[Any]) -> Any:
+        kind = self.kind
+        if kind == "object":
+            return values
+        if kind == "string":
+            index = self._index
+            known = len(index)
+            setdefault = index.setdefault
+            try:
+                codes = array("i", [setdefault(value, len(index) - 1) for value in values])
+                if any(type(key) is not str for key in islice(index, known, None)):
+                    raise TypeError("non-string value")
+            except TypeError:
+                for key in list(islice(index, known, None)):
+                    del index[key]
+                raise
+            return codes
+        if kind == "timestamp":
+            # Naive timestamps raise TypeError here and go through _parse_timestamp
+            parse, epoch, unit = datetime.fromisoformat, _EPOCH, _MICROSECOND
+            return array("q", [
+                0 if value is None else (parse(value.replace("Z", "+00:00")) - epoch) // unit
+                for value in values
+            ])
+        if kind in ("int", "float"):
+            if None in values:
+                values = [0 if value is None else value for value in values]
+            # array() rejects strings, None and (for "q") floats and out-of-range ints
+            if kind == "int" and True in values and any(type(value) is bool for value in values):
+                raise TypeError("bool in int column")
+            return array(_TYPECODES[kind], values)
+        raise TypeError(kind)
+
+    def values(self) -> List[Any]:
+        """Return the column as a list of Python values (None for nulls)."""
+        kind, data, valid = self.kind, self.data, self.valid
+        if kind is None:
+            return [None] * len(valid)
+        if kind == "object":
+            return list(data)
+        if kind == "string":
+            uniques = self.uniques
+            return [uniques[code] if ok else None for code, ok in zip(data, valid)]
+        if kind == "timestamp":
+            return [
+                _EPOCH + timedelta(microseconds=micros) if ok else None
+                for micros, ok in zip(data, valid)
+            ]
+        if kind == "bool":
+            return [bool(flag) if ok else None for flag, ok in zip(data, valid)]
+        return [number if ok else None for number, ok in zip(data, valid)]
+
+    def __repr__(self) -> str:
+        return f"Column(kind={self.kind!r}, length={len(self.valid)})"
+
+
+def _as_mapping(item: Any) -> Mapping:
+    if isinstance(item, Mapping):
+        return item
+    if hasattr(item, "to_dict"):  # typed models
+        return item.to_dict()
+    raise TypeError(f"Cannot collect {type(item).__name__} items into columns")
+
+
+class Columns:
+    """
+    Column buffers filled one page at a time.
+
+    Items may be dicts, :class:`LazyItem` or typed models. A key that is
+    missing from an item, or first appears on a later page, is null for the
+    rows without it.
+
+    Example:
+        >>> columns = client.purchases.iter_all(network_id=12345).to_columns()
+        >>> columns.to_arrow()      # pyarrow.Table
+        >>> columns.to_pandas()     # pandas.DataFrame
+        >>> columns.to_numpy()      # {"id": array([...]), ...}
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, Column] = {}
+        self.rows = 0
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Append a page (or any iterable) of items, one column at a time."""
+        items = [item if type(item) is dict else _as_mapping(item) for item in items]
+        if not items:
+            return
+        get = dict.get if all(type(item) is dict for item in items) else Mapping.get
+        keys = dict.fromkeys(items[0])
+        first = items[0].keys()
+        for item in items:
+            if item.keys() != first:
+                keys.update(dict.fromkeys(item))
+
+        columns = self.columns
+        for key in keys:
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = Column(nulls=self.rows)
+            column.extend(list(map(get, items, repeat(key))))
+        for key, column in columns.items():
+            if key not in keys:
+                column.extend([None] * len(items))
+        self.rows += len(items)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Return a dict of NumPy arrays.
+
+        Integers, floats and booleans are native arrays (masked arrays when a
+        column has nulls), timestamps are ``datetime64[us]`` with NaT for
+        nulls, and strings and nested values are object arrays.
+        """
+        np = _require("numpy", "numpy")
+        arrays = {}
+        for name, column in self.columns.items():
+            valid = np.frombuffer(bytes(column.valid), dtype=np.bool_)
+            kind = column.kind
+            if kind in ("int", "float", "bool"):
+                dtype = {"int": np.int64, "float": np.float64, "bool": np.bool_}[kind]
+                values = np.frombuffer(column.data, dtype=np.int8 if kind == "bool" else dtype)
+                values = values.astype(dtype)
+                arrays[name] = values if valid.all() else np.ma.MaskedArray(values, mask=~valid)
+            elif kind == "timestamp":
+                values = np.frombuffer(column.data, dtype=np.int64).astype("datetime64[us]")
+                values[~valid] = np.datetime64("NaT")
+                arrays[name] = values
+            elif kind == "string":
+                # Null code -1 picks the trailing None
+                uniques = np.array(column.uniques + [None], dtype=object)
+                arrays[name] = uniques[np.frombuffer(column.data, dtype=np.int32)]
+            else:
+                values = np.empty(self.rows, dtype=object)
+                values[:] = column.values()
+                arrays[name] = values
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """
+        Return a ``pyarrow.Table``.
+
+        Strings are dictionary-encoded, timestamps are ``timestamp[us, UTC]``
+        and nested values are JSON-encoded strings.
+        """
+        pa = _require("pyarrow", "arrow")
+        np = _require("numpy", "numpy")
+        arrays, names = [], []
+        for name, column in self.columns.items():
+            mask = np.frombuffer(bytes(column.valid), dtype=np.bool_) == 0
+            kind = column.kind
+            if kind in ("int", "float", "bool", "timestamp"):
+                dtype = {"int": np.int64, "float": np.float64, "bool": np.int8, "timestamp": np.int64}[kind]
+                values = np.frombuffer(column.data, dtype=dtype)
+                arrow_type = {
+                    "int": pa.int64(),
+                    "float": pa.float64(),
+                    "bool": pa.bool_(),
+                    "timestamp": pa.timestamp("us", tz="UTC"),
+                }[kind]
+                if kind == "bool":
+                    values = values.astype(np.bool_)
+                arrays.append(pa.array(values, type=arrow_type, mask=mask))
+            elif kind == "string":
+                codes = pa.array(np.frombuffer(column.data, dtype=np.int32), mask=mask)
+                arrays.append(pa.DictionaryArray.from_arrays(codes, pa.array(column.uniques, pa.string())))
+            elif kind == "object":
+                arrays.append(pa.array(
+                    [None if value is None else json.dumps(value, default=_json_default) for value in column.data],
+                    pa.string(),
+                ))
+            else:
+                arrays.append(pa.nulls(self.rows))
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def to_pandas(self) -> Any:
+        """
+        Return a ``pandas.DataFrame``.
+
+        Strings become categoricals, integers with nulls use the nullable
+        ``Int64`` dtype, and timestamps are timezone-aware (UTC).
+        """
+        pd = _require("pandas", "pandas")
+        np = _require("numpy", "numpy")
+        data = {}
+        for name, column in self.columns.items():
+            valid = np.frombuffer(bytes(column.valid), dtype=np.bool_)
+            kind = column.kind
+            if kind == "string":
+                codes = np.frombuffer(column.data, dtype=np.int32)
+                data[name] = pd.Categorical.from_codes(codes, categories=column.uniques)
+            elif kind == "timestamp":
+                values = np.frombuffer(column.data, dtype=np.int64).astype("datetime64[us]")
+                values[~valid] = np.datetime64("NaT")
+                data[name] = pd.DatetimeIndex(values).tz_localize("UTC")
+            elif kind in ("int", "bool"):
+                dtype = "Int64" if kind == "int" else "boolean"
+                raw = np.frombuffer(column.data, dtype=np.int64 if kind == "int" else np.int8)
+                values = raw.astype(np.int64 if kind == "int" else np.bool_)
+                if valid.all():
+                    data[name] = values
+                else:
+                    data[name] = pd.arrays.IntegerArray(values, ~valid) if kind == "int" \
+                        else pd.arrays.BooleanArray(values, ~valid)
+            elif kind == "float":
+                values = np.frombuffer(column.data, dtype=np.float64).copy()
+                values[~valid] = np.nan
+                data[name] = values
+            else:
+                data[name] = pd.Series(column.values(), dtype=object)
+        return pd.DataFrame(data, index=pd.RangeIndex(self.rows))
+
+    def __repr__(self) -> str:
+        return f"Columns(rows={self.rows}, columns={list(self.columns)})"
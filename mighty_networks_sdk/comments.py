@@ -6,6 +6,8 @@ Handles all comment-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class CommentsResource(BaseResource):
@@ -43,6 +45,30 @@ class CommentsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int,
+        space_id: int,
+        post_id: int
+    ) -> Paginator:
+        """
+        Iterate over every comment on a post, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+            post_id: The post ID
+
+        Returns:
+            Lazy iterator yielding one comment at a time
+
+        Example:
+            >>> for comment in client.comments.iter_all(network_id=12345, space_id=67890, post_id=11111):
+            ...     print(comment["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/posts/{post_id}/comments"
+        return self._paginate(endpoint)
+
     def create(self, network_id: int, post_id: int, text: str, reply_to_id: int = None):
         endpoint = f"/admin/v1/networks/{network_id}/posts/{post_id}/comments"
         data = {"text": text}
@@ -80,3 +106,7 @@ class CommentsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/posts/{post_id}/comments/{comment_id}/"
         return self._delete(endpoint)
+
+
+class AsyncCommentsResource(AsyncBaseResource, CommentsResource):
+    """Async variant of :class:`CommentsResource`; every method is awaitable."""
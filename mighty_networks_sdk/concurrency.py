@@ -0,0 +1,219 @@
+"""
+Mighty Networks SDK Concurrency Control
+
+An AIMD (additive increase, multiplicative decrease) limiter that adapts the
+number of in-flight requests to how the API is responding.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+
+if TYPE_CHECKING:  # asyncio is imported by the first async caller
+    import asyncio
+
+# Status codes that signal the API is overloaded
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+def _wake_future(future: "asyncio.Future") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit in-flight requests, adapting the limit to 429s and latency.
+
+    While responses are fast and successful the limit grows by ``increase``
+    per window of ``limit`` requests. A 429/503, a network error, or a
+    smoothed latency above ``latency_tolerance`` times the baseline latency
+    multiplies the limit by ``decrease_factor``. Only requests sent after
+    the last decrease can trigger another one, so a burst of throttled
+    responses halves the limit once rather than collapsing it.
+
+    Latency is only sampled from 2xx responses: a fast 404 or 401 says
+    nothing about how loaded the API is. The baseline is the fastest of the
+    last one to two windows of ``baseline_window`` samples, so it follows
+    the API over the day instead of holding on to one lucky response. A
+    latency spike alone lowers the limit at most once per ``limit`` samples,
+    which gives the smoothed latency time to reflect the new limit.
+
+    Works for threads and asyncio tasks alike; one limiter can be shared by
+    a sync and an async client.
+
+    Attributes:
+        limit: Current number of requests allowed in flight
+        in_flight: Number of requests currently in flight
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, AdaptiveConcurrencyLimiter
+        >>>
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+        >>> client = MightyNetworksClient(
+        ...     api_token="your_api_token_here",
+        ...     concurrency_limiter=limiter,
+        ... )
+        >>> limiter.limit
+        4
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        baseline_window: int = 100,
+        smoothing: float = 0.2,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if baseline_window < 1:
+            raise ValueError("baseline_window must be at least 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_window = baseline_window
+        self.smoothing = smoothing
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        # Fastest latency in the current and the previous window of samples
+        self._window_min: Optional[float] = None
+        self._previous_min: Optional[float] = None
+        self._window_samples = 0
+        self._latency: Optional[float] = None
+        # 2xx samples since a latency spike last lowered the limit
+        self._since_latency_cut = float("inf")
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._overloads = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: Deque = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _wake(self) -> None:
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        for _ in range(min(free, len(self._async_waiters))):
+            loop, future = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_wake_future, future)
+
+    def acquire(self) -> float:
+        """Block until a slot is free; return the start time to pass to :meth:`release`."""
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """Wait on the event loop until a slot is free; return the start time."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_acquire():
+                    return time.monotonic()
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, future) in self._async_waiters:
+                        self._async_waiters.remove((loop, future))
+                    else:
+                        # We were woken but will not take the slot; pass it on
+                        self._wake()
+                raise
+
+    def release(self, started: float, status_code: Optional[int] = None) -> None:
+        """
+        Free a slot and feed the outcome back into the limit.
+
+        Args:
+            started: Value returned by :meth:`acquire`
+            status_code: Response status, or None if the request failed
+        """
+        latency = time.monotonic() - started
+        with self._lock:
+            self._in_flight -= 1
+            overloaded = status_code is None or status_code in OVERLOAD_STATUSES
+            slow = status_code is not None and 200 <= status_code < 300 and self._sample(latency)
+            # Right after a latency cut, slow responses hold the limit instead
+            spike = slow and self._since_latency_cut >= self._limit
+            if overloaded or spike:
+                self._overloads += 1
+                if started >= self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = time.monotonic()
+                    if spike:
+                        self._since_latency_cut = 0
+            elif not slow:
+                self._successes += 1
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._wake()
+
+    def _sample(self, latency: float) -> bool:
+        """Record a 2xx response's latency; return whether latency is above tolerance."""
+        if self._window_samples == self.baseline_window:
+            self._previous_min, self._window_min = self._window_min, None
+            self._window_samples = 0
+        self._window_samples += 1
+        window_min = latency if self._window_min is None else min(self._window_min, latency)
+        self._window_min = window_min
+        baseline = window_min if self._previous_min is None else min(window_min, self._previous_min)
+        smoothed = latency if self._latency is None else (
+            self._latency + self.smoothing * (latency - self._latency)
+        )
+        self._latency = smoothed
+        self._since_latency_cut += 1
+        return smoothed > baseline * self.latency_tolerance
+
+    def _baseline(self) -> Optional[float]:
+        mins = [m for m in (self._window_min, self._previous_min) if m is not None]
+        return min(mins) if mins else None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the current limit and counters."""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "latency": self._latency,
+                "baseline_latency": self._baseline(),
+                "successes": self._successes,
+                "overloads": self._overloads,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.limit}, "
+            f"in_flight={self._in_flight}, max_limit={self.max_limit})"
+        )
@@ -4,8 +4,11 @@ Custom Fields Resource
 Handles all custom field-related API operations.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from .base_resource import BaseResource
+from .models import CustomField, as_dict
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class CustomFieldsResource(BaseResource):
@@ -33,7 +36,27 @@ class CustomFieldsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/custom_fields"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=CustomField)
+
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every custom field in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one field at a time
+
+        Example:
+            >>> for field in client.custom_fields.iter_all(network_id=12345):
+            ...     print(field["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/custom_fields"
+        return self._paginate(endpoint, model=CustomField)
 
     def get(self, network_id: int, field_id: int) -> Dict[str, Any]:
         """
@@ -50,7 +73,7 @@ class CustomFieldsResource(BaseResource):
             >>> client.custom_fields.get(network_id=12345, field_id=456)
         """
         endpoint = f"/admin/v1/networks/{network_id}/custom_fields/{field_id}/"
-        return self._get(endpoint)
+        return self._get(endpoint, model=CustomField)
 
     def create(
         self,
@@ -200,3 +223,159 @@ class CustomFieldsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/members/{user_id}/custom_fields"
         return self._patch(endpoint, json=field_values)
+
+    def sync_member_values(
+        self,
+        network_id: int,
+        desired: Union[Mapping[int, Dict[str, Any]], Iterable[Tuple[int, Dict[str, Any]]]],
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Bring many members' custom field values to a desired state, writing only changes.
+
+        For each member the current values are read with
+        :meth:`get_member_values` (concurrently, and from the client's
+        response cache when one is configured), compared with the desired
+        values, and only the fields that differ are sent with
+        :meth:`update_member_values`. Members whose values already match are
+        not written at all. Fields not mentioned in ``desired`` are left as
+        they are.
+
+        Args:
+            network_id: The network ID
+            desired: ``{user_id: {field_id: value}}``, or an iterable of
+                ``(user_id, {field_id: value})`` pairs read lazily
+            concurrency: Members processed at once (default: 8)
+
+        Returns:
+            Summary report: ``members``, ``updated``, ``unchanged``,
+            ``fields_written``, ``fields_unchanged``, ``writes_skipped``
+            (PATCH requests not sent), ``failed`` (one dict per member with
+            ``user_id`` and ``message``), ``seconds`` and ``per_second``
+
+        Example:
+            >>> report = client.custom_fields.sync_member_values(
+            ...     network_id=12345,
+            ...     desired={99999: {"456": "Acme Corp", "457": "Technology"}},
+            ... )
+            >>> report["writes_skipped"], report["fields_written"]
+            (0, 2)
+        """
+        def sync(row: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+            user_id, wanted = row
+            current = self.get_member_values(network_id, user_id)
+            if not current["status"]:
+                return current
+            changes = _changes(current["data"], wanted)
+            if not changes:
+                return _unchanged(wanted)
+            return _written(self.update_member_values(network_id, user_id, changes), changes, wanted)
+
+        run = self._bulk(_desired_rows(desired), sync, concurrency)
+        tally = _SyncReport()
+        for result in run:
+            tally.add(result)
+        return tally.report(run.summary())
+
+
+def _desired_rows(desired: Any) -> Iterable[Tuple[int, Dict[str, Any]]]:
+    return desired.items() if isinstance(desired, Mapping) else desired
+
+
+def _field_values(data: Any) -> Dict[str, Any]:
+    """Return ``{field_id: value}`` from a ``get_member_values`` payload."""
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        data = data["items"]
+    if isinstance(data, list):
+        values = {}
+        for entry in data:
+            entry = as_dict(entry)
+            field_id = entry.get("custom_field_id", entry.get("field_id", entry.get("id")))
+            values[str(field_id)] = entry.get("value")
+        return values
+    return {str(field_id): value for field_id, value in as_dict(data or {}).items()}
+
+
+def _same(current: Any, wanted: Any) -> bool:
+    if current == wanted:
+        return True
+    # The API may return numbers as strings
+    scalars = (str, int, float)
+    return (
+        isinstance(current, scalars) and isinstance(wanted, scalars)
+        and not isinstance(current, bool) and not isinstance(wanted, bool)
+        and str(current) == str(wanted)
+    )
+
+
+def _changes(current: Any, wanted: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of ``wanted`` whose value differs from ``current``."""
+    values = _field_values(current)
+    return {
+        str(field_id): value
+        for field_id, value in wanted.items()
+        if not _same(values.get(str(field_id)), value)
+    }
+
+
+def _unchanged(wanted: Dict[str, Any]) -> Dict[str, Any]:
+    return {"status": True, "data": {}, "message": "unchanged", "changes": {}, "unchanged_fields": len(wanted)}
+
+
+def _written(result: Dict[str, Any], changes: Dict[str, Any], wanted: Dict[str, Any]) -> Dict[str, Any]:
+    return {**result, "changes": changes, "unchanged_fields": len(wanted) - len(changes)}
+
+
+class _SyncReport:
+    """Counts of a ``sync_member_values`` run, folded in one result at a time."""
+
+    def __init__(self):
+        self.counts = dict.fromkeys(
+            ("members", "updated", "unchanged", "fields_written", "fields_unchanged"), 0
+        )
+        self.failed: List[Dict[str, Any]] = []
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.counts["members"] += 1
+        if not result["status"]:
+            self.failed.append({"user_id": result["row"][0], "message": result["message"]})
+            return
+        self.counts["updated" if result["changes"] else "unchanged"] += 1
+        self.counts["fields_written"] += len(result["changes"])
+        self.counts["fields_unchanged"] += result["unchanged_fields"]
+
+    def report(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **self.counts,
+            "writes_skipped": self.counts["unchanged"],
+            "failed": self.failed,
+            "seconds": summary["seconds"],
+            "per_second": summary["per_second"],
+        }
+
+
+class AsyncCustomFieldsResource(AsyncBaseResource, CustomFieldsResource):
+    """Async variant of :class:`CustomFieldsResource`; every method is awaitable."""
+
+    async def sync_member_values(  # type: ignore[override]
+        self,
+        network_id: int,
+        desired: Union[Mapping[int, Dict[str, Any]], Iterable[Tuple[int, Dict[str, Any]]]],
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`CustomFieldsResource.sync_member_values`."""
+        async def sync(row: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+            user_id, wanted = row
+            current = await self.get_member_values(network_id, user_id)
+            if not current["status"]:
+                return current
+            changes = _changes(current["data"], wanted)
+            if not changes:
+                return _unchanged(wanted)
+            return _written(await self.update_member_values(network_id, user_id, changes), changes, wanted)
+
+        run = self._bulk(_desired_rows(desired), sync, concurrency)
+        tally = _SyncReport()
+        async for result in run:
+            tally.add(result)
+        return tally.report(run.summary())
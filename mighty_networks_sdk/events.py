@@ -6,6 +6,9 @@ Handles all event-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .models import Event, Member
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class EventsResource(BaseResource):
@@ -35,7 +38,29 @@ class EventsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/events"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Event)
+
+    def iter_all(
+        self,
+        network_id: int,
+        space_id: int
+    ) -> Paginator:
+        """
+        Iterate over every event in a space, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+
+        Returns:
+            Lazy iterator yielding one event at a time
+
+        Example:
+            >>> for event in client.events.iter_all(network_id=12345, space_id=67890):
+            ...     print(event["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/events"
+        return self._paginate(endpoint, model=Event)
 
     def get(
         self,
@@ -62,7 +87,7 @@ class EventsResource(BaseResource):
             ... )
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/events/{event_id}/"
-        return self._get(endpoint)
+        return self._get(endpoint, model=Event)
 
     def create(
         self,
@@ -207,4 +232,32 @@ class EventsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/events/{event_id}/attendees"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Member)
+
+    def iter_attendees(
+        self,
+        network_id: int,
+        space_id: int,
+        event_id: int
+    ) -> Paginator:
+        """
+        Iterate over every attendee of an event, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+            event_id: The event ID
+
+        Returns:
+            Lazy iterator yielding one attendee at a time
+
+        Example:
+            >>> for attendee in client.events.iter_attendees(network_id=12345, space_id=67890, event_id=22222):
+            ...     print(attendee["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/events/{event_id}/attendees"
+        return self._paginate(endpoint, model=Member)
+
+
+class AsyncEventsResource(AsyncBaseResource, EventsResource):
+    """Async variant of :class:`EventsResource`; every method is awaitable."""
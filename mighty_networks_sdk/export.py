@@ -0,0 +1,407 @@
+"""
+Mighty Networks SDK Export
+
+Streams every item of a paginated endpoint to an NDJSON, CSV or Parquet
+file one page at a time, so memory use does not grow with the size of the
+network. Progress is checkpointed after each page and an interrupted export
+can be resumed where it stopped.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .codec import JSONCodec
+from .columnar import Columns, _require
+from .lazy import LazyItem
+from .models import as_dict
+from .pagination import Paginator, _next_url, _page_items
+
+FORMATS = ("ndjson", "csv", "parquet")
+COMPRESSIONS = ("gzip", "zstd")
+
+_FORMAT_SUFFIXES = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".parquet": "parquet"}
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+_STATE_VERSION = 1
+
+
+def infer_format(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the ``(format, compression)`` implied by a file name.
+
+    Example:
+        >>> infer_format("members.ndjson.gz")
+        ('ndjson', 'gzip')
+    """
+    root, suffix = os.path.splitext(path.rstrip(os.sep))
+    compression = _COMPRESSION_SUFFIXES.get(suffix.lower())
+    if compression:
+        suffix = os.path.splitext(root)[1]
+    return _FORMAT_SUFFIXES.get(suffix.lower()), compression
+
+
+def _compressor(compression: Optional[str]) -> Callable[[bytes], bytes]:
+    """
+    Return a function compressing one page into a self-contained gzip member
+    or zstd frame. Concatenated members/frames decompress as one stream.
+    """
+    if compression is None:
+        return bytes
+    if compression == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstd compression requires zstandard (pip install mighty-networks-sdk[zstd])"
+            ) from None
+        return zstandard.ZstdCompressor(level=3).compress
+    raise ValueError(f"Unknown compression {compression!r}; expected one of {COMPRESSIONS}")
+
+
+class _FileSink:
+    """Appends encoded pages to one NDJSON or CSV file."""
+
+    def __init__(self, path: str, format: str, compression: Optional[str],
+                 codec: JSONCodec, fields: Optional[List[str]]):
+        self.path = path
+        self.format = format
+        self.codec = codec
+        self.fields = fields
+        self.compress = _compressor(compression)
+        self.file: Optional[Any] = None
+        self.header = False
+
+    def open(self, offset: int) -> None:
+        if offset:
+            # Drop whatever a crashed run wrote after its last checkpoint
+            self.file = open(self.path, "r+b")
+            self.file.truncate(offset)
+            self.file.seek(offset)
+        else:
+            self.file = open(self.path, "wb")
+            self.header = self.format == "csv"
+
+    def write(self, items: List[Any]) -> bool:
+        """Write one page; return whether the output is checkpointable."""
+        if self.format == "ndjson":
+            data = self._ndjson(items)
+        else:
+            data = self._csv(items)
+        if data:
+            self.file.write(self.compress(data))
+            self.file.flush()
+        return True
+
+    def _ndjson(self, items: List[Any]) -> bytes:
+        dumps = self.codec.dumps
+        lines = []
+        for item in items:
+            # LazyItem: reuse the response bytes instead of decoding
+            lines.append(item.raw if isinstance(item, LazyItem) else dumps(as_dict(item)))
+        return b"".join(line + b"\n" for line in lines)
+
+    def _csv(self, items: List[Any]) -> bytes:
+        rows = [as_dict(item) for item in items]
+        buffer = io.StringIO()
+        if self.fields is None:
+            # Columns of the first page; later unknown keys are not written
+            self.fields = list(dict.fromkeys(key for row in rows for key in row))
+        writer = csv.writer(buffer)
+        if self.header:
+            writer.writerow(self.fields)
+            self.header = False
+        dumps = self.codec.dumps
+        for row in rows:
+            writer.writerow([
+                "" if value is None
+                else dumps(value).decode() if isinstance(value, (dict, list))
+                else value
+                for value in (row.get(field) for field in self.fields)
+            ])
+        return buffer.getvalue().encode()
+
+    @property
+    def offset(self) -> int:
+        return self.file.tell() if self.file else 0
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+
+
+class _ParquetSink:
+    """
+    Writes ``part-NNNNN.parquet`` files of up to ``rows_per_part`` rows to a directory.
+
+    The first part fixes the schema, as the first page fixes CSV columns:
+    later parts are cast to it, with missing columns null and new columns
+    dropped, so the directory reads as one dataset.
+    """
+
+    def __init__(self, path: str, compression: Optional[str], rows_per_part: int):
+        self.path = path
+        self.compression = compression or "snappy"
+        self.rows_per_part = rows_per_part
+        self.parts = 0
+        self.columns = Columns()
+        self.schema: Optional[Any] = None
+        self.pa = _require("pyarrow", "arrow")
+        self.parquet = _require("pyarrow.parquet", "arrow")
+
+    def open(self, parts: int) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        self.parts = parts
+        if parts:
+            self.schema = self.parquet.read_schema(os.path.join(self.path, "part-00000.parquet"))
+        # Parts after the checkpoint belong to the interrupted run
+        for name in os.listdir(self.path):
+            if name.startswith("part-") and name.endswith(".parquet") and self._number(name) >= parts:
+                os.remove(os.path.join(self.path, name))
+
+    @staticmethod
+    def _number(name: str) -> int:
+        try:
+            return int(name[5:-8])
+        except ValueError:
+            return -1
+
+    def write(self, items: List[Any]) -> bool:
+        """Buffer one page; return True when a part was written (checkpointable)."""
+        self.columns.extend(items)
+        if len(self.columns) < self.rows_per_part:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        if not len(self.columns):
+            return
+        part = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        self.parquet.write_table(
+            self._conform(self.columns.to_arrow()), part + ".tmp", compression=self.compression
+        )
+        os.replace(part + ".tmp", part)
+        self.parts += 1
+        self.columns = Columns()
+
+    def _conform(self, table: Any) -> Any:
+        pa = self.pa
+        if self.schema is None:
+            # Columns that are null throughout the first part are typed as strings
+            self.schema = pa.schema([
+                pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                for field in table.schema
+            ])
+        columns = []
+        for field in self.schema:
+            if field.name not in table.column_names:
+                columns.append(pa.nulls(len(table), field.type))
+                continue
+            column = table.column(field.name)
+            if column.type != field.type:
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    raise ValueError(
+                        f"Column {field.name!r} changed type from {field.type} to "
+                        f"{column.type}; export it as NDJSON or CSV instead"
+                    ) from None
+            columns.append(column)
+        return pa.Table.from_arrays(columns, schema=self.schema)
+
+    @property
+    def offset(self) -> int:
+        return self.parts
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ExportJob:
+    """
+    State of one export: where it writes, and where to pick up on resume.
+
+    The checkpoint lives next to the output in ``<path>.export-state`` and is
+    replaced atomically after each page (each part for Parquet). It records
+    the next page URL and how far the output is valid: the byte offset of a
+    file, or the number of finished Parquet parts. The checkpoint is removed
+    once the export completes.
+
+    Use :func:`export` or :meth:`MightyNetworksClient.export` rather than this
+    class directly.
+    """
+
+    def __init__(
+        self,
+        paginator: Paginator,
+        path: str,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        resume: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        rows_per_part: int = 100_000,
+        codec: Optional[JSONCodec] = None,
+    ):
+        path = os.fspath(path)
+        inferred_format, inferred_compression = infer_format(path)
+        self.format = format or inferred_format or "ndjson"
+        self.compression = compression if compression is not None else inferred_compression
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown format {self.format!r}; expected one of {FORMATS}")
+        if self.compression is not None and self.compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {self.compression!r}; expected one of {COMPRESSIONS}")
+
+        self.paginator = paginator
+        self.path = path
+        self.state_path = path.rstrip(os.sep) + ".export-state"
+        self.rows = 0
+        self.pages = 0
+        self.next_url: Optional[str] = paginator.endpoint
+        self.resumed = False
+
+        state = self._load_state() if resume else None
+        if state is None and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        if state is not None:
+            self.rows, self.pages = state["rows"], state["pages"]
+            self.next_url = state["next"]
+            fields = state["fields"]
+            self.resumed = True
+        if self.format == "parquet":
+            self.sink: Any = _ParquetSink(path, self.compression, rows_per_part)
+        else:
+            codec = codec or paginator.resource.client.json_codec
+            self.sink = _FileSink(path, self.format, self.compression, codec,
+                                  list(fields) if fields is not None else None)
+        self.sink.open(state["offset"] if state else 0)
+
+    def _identity(self) -> Dict[str, Any]:
+        return {
+            "version": _STATE_VERSION,
+            "endpoint": self.paginator.endpoint,
+            "params": self.paginator.params,
+            "format": self.format,
+            "compression": self.compression,
+        }
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return None
+        identity = self._identity()
+        if {key: state.get(key) for key in identity} != json.loads(json.dumps(identity)):
+            raise ValueError(
+                f"{self.state_path} belongs to a different export; "
+                "remove it or export without resume"
+            )
+        if not os.path.exists(self.path):
+            return None
+        return state
+
+    def _save_state(self) -> None:
+        state = dict(self._identity(), next=self.next_url, offset=self.sink.offset,
+                     rows=self.rows, pages=self.pages,
+                     fields=getattr(self.sink, "fields", None))
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(tmp, self.state_path)
+
+    def source(self) -> Optional[Paginator]:
+        """Return the paginator to consume: the original, or one starting at the checkpoint."""
+        if self.next_url is None:
+            return None
+        paginator = self.paginator
+        if not self.resumed:
+            return paginator
+        return type(paginator)(
+            paginator.resource,
+            self.next_url,
+            prefetch_pages=paginator.prefetch_pages,
+            model=paginator.model,
+        )
+
+    def write_page(self, page: Dict[str, Any]) -> None:
+        """Write one page and checkpoint if the output is consistent."""
+        items = _page_items(page)
+        self.next_url = _next_url(page, self.next_url)
+        self.rows += len(items)
+        self.pages += 1
+        if self.sink.write(items):
+            self._save_state()
+
+    def finish(self) -> Dict[str, Any]:
+        """Flush, close and remove the checkpoint; return the export summary."""
+        self.sink.close()
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        return {
+            "path": self.path,
+            "format": self.format,
+            "compression": self.compression,
+            "rows": self.rows,
+            "pages": self.pages,
+            "resumed": self.resumed,
+        }
+
+    def abort(self) -> None:
+        """Close the output after a failure, keeping the last checkpoint."""
+        if isinstance(self.sink, _FileSink):
+            self.sink.close()
+
+
+def export(paginator: Paginator, path: str, **options: Any) -> Dict[str, Any]:
+    """
+    Stream every item of ``paginator`` to ``path``.
+
+    Args:
+        paginator: Iterator returned by an ``iter_*`` method
+        path: Output file (a directory for Parquet)
+        format: "ndjson", "csv" or "parquet" (default: from the file name,
+            else "ndjson")
+        compression: "gzip", "zstd" or None (default: from a .gz / .zst
+            suffix). Parquet uses it as its column compression (default snappy)
+        resume: Continue from ``<path>.export-state`` if present
+        fields: CSV columns (default: keys of the first page)
+        rows_per_part: Rows per Parquet part file
+        codec: JSON codec (default: the client's)
+
+    Returns:
+        Summary with ``path``, ``format``, ``compression``, ``rows``,
+        ``pages`` and ``resumed``
+
+    Raises:
+        APIError: If a page request fails; the checkpoint is kept so the
+            export can be resumed
+    """
+    job = ExportJob(paginator, path, **options)
+    try:
+        source = job.source()
+        if source is not None:
+            for page in source.pages():
+                job.write_page(page)
+    except BaseException:
+        job.abort()
+        raise
+    return job.finish()
+
+
+async def export_async(paginator: Paginator, path: str, **options: Any) -> Dict[str, Any]:
+    """Async variant of :func:`export` for :class:`AsyncPaginator` sources."""
+    job = ExportJob(paginator, path, **options)
+    try:
+        source = job.source()
+        if source is not None:
+            async for page in source.pages():
+                job.write_page(page)
+    except BaseException:
+        job.abort()
+        raise
+    return job.finish()
@@ -0,0 +1,462 @@
+"""
+Mighty Networks SDK Lookup Indexes
+
+Local indexes built from paginated scans and kept fresh incrementally, so
+bulk lookups are answered without one API request per key.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .exceptions import APIError
+from .models import as_dict
+from .watermark import IncrementalSync, WatermarkStore
+
+
+def _normalize(email: str) -> str:
+    return email.strip().lower()
+
+
+class MemberEmailIndex:
+    """
+    Email-to-member index of one network.
+
+    :meth:`build` scans every member once; :meth:`refresh` then reads only
+    the members changed since (see
+    :class:`~mighty_networks_sdk.watermark.IncrementalSync`).
+    :meth:`lookup_emails` answers a batch from the index and calls
+    ``members.get_by_email`` for the emails still unknown. Emails the API
+    confirms absent are cached as absent for ``negative_ttl`` seconds, or
+    until a refresh finds them.
+
+    A refresh reads every member page unless ``order_param`` asks the API
+    for newest-first results, e.g. ``("sort", "-updated_at")``, or
+    ``order="desc"`` declares the listing newest-first, letting it stop at
+    the first member older than the last scan. Only then does a batch with
+    several misses refresh once before falling back to ``get_by_email``.
+
+    Emails are matched case-insensitively. Members are kept in memory, or in
+    the ``members`` table of a :class:`~mighty_networks_sdk.mirror.Mirror`
+    when one is given, so the index survives restarts.
+
+    Attributes:
+        network_id: Indexed network
+        stats: Counts of hits, misses, negative hits and API calls
+
+    Example:
+        >>> index = MemberEmailIndex(client, network_id=12345)
+        >>> index.build()
+        >>> found = index.lookup_emails(["jane@example.com", "new@example.com"])
+        >>> found["new@example.com"]   # None if not a member
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        network_id: int,
+        mirror: Any = None,
+        store: Optional[WatermarkStore] = None,
+        negative_ttl: float = 3600.0,
+        order_param: Optional[Tuple[str, str]] = None,
+        order: str = "auto",
+    ):
+        if client._session_class != "Client":
+            raise TypeError("MemberEmailIndex looks up through a MightyNetworksClient, not the async client")
+        if mirror is not None and mirror.network_id != network_id:
+            raise ValueError(f"Mirror is of network {mirror.network_id}, not {network_id}")
+        self.client = client
+        self.network_id = network_id
+        self.mirror = mirror
+        self.negative_ttl = negative_ttl
+        self._sync = IncrementalSync(client, store, order=order, order_param=order_param)
+        self._lock = threading.Lock()
+        self._members: Dict[str, Dict[str, Any]] = {}
+        self._emails: Dict[Any, str] = {}
+        self._absent: Dict[str, float] = {}
+        self.built = False
+        self.stats = dict.fromkeys(("hits", "misses", "negative_hits", "api_calls"), 0)
+
+    # -- Maintenance ---------------------------------------------------------
+
+    def build(self) -> int:
+        """Scan every member of the network; returns the number indexed."""
+        self._sync.reset("members", network_id=self.network_id)
+        with self._lock:
+            self._members.clear()
+            self._emails.clear()
+        count = self.refresh()
+        self.built = True
+        return count
+
+    def refresh(self) -> int:
+        """Apply the members changed since the last scan; returns how many."""
+        changed = [as_dict(item) for item in self._sync.changes("members", network_id=self.network_id)]
+        self._add(changed)
+        self.built = True
+        return len(changed)
+
+    def _add(self, members: List[Dict[str, Any]]) -> None:
+        if self.mirror is not None:
+            self.mirror.upsert("members", members)
+        with self._lock:
+            for member in members:
+                email = member.get("email")
+                if not email:
+                    continue
+                key = _normalize(email)
+                self._absent.pop(key, None)
+                if self.mirror is None:
+                    # A changed email must stop resolving to the member
+                    previous = self._emails.pop(member.get("id"), None)
+                    if previous is not None and previous != key:
+                        self._members.pop(previous, None)
+                    self._members[key] = member
+                    self._emails[member.get("id")] = key
+
+    def forget(self, email: str) -> None:
+        """Drop ``email`` from the index and the negative cache."""
+        key = _normalize(email)
+        with self._lock:
+            member = self._members.pop(key, None)
+            if member is not None:
+                self._emails.pop(member.get("id"), None)
+            self._absent.pop(key, None)
+
+    # -- Lookups -------------------------------------------------------------
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.mirror is not None:
+            return self.mirror.member_by_email(key)
+        with self._lock:
+            return self._members.get(key)
+
+    def _is_absent(self, key: str) -> bool:
+        with self._lock:
+            expires = self._absent.get(key)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._absent[key]
+                return False
+            return True
+
+    def lookup(self, email: str) -> Optional[Dict[str, Any]]:
+        """Return the member with ``email``, or None if there is none."""
+        return self.lookup_emails([email])[email]
+
+    def lookup_emails(self, emails: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve a batch of emails to members.
+
+        Args:
+            emails: Emails to look up, in any case
+
+        Returns:
+            Dict mapping each given email to its member, or None
+
+        Raises:
+            APIError: If a fallback request fails other than with 404
+        """
+        emails = list(emails)
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing: Dict[str, List[str]] = {}
+        for email in emails:
+            key = _normalize(email)
+            member = self._cached(key)
+            if member is not None:
+                self.stats["hits"] += 1
+                found[email] = member
+            elif self._is_absent(key):
+                self.stats["negative_hits"] += 1
+                found[email] = None
+            else:
+                missing.setdefault(key, []).append(email)
+
+        if len(missing) > 1 and self.built and self._sync.order == "desc":
+            # A pass that stops early usually costs less than a request per
+            # email; one that reads every page costs far more
+            self.refresh()
+            for key in list(missing):
+                member = self._cached(key)
+                if member is not None:
+                    found.update(dict.fromkeys(missing.pop(key), member))
+
+        for key, originals in missing.items():
+            self.stats["misses"] += 1
+            found.update(dict.fromkeys(originals, self._fetch(key)))
+        return {email: found[email] for email in emails}
+
+    def _fetch(self, key: str) -> Optional[Dict[str, Any]]:
+        self.stats["api_calls"] += 1
+        result = self.client.members.get_by_email(self.network_id, key)
+        if not result["status"]:
+            if not result["message"].startswith("Not found"):
+                raise APIError(result["message"], response=result)
+            with self._lock:
+                self._absent[key] = time.monotonic() + self.negative_ttl
+            return None
+        member = as_dict(result["data"])
+        self._add([member])
+        return member
+
+    def __len__(self) -> int:
+        if self.mirror is not None:
+            return self.mirror.count("members")
+        return len(self._members)
+
+    def __contains__(self, email: str) -> bool:
+        return self._cached(_normalize(email)) is not None
+
+    def __repr__(self) -> str:
+        return f"MemberEmailIndex(network_id={self.network_id}, members={len(self)})"
+
+
+# Write URLs the membership index follows, relative to /admin/v1/networks/{id}
+_SPACE_MEMBER = re.compile(r"/spaces/(\d+)/members(?:/(\d+))?/?$")
+_SPACE = re.compile(r"/spaces/(\d+)/?$")
+
+
+def _positions(bits: int) -> List[int]:
+    """Return the positions of the set bits of ``bits``, lowest first."""
+    text = bin(bits)[:1:-1]
+    positions, found = [], text.find("1")
+    while found != -1:
+        positions.append(found)
+        found = text.find("1", found + 1)
+    return positions
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class SpaceMembershipIndex:
+    """
+    In-memory member/space graph of one network.
+
+    :meth:`build` lists the spaces and crawls their members concurrently,
+    one ``spaces.iter_members`` scan per space. Each member and space gets a
+    dense position, and each space keeps its members as a bitset (a Python
+    int), so intersections, unions and differences across spaces are a few
+    big-integer operations. Each member keeps the bitset of its spaces.
+
+    The index follows ``spaces.add_member``, ``spaces.remove_member`` and
+    ``spaces.delete`` calls made through the same client, via
+    ``client.write_listeners``; :meth:`close` stops following them.
+
+    Example:
+        >>> index = SpaceMembershipIndex(client, network_id=12345)
+        >>> index.build()
+        >>> index.spaces_of(99999)
+        [67890, 67891]
+        >>> index.shared_members(67890, 67891)
+        [99999, 100001]
+    """
+
+    def __init__(self, client: Any, network_id: int, max_workers: int = 8):
+        if client._session_class != "Client":
+            raise TypeError("SpaceMembershipIndex crawls through a MightyNetworksClient, not the async client")
+        self.client = client
+        self.network_id = network_id
+        self.max_workers = max_workers
+        self._lock = threading.RLock()
+        self._member_ids: List[int] = []
+        self._member_positions: Dict[int, int] = {}
+        self._space_ids: List[int] = []
+        self._space_positions: Dict[int, int] = {}
+        self._space_bits: Dict[int, int] = {}
+        self._member_bits: List[int] = []
+        self._prefix = f"/admin/v1/networks/{network_id}"
+        client.write_listeners.append(self._on_write)
+
+    # -- Maintenance ---------------------------------------------------------
+
+    def _crawl(self, space_id: int) -> List[int]:
+        members = map(as_dict, self.client.spaces.iter_members(self.network_id, space_id))
+        return [member.get("member_id", member.get("id")) for member in members]
+
+    def build(self) -> Dict[str, int]:
+        """
+        Crawl every space's members, replacing the index.
+
+        Returns:
+            Numbers of spaces, members and memberships indexed
+
+        Raises:
+            APIError: If a page cannot be fetched
+        """
+        space_ids = [as_dict(space)["id"] for space in self.client.spaces.iter_all(self.network_id)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            crawled = list(pool.map(self._crawl, space_ids))
+        with self._lock:
+            self._member_ids, self._member_positions, self._member_bits = [], {}, []
+            self._space_ids, self._space_positions, self._space_bits = [], {}, {}
+            for space_id, member_ids in zip(space_ids, crawled):
+                self._set_space(space_id, member_ids)
+            return self.stats()
+
+    def refresh_space(self, space_id: int) -> int:
+        """Re-crawl one space; returns its member count."""
+        member_ids = self._crawl(space_id)
+        with self._lock:
+            self._set_space(space_id, member_ids)
+            return len(member_ids)
+
+    def _position(self, member_id: int) -> int:
+        position = self._member_positions.get(member_id)
+        if position is None:
+            position = self._member_positions[member_id] = len(self._member_ids)
+            self._member_ids.append(member_id)
+            self._member_bits.append(0)
+        return position
+
+    def _space(self, space_id: int) -> int:
+        position = self._space_positions.get(space_id)
+        if position is None:
+            position = self._space_positions[space_id] = len(self._space_ids)
+            self._space_ids.append(space_id)
+            self._space_bits[space_id] = 0
+        return position
+
+    def _set_space(self, space_id: int, member_ids: Iterable[int]) -> None:
+        space = self._space(space_id)
+        bit = 1 << space
+        for position in _positions(self._space_bits[space_id]):
+            self._member_bits[position] &= ~bit
+        positions = [self._position(member_id) for member_id in member_ids]
+        # Set the bits in a buffer: one int conversion instead of one per member
+        buffer = bytearray(len(self._member_ids) // 8 + 1)
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+            self._member_bits[position] |= bit
+        self._space_bits[space_id] = int.from_bytes(bytes(buffer), "little")
+
+    def add(self, space_id: int, member_id: int) -> None:
+        """Record that ``member_id`` joined ``space_id``."""
+        with self._lock:
+            space, position = self._space(space_id), self._position(member_id)
+            self._space_bits[space_id] |= 1 << position
+            self._member_bits[position] |= 1 << space
+
+    def discard(self, space_id: int, member_id: int) -> None:
+        """Record that ``member_id`` left ``space_id``."""
+        with self._lock:
+            space = self._space_positions.get(space_id)
+            position = self._member_positions.get(member_id)
+            if space is None or position is None:
+                return
+            self._space_bits[space_id] &= ~(1 << position)
+            self._member_bits[position] &= ~(1 << space)
+
+    def _on_write(self, method: str, url: str, result: Dict[str, Any]) -> None:
+        parsed = urlsplit(url)
+        path = parsed.path
+        if not path.startswith(self._prefix):
+            return
+        path = path[len(self._prefix):]
+        match = _SPACE_MEMBER.match(path)
+        if match and method == "POST" and not match.group(2):
+            user_id = parse_qs(parsed.query).get("user_id")
+            if user_id:
+                self.add(int(match.group(1)), int(user_id[0]))
+        elif match and method == "DELETE" and match.group(2):
+            self.discard(int(match.group(1)), int(match.group(2)))
+        elif method == "DELETE" and _SPACE.match(path):
+            with self._lock:
+                self._set_space(int(_SPACE.match(path).group(1)), [])
+
+    def close(self) -> None:
+        """Stop following writes made through the client."""
+        if self._on_write in self.client.write_listeners:
+            self.client.write_listeners.remove(self._on_write)
+
+    def __enter__(self) -> "SpaceMembershipIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # -- Queries -------------------------------------------------------------
+
+    def _members(self, bits: int) -> List[int]:
+        return sorted(self._member_ids[position] for position in _positions(bits))
+
+    def _bits(self, space_id: int) -> int:
+        return self._space_bits.get(space_id, 0)
+
+    def spaces_of(self, member_id: int) -> List[int]:
+        """Return the IDs of the spaces ``member_id`` belongs to."""
+        with self._lock:
+            position = self._member_positions.get(member_id)
+            if position is None:
+                return []
+            return sorted(self._space_ids[space] for space in _positions(self._member_bits[position]))
+
+    def members_of(self, space_id: int) -> List[int]:
+        """Return the member IDs of ``space_id``."""
+        with self._lock:
+            return self._members(self._bits(space_id))
+
+    def is_member(self, member_id: int, space_id: int) -> bool:
+        """Return whether ``member_id`` belongs to ``space_id``."""
+        with self._lock:
+            position = self._member_positions.get(member_id)
+            return position is not None and bool(self._bits(space_id) >> position & 1)
+
+    def count(self, space_id: int) -> int:
+        """Return the number of members of ``space_id``."""
+        with self._lock:
+            return _popcount(self._bits(space_id))
+
+    def shared_members(self, *space_ids: int) -> List[int]:
+        """Return the members belonging to every one of ``space_ids``."""
+        if not space_ids:
+            return []
+        with self._lock:
+            bits = self._bits(space_ids[0])
+            for space_id in space_ids[1:]:
+                bits &= self._bits(space_id)
+            return self._members(bits)
+
+    def members_in_any(self, *space_ids: int) -> List[int]:
+        """Return the members belonging to at least one of ``space_ids``."""
+        with self._lock:
+            bits = 0
+            for space_id in space_ids:
+                bits |= self._bits(space_id)
+            return self._members(bits)
+
+    def members_only_in(self, space_id: int, *excluded: int) -> List[int]:
+        """Return the members of ``space_id`` that belong to none of ``excluded``."""
+        with self._lock:
+            bits = self._bits(space_id)
+            for other in excluded:
+                bits &= ~self._bits(other)
+            return self._members(bits)
+
+    def shared_spaces(self, *member_ids: int) -> List[int]:
+        """Return the spaces every one of ``member_ids`` belongs to."""
+        if not member_ids:
+            return []
+        with self._lock:
+            bits = -1
+            for member_id in member_ids:
+                position = self._member_positions.get(member_id)
+                bits &= self._member_bits[position] if position is not None else 0
+            return sorted(self._space_ids[space] for space in _positions(bits))
+
+    def stats(self) -> Dict[str, int]:
+        """Return the numbers of spaces, members and memberships indexed."""
+        with self._lock:
+            return {
+                "spaces": len(self._space_ids),
+                "members": len(self._member_ids),
+                "memberships": sum(_popcount(bits) for bits in self._space_bits.values()),
+            }
+
+    def __repr__(self) -> str:
+        return f"SpaceMembershipIndex(network_id={self.network_id}, spaces={len(self._space_ids)})"
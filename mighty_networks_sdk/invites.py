@@ -6,6 +6,8 @@ Handles all invitation-related API operations.
 
 from typing import Dict, Any, Optional, List
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class InvitesResource(BaseResource):
@@ -35,6 +37,26 @@ class InvitesResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every invitation in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one invite at a time
+
+        Example:
+            >>> for invite in client.invites.iter_all(network_id=12345):
+            ...     print(invite["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/invites"
+        return self._paginate(endpoint)
+
     def create(
         self,
         network_id: int,
@@ -135,3 +157,7 @@ class InvitesResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/invites/{invite_id}/"
         return self._delete(endpoint)
+
+
+class AsyncInvitesResource(AsyncBaseResource, InvitesResource):
+    """Async variant of :class:`InvitesResource`; every method is awaitable."""
@@ -0,0 +1,144 @@
+"""
+Mighty Networks SDK Lazy Responses
+
+With ``response_mode="lazy"`` each item of a page is a read-only mapping over
+its raw JSON fields; a field is decoded only when it is read. Splitting a
+page into raw fields is done by msgspec (``pip install msgspec``) without
+building the nested values, which cuts the time and peak memory of scans
+that read a few fields of each record.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Tuple
+
+# msgspec is imported on first use, so dict mode never pays for loading it
+_decoders: Dict[str, Any] = {}
+
+
+def _decoder(name: str) -> Any:
+    """Return a cached msgspec decoder: "any", "object", "objects" or "array"."""
+    decoder = _decoders.get(name)
+    if decoder is None:
+        import msgspec
+
+        Raw = msgspec.Raw
+        types = {
+            "any": Any,
+            "object": Dict[str, Raw],
+            "objects": List[Dict[str, Raw]],
+            "array": List[Raw],
+        }
+        decoder = _decoders[name] = msgspec.json.Decoder(types[name])
+    return decoder
+
+
+def require_msgspec() -> None:
+    """Raise ImportError if msgspec, needed by lazy mode, is missing."""
+    try:
+        import msgspec  # noqa: F401
+    except ImportError:
+        raise ImportError('response_mode="lazy" requires msgspec (pip install msgspec)') from None
+
+
+class LazyItem(Mapping):
+    """
+    Read-only mapping over the raw JSON fields of one item.
+
+    Reading a field decodes it on first access and remembers the value;
+    fields that are never read, such as nested custom fields, are never
+    decoded. Use :meth:`to_dict` for a plain dict.
+
+    Example:
+        >>> client = MightyNetworksClient(api_token="...", response_mode="lazy")
+        >>> for member in client.members.iter_all(network_id=12345):
+        ...     print(member["id"], member["email"], member["updated_at"])
+    """
+
+    __slots__ = ("_fields", "_values")
+
+    def __init__(self, fields: Dict[str, Any]):
+        self._fields = fields
+        self._values: Dict[str, Any] = {}
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "LazyItem":
+        """Build an item from the JSON of an object."""
+        require_msgspec()
+        return cls(_decoder("object").decode(raw))
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key not in values:
+            values[key] = _decoder("any").decode(self._fields[key])
+        return values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    @property
+    def raw(self) -> bytes:
+        """The item re-assembled as JSON bytes."""
+        import msgspec
+
+        encode = msgspec.json.encode
+        return b"{" + b",".join(
+            encode(key) + b":" + bytes(value) for key, value in self._fields.items()
+        ) + b"}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode the whole item."""
+        return {key: self[key] for key in self._fields}
+
+    def __reduce__(self):
+        # Raw fields are views into the page; snapshots keep bytes instead
+        return type(self).from_json, (self.raw,)
+
+    def __repr__(self) -> str:
+        return f"LazyItem({', '.join(self._fields)})"
+
+
+def is_object(raw: Any) -> bool:
+    """Return whether ``raw`` (bytes or msgspec.Raw) holds a JSON object."""
+    view = memoryview(raw)
+    for index in range(len(view)):
+        if view[index] not in b" \t\r\n":
+            return view[index] == ord("{")
+    return False
+
+
+def lazy_body(content: bytes) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Return the items and links of a JSON object body, with items left lazy.
+
+    Mirrors ``BaseResource._handle_response``: a body with ``items`` gives a
+    list of :class:`LazyItem` (non-object items are decoded), any other body
+    gives a single :class:`LazyItem`.
+
+    Raises:
+        msgspec.DecodeError: If the body is not a valid JSON object
+    """
+    import msgspec
+
+    fields = _decoder("object").decode(content)
+    links = (_decoder("any").decode(fields["links"]) if "links" in fields else None) or {}
+    if "items" not in fields:
+        return LazyItem(fields), links
+
+    items = fields["items"]
+    try:
+        # Split every item in one pass; fails if an item is not an object
+        return [LazyItem(item) for item in _decoder("objects").decode(items)], links
+    except msgspec.ValidationError:
+        pass
+    if bytes(memoryview(items)[:1]) != b"[":
+        return _decoder("any").decode(items), links
+    return [
+        LazyItem(_decoder("object").decode(item)) if is_object(item) else _decoder("any").decode(item)
+        for item in _decoder("array").decode(items)
+    ], links
@@ -4,6 +4,7 @@ Me Resource
 
 from typing import Dict, Any, Optional, List
 from .base_resource import BaseResource
+from .async_base_resource import AsyncBaseResource
 
 
 class MeResource(BaseResource):
@@ -25,4 +26,8 @@ class MeResource(BaseResource):
             >>> client.me.show(network_id=12345)
         """
         endpoint = f"/admin/v1/networks/{network_id}/me"
-        return self._get(endpoint)
\ No newline at end of file
+        return self._get(endpoint)
+
+
+class AsyncMeResource(AsyncBaseResource, MeResource):
+    """Async variant of :class:`MeResource`; every method is awaitable."""
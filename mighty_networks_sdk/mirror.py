@@ -0,0 +1,452 @@
+"""
+Mighty Networks SDK Mirror
+
+Keeps a local SQLite copy of a network, filled through the resource
+iterators, so dashboards, lookups and reports read from disk in
+microseconds without spending API quota.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .exceptions import APIError
+from .models import as_dict
+
+# Resource -> columns copied out of each item for filtering, sorting and indexes.
+# The full item is kept as JSON in ``data``.
+TABLES: Dict[str, Tuple[str, ...]] = {
+    "members": ("email", "first_name", "last_name", "created_at", "updated_at"),
+    "spaces": ("name", "created_at", "updated_at"),
+    "space_members": ("role", "created_at", "updated_at"),
+    "posts": ("space_id", "author_id", "title", "created_at", "updated_at"),
+    "events": ("space_id", "title", "start_time", "end_time", "created_at", "updated_at"),
+    "plans": ("name", "is_active", "created_at", "updated_at"),
+    "subscriptions": ("plan_id", "member_id", "status", "created_at", "updated_at"),
+    "purchases": ("plan_id", "member_id", "status", "created_at", "updated_at"),
+    "tags": ("name", "created_at", "updated_at"),
+    "badges": ("name", "created_at", "updated_at"),
+}
+
+# Columns identifying a row within a network
+KEYS: Dict[str, Tuple[str, ...]] = {"space_members": ("space_id", "member_id")}
+
+INDEXES: Dict[str, Tuple[str, ...]] = {
+    "members": ("email", "updated_at"),
+    "spaces": ("name",),
+    "space_members": ("member_id",),
+    "posts": ("space_id", "author_id", "updated_at"),
+    "events": ("space_id", "start_time"),
+    "subscriptions": ("plan_id", "member_id"),
+    "purchases": ("plan_id", "member_id"),
+    "tags": ("name",),
+    "badges": ("name",),
+}
+
+# Resources listed per space, and the iterator that lists them
+PER_SPACE = {"space_members": "iter_members", "posts": "iter_all", "events": "iter_all"}
+
+# Sync order: spaces before the resources listed per space
+RESOURCES = tuple(TABLES)
+
+
+def _key(resource: str) -> Tuple[str, ...]:
+    return KEYS.get(resource, ("id",))
+
+
+def _scalar(value: Any) -> Any:
+    return value if value is None or isinstance(value, (int, float, str)) else str(value)
+
+
+class Mirror:
+    """
+    Local SQLite mirror of one network.
+
+    :meth:`sync` pulls each resource through its ``iter_*`` iterator and
+    writes only the rows whose content changed; rows that disappeared from
+    the API are deleted once a resource has been read completely. Posts,
+    events and space memberships are read space by space. Each resource
+    commits page by page, so a failed sync keeps what it wrote and the next
+    sync completes it.
+
+    Reads never call the API: :meth:`get`, :meth:`find`, :meth:`count` and
+    the helpers below are indexed lookups returning plain dicts. The database
+    runs in WAL mode, so readers in other threads and processes are not
+    blocked by a sync; each thread uses its own connection.
+
+    Attributes:
+        path: SQLite database file
+        network_id: Mirrored network
+
+    Example:
+        >>> mirror = Mirror(client, "network.sqlite3", network_id=12345)
+        >>> mirror.sync()                       # every resource
+        >>> mirror.sync(["members", "spaces"])  # just these
+        >>> mirror.member_by_email("jane@example.com")
+        >>> mirror.find("posts", space_id=67890, order_by="-created_at", limit=20)
+        >>> mirror.space_members(67890)
+    """
+
+    def __init__(self, client: Any, path: str, network_id: int, timeout: float = 30.0):
+        if client._session_class != "Client":
+            raise TypeError("Mirror syncs through a MightyNetworksClient, not the async client")
+        self.client = client
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.network_id = network_id
+        self.timeout = timeout
+        self._local = threading.local()
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            for resource, columns in TABLES.items():
+                key = _key(resource)
+                declared = ", ".join(
+                    f"{column} TEXT COLLATE NOCASE" if column == "email" else column
+                    for column in columns
+                    if column not in key
+                )
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {resource} ("
+                    f"network_id INTEGER NOT NULL, {', '.join(key)}, {declared}, "
+                    "data TEXT NOT NULL, generation INTEGER NOT NULL, "
+                    f"PRIMARY KEY (network_id, {', '.join(key)}))"
+                )
+                for column in INDEXES.get(resource, ()):
+                    connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {resource}_{column} "
+                        f"ON {resource} (network_id, {column})"
+                    )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS mirror_state ("
+                "network_id INTEGER NOT NULL, resource TEXT NOT NULL, "
+                "generation INTEGER NOT NULL, synced_at REAL, "
+                "PRIMARY KEY (network_id, resource))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not cross threads or a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    # -- Sync ----------------------------------------------------------------
+
+    def sync(self, resources: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Pull ``resources`` (default: all of :data:`RESOURCES`) from the API.
+
+        Returns:
+            Per resource: ``fetched``, ``inserted``, ``updated``,
+            ``unchanged`` and ``deleted`` row counts
+
+        Raises:
+            ValueError: If a resource is not mirrored
+            APIError: If a page request fails; rows written so far are kept
+        """
+        wanted = list(RESOURCES if resources is None else resources)
+        for resource in wanted:
+            if resource not in TABLES:
+                raise ValueError(f"Unknown resource {resource!r}; expected one of {RESOURCES}")
+        # Per-space resources need the space list, so spaces go first
+        wanted.sort(key=RESOURCES.index)
+        return {resource: self.sync_resource(resource) for resource in wanted}
+
+    def sync_resource(self, resource: str) -> Dict[str, int]:
+        """Pull one resource completely; see :meth:`sync`."""
+        if resource in PER_SPACE:
+            if self.synced_at("spaces") is None:
+                self.sync_resource("spaces")
+            pages = self._space_pages(resource)
+        else:
+            iterator = getattr(self.client, resource).iter_all(network_id=self.network_id)
+            pages = ((None, page) for page in iterator.pages())
+        generation = self._generation(resource) + 1
+        counts = {"fetched": 0, "inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        for space_id, page in pages:
+            self._write_page(resource, page["data"], space_id, generation, counts)
+        counts["deleted"] = self._finish(resource, generation)
+        return counts
+
+    def _space_pages(self, resource: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        namespace = "spaces" if resource == "space_members" else resource
+        method = getattr(getattr(self.client, namespace), PER_SPACE[resource])
+        for space_id in self.space_ids():
+            for page in method(network_id=self.network_id, space_id=space_id).pages():
+                yield space_id, page
+
+    def _generation(self, resource: str) -> int:
+        row = self._connection().execute(
+            "SELECT generation FROM mirror_state WHERE network_id = ? AND resource = ?",
+            (self.network_id, resource),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _row(self, resource: str, item: Dict[str, Any], space_id: Optional[int]) -> Dict[str, Any]:
+        row = {column: _scalar(item.get(column)) for column in TABLES[resource]}
+        if resource == "space_members":
+            row["space_id"] = space_id
+            row["member_id"] = item.get("member_id", item.get("id"))
+        else:
+            row["id"] = item["id"]
+            if space_id is not None and row.get("space_id") is None:
+                row["space_id"] = space_id
+        row["data"] = self.client.json_codec.dumps(item).decode()
+        return row
+
+    def _write_page(self, resource: str, items: Any, space_id: Optional[int],
+                    generation: int, counts: Dict[str, int]) -> None:
+        if not isinstance(items, list):
+            items = [items] if items else []
+        rows = [self._row(resource, as_dict(item), space_id) for item in items]
+        counts["fetched"] += len(rows)
+        if not rows:
+            return
+        key = _key(resource)
+        connection = self._connection()
+        with connection:
+            # Skip writing rows whose content is unchanged
+            placeholders = ", ".join(["(" + ", ".join("?" * len(key)) + ")"] * len(rows))
+            existing = {
+                tuple(found[:-1]): found[-1]
+                for found in connection.execute(
+                    f"SELECT {', '.join(key)}, data FROM {resource} "
+                    f"WHERE network_id = ? AND ({', '.join(key)}) IN (VALUES {placeholders})",
+                    [self.network_id] + [row[column] for row in rows for column in key],
+                )
+            }
+            changed, unchanged = [], []
+            for row in rows:
+                identity = tuple(row[column] for column in key)
+                previous = existing.get(identity)
+                if previous == row["data"]:
+                    unchanged.append(identity)
+                else:
+                    changed.append(row)
+                    counts["updated" if previous is not None else "inserted"] += 1
+            counts["unchanged"] += len(unchanged)
+
+            columns = key + tuple(c for c in TABLES[resource] if c not in key) + ("data",)
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {resource} (network_id, {', '.join(columns)}, generation) "
+                f"VALUES (?, {', '.join('?' * len(columns))}, ?)",
+                [(self.network_id, *(row[c] for c in columns), generation) for row in changed],
+            )
+            connection.executemany(
+                f"UPDATE {resource} SET generation = ? WHERE network_id = ? AND "
+                + " AND ".join(f"{column} = ?" for column in key),
+                [(generation, self.network_id, *identity) for identity in unchanged],
+            )
+
+    def _finish(self, resource: str, generation: int) -> int:
+        """Delete rows not seen in this pass and record it; return the deleted count."""
+        connection = self._connection()
+        with connection:
+            deleted = connection.execute(
+                f"DELETE FROM {resource} WHERE network_id = ? AND generation < ?",
+                (self.network_id, generation),
+            ).rowcount
+            connection.execute(
+                "INSERT OR REPLACE INTO mirror_state (network_id, resource, generation, synced_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.network_id, resource, generation, time.time()),
+            )
+        return deleted
+
+    def refresh(self, resource: str, item_id: int, **params: Any) -> Optional[Dict[str, Any]]:
+        """
+        Re-read one item with the resource's ``get`` and update or delete its row.
+
+        Events need ``space_id``; it is taken from the mirrored row when not
+        given.
+
+        Returns:
+            The item, or None if the API no longer has it (its row is deleted)
+
+        Raises:
+            APIError: If the request fails for another reason
+        """
+        if resource not in TABLES or resource == "space_members":
+            raise ValueError(f"Cannot refresh {resource!r}")
+        getter = getattr(self.client, resource).get
+        if resource == "events":
+            if "space_id" not in params:
+                row = self.get(resource, item_id)
+                if row is None:
+                    raise ValueError("space_id is required for an event that is not mirrored")
+                params["space_id"] = row.get("space_id")
+            result = getter(self.network_id, params["space_id"], item_id)
+        else:
+            result = getter(self.network_id, item_id)
+
+        connection = self._connection()
+        if not result["status"]:
+            if not result["message"].startswith("Not found"):
+                raise APIError(result["message"], response=result)
+            with connection:
+                connection.execute(
+                    f"DELETE FROM {resource} WHERE network_id = ? AND id = ?",
+                    (self.network_id, item_id),
+                )
+            return None
+        counts = dict.fromkeys(("fetched", "inserted", "updated", "unchanged"), 0)
+        self._write_page(resource, [result["data"]], params.get("space_id"),
+                         self._generation(resource), counts)
+        return as_dict(result["data"])
+
+    def upsert(self, resource: str, items: Iterable[Any], space_id: Optional[int] = None) -> Dict[str, int]:
+        """
+        Insert or update rows from items read elsewhere, without deleting any.
+
+        Feeds the mirror from :class:`~mighty_networks_sdk.watermark.IncrementalSync`,
+        which emits only the records changed since its previous pass.
+
+        Args:
+            resource: Mirrored resource
+            items: Dicts, typed models or lazy items
+            space_id: Space of per-space items without a ``space_id`` field
+
+        Returns:
+            Counts of fetched, inserted, updated and unchanged rows
+        """
+        if resource not in TABLES:
+            raise ValueError(f"Unknown resource {resource!r}; expected one of {RESOURCES}")
+        counts = dict.fromkeys(("fetched", "inserted", "updated", "unchanged"), 0)
+        self._write_page(resource, list(items), space_id, self._generation(resource), counts)
+        return counts
+
+    # -- Queries -------------------------------------------------------------
+
+    def _decode(self, rows: Iterable[Tuple[str]]) -> List[Dict[str, Any]]:
+        loads = self.client.json_codec.loads
+        return [loads(row[0]) for row in rows]
+
+    def get(self, resource: str, item_id: int) -> Optional[Dict[str, Any]]:
+        """Return a mirrored item by ID, or None."""
+        rows = self.find(resource, id=item_id, limit=1)
+        return rows[0] if rows else None
+
+    def find(
+        self,
+        resource: str,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **where: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return mirrored items matching column equality filters.
+
+        Args:
+            resource: Mirrored resource
+            order_by: Column to sort by, ``-column`` for descending
+            limit: Maximum number of items
+            offset: Items to skip
+            **where: Column filters, e.g. ``space_id=67890``; a list or tuple
+                matches any of its values, None matches NULL
+
+        Example:
+            >>> mirror.find("members", order_by="-updated_at", limit=10)
+        """
+        clause, params = self._where(resource, where)
+        sql = f"SELECT data FROM {resource} WHERE {clause}"
+        if order_by:
+            column = order_by.lstrip("-")
+            self._check_columns(resource, [column])
+            sql += f" ORDER BY {column} {'DESC' if order_by.startswith('-') else 'ASC'}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return self._decode(self._connection().execute(sql, params))
+
+    def count(self, resource: str, **where: Any) -> int:
+        """Return the number of mirrored items matching ``where`` (see :meth:`find`)."""
+        clause, params = self._where(resource, where)
+        return self._connection().execute(
+            f"SELECT COUNT(*) FROM {resource} WHERE {clause}", params
+        ).fetchone()[0]
+
+    def _check_columns(self, resource: str, columns: Sequence[str]) -> None:
+        if resource not in TABLES:
+            raise ValueError(f"Unknown resource {resource!r}; expected one of {RESOURCES}")
+        allowed = set(TABLES[resource]) | set(_key(resource))
+        for column in columns:
+            if column not in allowed:
+                raise ValueError(f"{resource} cannot be filtered or sorted by {column!r}; "
+                                 f"mirrored columns are {sorted(allowed)}")
+
+    def _where(self, resource: str, where: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        self._check_columns(resource, list(where))
+        clauses, params = ["network_id = ?"], [self.network_id]
+        for column, value in where.items():
+            if value is None:
+                clauses.append(f"{column} IS NULL")
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                values = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+                params += values
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def member_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Return the member with ``email`` (case-insensitive), or None."""
+        rows = self.find("members", email=email, limit=1)
+        return rows[0] if rows else None
+
+    def space_ids(self) -> List[int]:
+        """Return the IDs of the mirrored spaces."""
+        return [row[0] for row in self._connection().execute(
+            "SELECT id FROM spaces WHERE network_id = ? ORDER BY id", (self.network_id,)
+        )]
+
+    def space_members(self, space_id: int) -> List[Dict[str, Any]]:
+        """Return the memberships of a space, as listed by ``spaces.list_members``."""
+        return self.find("space_members", space_id=space_id, order_by="member_id")
+
+    def member_spaces(self, member_id: int) -> List[Dict[str, Any]]:
+        """Return the spaces a member belongs to."""
+        return self._decode(self._connection().execute(
+            "SELECT spaces.data FROM space_members JOIN spaces "
+            "ON spaces.network_id = space_members.network_id AND spaces.id = space_members.space_id "
+            "WHERE space_members.network_id = ? AND space_members.member_id = ? ORDER BY spaces.id",
+            (self.network_id, member_id),
+        ))
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run SQL against the mirror and return its rows as ``sqlite3.Row``."""
+        connection = self._connection()
+        cursor = connection.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor.execute(sql, params).fetchall()
+
+    def synced_at(self, resource: str) -> Optional[float]:
+        """Return when ``resource`` was last synced completely (Unix time), or None."""
+        row = self._connection().execute(
+            "SELECT synced_at FROM mirror_state WHERE network_id = ? AND resource = ?",
+            (self.network_id, resource),
+        ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self) -> "Mirror":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Mirror(path={self.path!r}, network_id={self.network_id})"
@@ -2,15 +2,160 @@
 Mighty Networks SDK Models
 
 Data models for API request and response objects.
+
+With ``response_mode="typed"`` the client returns these models instead of
+dicts. They use ``__slots__`` so large result sets stay compact; response
+fields without a matching attribute are kept in ``extra``. When msgspec is
+installed, bodies whose fields all match the model are decoded straight into
+models, without building a dict per item first.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Optional, List, Dict, Any, Tuple, Type, TypeVar
 from datetime import datetime
 
+ModelT = TypeVar("ModelT", bound="Model")
+
+# msgspec, or False if it is not installed; looked up on the first typed body
+_msgspec: Any = None
+# (check, decode) msgspec decoders per model and body shape, built on first use
+_decoders: Dict[Tuple[type, bool], Tuple[Any, Any]] = {}
+
+
+class Model:
+    """Base class of the API models."""
+
+    __slots__ = ()
+
+    # Field names other than ``extra``; set by @_slotted
+    _names: frozenset = frozenset()
+
+    # (name, default) of each field other than ``extra``; set by @_slotted
+    _defaults: tuple = ()
+
+    @classmethod
+    def from_dict(cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+        """
+        Build a model from an API item without validation.
+
+        Missing fields are set to their default (None for required fields);
+        unknown fields are kept in ``extra``.
+        """
+        obj = object.__new__(cls)
+        get = data.get
+        for name, default in cls._defaults:
+            setattr(obj, name, get(name, default))
+        known = cls._names
+        obj.extra = None if data.keys() <= known else {
+            key: value for key, value in data.items() if key not in known
+        }
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the item as a dict, including ``extra`` fields."""
+        data = {name: getattr(self, name) for name in self.__slots__ if name != "extra"}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def as_dict(item: Any) -> Any:
+    """Return an item as a plain dict: typed models and lazy items via ``to_dict()``."""
+    if isinstance(item, dict) or not hasattr(item, "to_dict"):
+        return item
+    return item.to_dict()
+
+
+def _msgspec_module() -> Any:
+    """Return the msgspec module, or None if it is not installed."""
+    global _msgspec
+    if _msgspec is None:
+        try:
+            import msgspec
+        except ImportError:
+            _msgspec = False
+        else:
+            _msgspec = msgspec
+    return _msgspec or None
+
+
+def _model_decoders(model: Type["Model"], page: bool) -> Tuple[Any, Any]:
+    """Return the (check, decode) msgspec decoders of a page or a single ``model``."""
+    decoders = _decoders.get((model, page))
+    if decoders is None:
+        msgspec = _msgspec_module()
+        Raw = msgspec.Raw
+        # The model's fields left undecoded; any other field is an error, so
+        # bodies with fields for ``extra`` go through from_dict instead
+        check: Any = msgspec.defstruct(
+            f"{model.__name__}Fields",
+            [(name, Raw, Raw(b"null")) for name in model._names],
+            forbid_unknown_fields=True,
+        )
+        target: Any = model
+        if page:
+            check = msgspec.defstruct("Page", [("items", List[check]), ("links", Any, None)])
+            target = msgspec.defstruct("Page", [("items", List[model]), ("links", Any, None)])
+        decoders = _decoders[(model, page)] = (
+            msgspec.json.Decoder(check), msgspec.json.Decoder(target)
+        )
+    return decoders
+
+
+def decode_models(content: bytes, model: Type[ModelT]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """
+    Decode a JSON body straight into ``model`` instances with msgspec.
+
+    Returns ``(data, links)`` shaped like ``BaseResource._handle_response``:
+    a list of models for a body with ``items``, else a single model. Returns
+    None, for the caller to fall back to :meth:`Model.from_dict`, if msgspec
+    is not installed or the body does not map exactly onto the model: a
+    field without an attribute (kept in ``extra`` by ``from_dict``), a
+    missing required field or a value of another type.
+    """
+    msgspec = _msgspec_module()
+    if msgspec is None:
+        return None
+    for page in (True, False):
+        check, decode = _model_decoders(model, page)
+        try:
+            check.decode(content)
+            decoded = decode.decode(content)
+        except msgspec.ValidationError:
+            continue
+        except msgspec.DecodeError:
+            return None
+        if page:
+            return decoded.items, decoded.links or {}
+        return decoded, {}
+    return None
+
+
+def _slotted(cls):
+    """Rebuild a model dataclass with ``__slots__``."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in names}
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted._defaults = tuple(
+        (f.name, None if f.default is MISSING else f.default)
+        for f in fields(slotted)
+        if f.name != "extra"
+    )
+    slotted._names = frozenset(name for name, _ in slotted._defaults)
+    return slotted
+
+
+def _extra_field():
+    # Fields of the response without a matching attribute, or None
+    return field(default=None, repr=False, compare=False)
+
 
+@_slotted
 @dataclass
-class Member:
+class Member(Model):
     """Represents a network member."""
     id: int
     email: str
@@ -26,10 +171,12 @@ class Member:
     avatar: Optional[str] = None
     categories: Optional[str] = None
     ambassador_level: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class Space:
+class Space(Model):
     """Represents a space within a network."""
     id: int
     name: str
@@ -39,10 +186,12 @@ class Space:
     description: Optional[str] = None
     is_public: Optional[bool] = None
     member_count: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class Post:
+class Post(Model):
     """Represents a post in a space."""
     id: int
     title: str
@@ -55,10 +204,12 @@ class Post:
     comment_count: Optional[int] = None
     like_count: Optional[int] = None
     is_pinned: Optional[bool] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class Event:
+class Event(Model):
     """Represents an event."""
     id: int
     title: str
@@ -71,10 +222,12 @@ class Event:
     location: Optional[str] = None
     is_online: Optional[bool] = None
     max_attendees: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class Plan:
+class Plan(Model):
     """Represents a membership plan."""
     id: int
     name: str
@@ -86,10 +239,12 @@ class Plan:
     updated_at: str
     is_active: Optional[bool] = None
     trial_days: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class CustomField:
+class CustomField(Model):
     """Represents a custom field."""
     id: int
     name: str
@@ -98,10 +253,12 @@ class CustomField:
     created_at: str
     updated_at: str
     options: Optional[List[str]] = None
+    extra: Optional[Dict[str, Any]] = _extra_field()
 
 
+@_slotted
 @dataclass
-class Badge:
+class Badge(Model):
     """Represents a badge."""
     id: int
     name: str
@@ -109,3 +266,4 @@ class Badge:
     image_url: str
     created_at: str
     updated_at: str
+    extra: Optional[Dict[str, Any]] = _extra_field()
@@ -4,6 +4,7 @@ Network Resource
 
 from typing import Dict, Any, Optional, List
 from .base_resource import BaseResource
+from .async_base_resource import AsyncBaseResource
 
 
 class NetworkResource(BaseResource):
@@ -25,4 +26,8 @@ class NetworkResource(BaseResource):
             >>> client.network.show(network_id=12345)
         """
         endpoint = f"/admin/v1/networks/{network_id}"
-        return self._get(endpoint)
\ No newline at end of file
+        return self._get(endpoint)
+
+
+class AsyncNetworkResource(AsyncBaseResource, NetworkResource):
+    """Async variant of :class:`NetworkResource`; every method is awaitable."""
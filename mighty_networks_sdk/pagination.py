@@ -0,0 +1,393 @@
+"""
+Mighty Networks SDK Pagination
+
+Lazy iterators that follow ``links.next`` across every page of a list
+endpoint, yielding one item at a time.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from .columnar import Columns
+from .exceptions import APIError
+
+# Query parameters that hold a predictable page number
+PAGE_PARAMS = ("page", "page_number")
+
+
+def _page_items(page: Dict[str, Any]) -> List[Any]:
+    """Return the items of a page result as a list."""
+    items = page["data"]
+    if isinstance(items, list):
+        return items
+    return [items] if items else []
+
+
+def _next_url(page: Dict[str, Any], current: str) -> Optional[str]:
+    """Return the next page URL, or None on the last page."""
+    next_url = (page.get("links") or {}).get("next")
+    if not next_url or next_url == current:
+        return None
+    return next_url
+
+
+def _check_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    if not page["status"]:
+        raise APIError(page["message"], response=page)
+    return page
+
+
+def _page_number(url: str) -> Optional[int]:
+    """Return the page number carried by ``url``, if it has one."""
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key in PAGE_PARAMS and value.isdigit():
+            return int(value)
+    return None
+
+
+def _with_page_number(url: str, number: int) -> str:
+    """Return ``url`` with its page number replaced by ``number``."""
+    parts = urlsplit(url)
+    query = [
+        (key, str(number) if key in PAGE_PARAMS else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class PaginationStats:
+    """Throughput counters for one pass over a paginator."""
+
+    def __init__(self):
+        self.pages = 0
+        self.items = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def record(self, page: Dict[str, Any]) -> None:
+        self.pages += 1
+        self.items += len(_page_items(page))
+        self.elapsed = time.monotonic() - self.started
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"PaginationStats(pages={self.pages}, items={self.items}, "
+            f"pages_per_second={self.pages_per_second:.1f})"
+        )
+
+
+class Paginator:
+    """
+    Iterate lazily over every item of a paginated list endpoint.
+
+    Only one page is held in memory at a time. Iterating yields items;
+    :meth:`pages` yields the raw page results including their ``links``.
+    Throughput of the current pass is available on :attr:`stats`.
+
+    Example:
+        >>> for member in client.members.iter_all(network_id=12345):
+        ...     print(member["email"])
+        >>>
+        >>> # Keep up to 4 pages downloading while items are processed
+        >>> members = client.members.iter_all(network_id=12345).prefetch(4)
+        >>> for member in members:
+        ...     process(member)
+        >>> members.stats.pages_per_second
+        >>>
+        >>> # Collect straight into columns (needs pyarrow / pandas / numpy)
+        >>> table = client.purchases.iter_all(network_id=12345).to_arrow()
+
+    Raises:
+        APIError: If a page request fails
+    """
+
+    def __init__(
+        self,
+        resource,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch_pages: int = 0,
+        model: Optional[type] = None,
+    ):
+        self.resource = resource
+        self.endpoint = endpoint
+        self.params = params
+        self.prefetch_pages = prefetch_pages
+        self.model = model
+        self.stats = PaginationStats()
+
+    def prefetch(self, pages: int) -> "Paginator":
+        """
+        Return a copy of this paginator that keeps up to ``pages`` pages in flight.
+
+        When next links carry a page number, the following pages are
+        predicted and requested concurrently. Otherwise each next link is
+        followed in the background as soon as its page arrives. At most
+        ``pages`` pages are buffered, so memory stays flat.
+
+        Args:
+            pages: Number of pages to download ahead of the consumer
+
+        Returns:
+            New paginator in prefetch mode
+        """
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        return type(self)(
+            self.resource, self.endpoint, self.params, prefetch_pages=pages, model=self.model
+        )
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return _check_page(self.resource._request("GET", url, params=params, model=self.model))
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield each page result, following ``links.next``."""
+        stats = self.stats = PaginationStats()
+        page = self._fetch(self.endpoint, self.params)
+        stats.record(page)
+        yield page
+
+        # The next link already carries the query string
+        url = _next_url(page, self.endpoint)
+        if url is None:
+            return
+        if not self.prefetch_pages:
+            remaining = self._sequential_pages(url)
+        elif _page_number(url) is not None:
+            remaining = self._numbered_pages(url)
+        else:
+            remaining = self._lookahead_pages(url)
+
+        for page in remaining:
+            stats.record(page)
+            yield page
+
+    def _sequential_pages(self, url: Optional[str]) -> Iterator[Dict[str, Any]]:
+        while url:
+            page = self._fetch(url)
+            yield page
+            url = _next_url(page, url)
+
+    def _numbered_pages(self, url: str) -> Iterator[Dict[str, Any]]:
+        # Predict page numbers and keep ``prefetch_pages`` requests in flight
+        number = _page_number(url)
+        with ThreadPoolExecutor(max_workers=self.prefetch_pages) as executor:
+            pending: Deque = deque()
+            try:
+                for offset in range(self.prefetch_pages):
+                    predicted = _with_page_number(url, number + offset)
+                    pending.append((predicted, executor.submit(self._fetch, predicted)))
+                number += self.prefetch_pages
+
+                while pending:
+                    current, future = pending.popleft()
+                    page = future.result()
+                    if not _page_items(page):
+                        return
+                    yield page
+                    if _next_url(page, current) is None:
+                        return
+                    predicted = _with_page_number(url, number)
+                    pending.append((predicted, executor.submit(self._fetch, predicted)))
+                    number += 1
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _lookahead_pages(self, url: str) -> Iterator[Dict[str, Any]]:
+        # Follow next links in a background thread into a bounded buffer
+        buffer: "queue.Queue" = queue.Queue(maxsize=self.prefetch_pages)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            # Give up once the consumer has stopped iterating
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for page in self._sequential_pages(url):
+                    if not put(page):
+                        return
+                put(done)
+            except BaseException as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                page = buffer.get()
+                if page is done:
+                    return
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+        finally:
+            stop.set()
+
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.pages():
+            yield from _page_items(page)
+
+    def to_columns(self) -> Columns:
+        """
+        Collect every item into typed column buffers, one page at a time.
+
+        Integer ids and timestamps are stored as native 64-bit values and
+        strings are dictionary-encoded, so no page outlives its own decode.
+        """
+        columns = Columns()
+        for page in self.pages():
+            columns.extend(_page_items(page))
+        return columns
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Collect every item into a dict of NumPy arrays (requires numpy)."""
+        return self.to_columns().to_numpy()
+
+    def to_arrow(self) -> Any:
+        """Collect every item into a ``pyarrow.Table`` (requires pyarrow)."""
+        return self.to_columns().to_arrow()
+
+    def to_pandas(self) -> Any:
+        """Collect every item into a ``pandas.DataFrame`` (requires pandas)."""
+        return self.to_columns().to_pandas()
+
+
+class AsyncPaginator(Paginator):
+    """
+    Async variant of :class:`Paginator`, used with ``async for``.
+
+    Example:
+        >>> async for member in client.members.iter_all(network_id=12345):
+        ...     print(member["email"])
+    """
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:  # type: ignore[override]
+        return _check_page(
+            await self.resource._request("GET", url, params=params, model=self.model)
+        )
+
+    async def pages(self) -> AsyncIterator[Dict[str, Any]]:  # type: ignore[override]
+        """Yield each page result, following ``links.next``."""
+        stats = self.stats = PaginationStats()
+        page = await self._fetch(self.endpoint, self.params)
+        stats.record(page)
+        yield page
+
+        url = _next_url(page, self.endpoint)
+        if url is None:
+            return
+        if not self.prefetch_pages:
+            remaining = self._sequential_pages(url)
+        elif _page_number(url) is not None:
+            remaining = self._numbered_pages(url)
+        else:
+            remaining = self._lookahead_pages(url)
+
+        async for page in remaining:
+            stats.record(page)
+            yield page
+
+    async def _sequential_pages(self, url: Optional[str]) -> AsyncIterator[Dict[str, Any]]:  # type: ignore[override]
+        while url:
+            page = await self._fetch(url)
+            yield page
+            url = _next_url(page, url)
+
+    async def _numbered_pages(self, url: str) -> AsyncIterator[Dict[str, Any]]:  # type: ignore[override]
+        number = _page_number(url)
+        pending: Deque = deque()
+        try:
+            for offset in range(self.prefetch_pages):
+                predicted = _with_page_number(url, number + offset)
+                pending.append((predicted, asyncio.ensure_future(self._fetch(predicted))))
+            number += self.prefetch_pages
+
+            while pending:
+                current, task = pending.popleft()
+                page = await task
+                if not _page_items(page):
+                    return
+                yield page
+                if _next_url(page, current) is None:
+                    return
+                predicted = _with_page_number(url, number)
+                pending.append((predicted, asyncio.ensure_future(self._fetch(predicted))))
+                number += 1
+        finally:
+            for _, task in pending:
+                task.cancel()
+            # Retrieve results of abandoned tasks so errors are not logged
+            for _, task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()
+
+    async def _lookahead_pages(self, url: str) -> AsyncIterator[Dict[str, Any]]:  # type: ignore[override]
+        buffer: "asyncio.Queue" = asyncio.Queue(maxsize=self.prefetch_pages)
+        done = object()
+
+        async def produce():
+            try:
+                async for page in self._sequential_pages(url):
+                    await buffer.put(page)
+                await buffer.put(done)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await buffer.put(e)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                page = await buffer.get()
+                if page is done:
+                    return
+                if isinstance(page, BaseException):
+                    raise page
+                yield page
+        finally:
+            producer.cancel()
+
+    def __iter__(self):
+        raise TypeError("AsyncPaginator must be iterated with 'async for'")
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for page in self.pages():
+            for item in _page_items(page):
+                yield item
+
+    async def to_columns(self) -> Columns:  # type: ignore[override]
+        columns = Columns()
+        async for page in self.pages():
+            columns.extend(_page_items(page))
+        return columns
+
+    async def to_numpy(self) -> Dict[str, Any]:  # type: ignore[override]
+        return (await self.to_columns()).to_numpy()
+
+    async def to_arrow(self) -> Any:  # type: ignore[override]
+        return (await self.to_columns()).to_arrow()
+
+    async def to_pandas(self) -> Any:  # type: ignore[override]
+        return (await self.to_columns()).to_pandas()
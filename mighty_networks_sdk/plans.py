@@ -6,6 +6,9 @@ Handles all membership plan-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .models import Member, Plan
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class PlansResource(BaseResource):
@@ -33,7 +36,27 @@ class PlansResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/plans"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Plan)
+
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every plan in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one plan at a time
+
+        Example:
+            >>> for plan in client.plans.iter_all(network_id=12345):
+            ...     print(plan["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/plans"
+        return self._paginate(endpoint, model=Plan)
 
     def get(self, network_id: int, plan_id: int) -> Dict[str, Any]:
         """
@@ -50,7 +73,7 @@ class PlansResource(BaseResource):
             >>> client.plans.get(network_id=12345, plan_id=789)
         """
         endpoint = f"/admin/v1/networks/{network_id}/plans/{plan_id}/"
-        return self._get(endpoint)
+        return self._get(endpoint, model=Plan)
 
     def create(
         self,
@@ -166,4 +189,30 @@ class PlansResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/plans/{plan_id}/subscribers"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Member)
+
+    def iter_subscribers(
+        self,
+        network_id: int,
+        plan_id: int
+    ) -> Paginator:
+        """
+        Iterate over every subscriber of a plan, following pagination links.
+
+        Args:
+            network_id: The network ID
+            plan_id: The plan ID
+
+        Returns:
+            Lazy iterator yielding one subscriber at a time
+
+        Example:
+            >>> for subscriber in client.plans.iter_subscribers(network_id=12345, plan_id=789):
+            ...     print(subscriber["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/plans/{plan_id}/subscribers"
+        return self._paginate(endpoint, model=Member)
+
+
+class AsyncPlansResource(AsyncBaseResource, PlansResource):
+    """Async variant of :class:`PlansResource`; every method is awaitable."""
@@ -6,6 +6,8 @@ Handles all poll-related API operations.
 
 from typing import Dict, Any, Optional, List
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class PollsResource(BaseResource):
@@ -37,6 +39,28 @@ class PollsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int,
+        space_id: int
+    ) -> Paginator:
+        """
+        Iterate over every poll in a space, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+
+        Returns:
+            Lazy iterator yielding one poll at a time
+
+        Example:
+            >>> for poll in client.polls.iter_all(network_id=12345, space_id=67890):
+            ...     print(poll["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/polls"
+        return self._paginate(endpoint)
+
     def get(
         self,
         network_id: int,
@@ -161,3 +185,7 @@ class PollsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/polls/{poll_id}/"
         return self._delete(endpoint)
+
+
+class AsyncPollsResource(AsyncBaseResource, PollsResource):
+    """Async variant of :class:`PollsResource`; every method is awaitable."""
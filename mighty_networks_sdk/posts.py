@@ -6,6 +6,9 @@ Handles all post-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .models import Post
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class PostsResource(BaseResource):
@@ -37,7 +40,30 @@ class PostsResource(BaseResource):
         params = {
             'space_id' : space_id
         }
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Post)
+
+    def iter_all(
+        self,
+        network_id: int,
+        space_id: int
+    ) -> Paginator:
+        """
+        Iterate over every post in a space, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+
+        Returns:
+            Lazy iterator yielding one post at a time
+
+        Example:
+            >>> for post in client.posts.iter_all(network_id=12345, space_id=67890):
+            ...     print(post["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/posts"
+        params = {'space_id': space_id}
+        return self._paginate(endpoint, params=params, model=Post)
 
     def get(
         self,
@@ -61,7 +87,7 @@ class PostsResource(BaseResource):
             ... )
         """
         endpoint = f"/admin/v1/networks/{network_id}/posts/{post_id}/"
-        return self._get(endpoint)
+        return self._get(endpoint, model=Post)
 
     def create(
         self,
@@ -218,4 +244,8 @@ class PostsResource(BaseResource):
             ... )
         """
         endpoint = f"/admin/v1/networks/{network_id}/posts/{post_id}/mute?user_id={user_id}"
-        return self._delete(endpoint)
\ No newline at end of file
+        return self._delete(endpoint)
+
+
+class AsyncPostsResource(AsyncBaseResource, PostsResource):
+    """Async variant of :class:`PostsResource`; every method is awaitable."""
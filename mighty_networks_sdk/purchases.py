@@ -6,6 +6,8 @@ Handles all purchase-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class PurchasesResource(BaseResource):
@@ -35,6 +37,26 @@ class PurchasesResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every purchase in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one purchase at a time
+
+        Example:
+            >>> for purchase in client.purchases.iter_all(network_id=12345):
+            ...     print(purchase["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/purchases"
+        return self._paginate(endpoint)
+
     def get(
         self,
         network_id: int,
@@ -92,3 +114,7 @@ class PurchasesResource(BaseResource):
         if reason:
             data["reason"] = reason
         return self._post(endpoint, json=data)
+
+
+class AsyncPurchasesResource(AsyncBaseResource, PurchasesResource):
+    """Async variant of :class:`PurchasesResource`; every method is awaitable."""
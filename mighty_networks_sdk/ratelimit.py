@@ -0,0 +1,145 @@
+"""
+Mighty Networks SDK Rate Limiting
+
+Client-side token buckets that pace requests under the per-token quota.
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    Interface for client-side rate limiters.
+
+    Subclasses implement :meth:`reserve`, which claims tokens and returns how
+    long the caller must wait before sending. Reservations are first come,
+    first served, so waiting callers do not starve each other.
+    """
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Claim ``tokens`` and return the seconds to wait before proceeding."""
+        raise NotImplementedError
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until ``tokens`` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """Wait on the event loop until ``tokens`` are available."""
+        import asyncio
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _take(available: float, updated: float, now: float, rate: float,
+          capacity: float, tokens: float):
+    """Refill a bucket and take ``tokens``; return (available, delay)."""
+    available = min(capacity, available + max(0.0, now - updated) * rate)
+    available -= tokens
+    delay = -available / rate if available < 0 else 0.0
+    return available, delay
+
+
+class TokenBucket(RateLimiter):
+    """
+    Thread-safe token bucket shared by all threads of one process.
+
+    Attributes:
+        rate: Sustained requests per second
+        capacity: Burst size; requests allowed back to back (default: rate)
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, TokenBucket
+        >>>
+        >>> client = MightyNetworksClient(
+        ...     api_token="your_api_token_here",
+        ...     rate_limiter=TokenBucket(rate=10, capacity=20),
+        ... )
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._available = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._available, delay = _take(
+                self._available, self._updated, now, self.rate, self.capacity, tokens
+            )
+            self._updated = now
+            return delay
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, capacity={self.capacity})"
+
+
+class FileTokenBucket(RateLimiter):
+    """
+    Token bucket coordinated across processes through a lock file.
+
+    Every process (and thread) that points at the same ``path`` draws from
+    one bucket, so the combined request rate of several workers stays under
+    the quota of a shared API token. Requires POSIX ``fcntl`` locking.
+
+    Attributes:
+        path: File holding the shared bucket state
+        rate: Sustained requests per second across all processes
+        capacity: Burst size (default: rate)
+
+    Example:
+        >>> limiter = FileTokenBucket("/tmp/mighty-networks.bucket", rate=10)
+        >>> client = MightyNetworksClient(api_token="...", rate_limiter=limiter)
+    """
+
+    _STATE = struct.Struct("dd")  # available tokens, wall-clock timestamp
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket requires fcntl (POSIX systems only)")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.path = path
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, self._STATE.size, 0)
+                now = time.time()
+                if len(raw) == self._STATE.size:
+                    available, updated = self._STATE.unpack(raw)
+                else:
+                    available, updated = self.capacity, now
+                available, delay = _take(
+                    available, updated, now, self.rate, self.capacity, tokens
+                )
+                os.pwrite(fd, self._STATE.pack(available, now), 0)
+                return delay
+            finally:
+                os.close(fd)
+
+    def __repr__(self) -> str:
+        return f"FileTokenBucket(path={self.path!r}, rate={self.rate}, capacity={self.capacity})"
@@ -0,0 +1,175 @@
+"""
+Mighty Networks SDK Retry Policy
+
+Decides when a failed request is retried and how long to wait before the
+next attempt.
+"""
+
+import random
+import time
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional
+
+if TYPE_CHECKING:  # httpx is imported on the first request
+    import httpx
+
+# Idempotent methods are retried by default
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Reset timestamps above this are epoch seconds rather than a delay
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff, jitter and ``Retry-After`` support.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first (default: 3)
+        backoff_factor: Base delay in seconds, doubled after each attempt (default: 0.5)
+        max_backoff: Upper bound for a single delay in seconds (default: 30)
+        jitter: Randomize delays ("full jitter") to spread out retries (default: True)
+        retry_statuses: Status codes that trigger a retry (default: 429, 500, 502, 503, 504)
+        retry_methods: HTTP methods that are retried (default: idempotent methods)
+        retry_post: Also retry POST requests (default: False)
+        respect_retry_after: Wait as long as ``Retry-After`` or rate-limit
+            reset headers ask, up to ``max_retry_after`` (default: True)
+        max_retry_after: Longest server-requested wait honoured, in seconds (default: 60)
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, RetryPolicy
+        >>>
+        >>> client = MightyNetworksClient(
+        ...     api_token="your_api_token_here",
+        ...     retry=RetryPolicy(max_attempts=5, retry_post=True),
+        ... )
+        >>>
+        >>> # Disable retries
+        >>> client = MightyNetworksClient(
+        ...     api_token="your_api_token_here",
+        ...     retry=RetryPolicy(max_attempts=1),
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        retry_post: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        if retry_post:
+            self.retry_methods |= {"POST"}
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Return the backoff delay after the given (1-based) attempt."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of attempts made so far
+            response: Response of the attempt, if one was received
+            error: Transport error of the attempt, if one was raised
+
+        Returns:
+            Seconds to wait before the next attempt, or None to stop
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if error is not None:
+            if method.upper() in self.retry_methods or _not_sent(error):
+                return self.backoff(attempt)
+            return None
+
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+        if method.upper() not in self.retry_methods:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after:
+            requested = parse_retry_after(response.headers)
+            if requested is not None:
+                delay = max(delay, min(requested, self.max_retry_after))
+        return delay
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"backoff_factor={self.backoff_factor}, "
+            f"retry_methods={sorted(self.retry_methods)})"
+        )
+
+
+def _not_sent(error: Exception) -> bool:
+    """Return whether ``error`` was raised before the request reached the server."""
+    import httpx
+
+    # Safe to retry for any method
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the server-requested wait in seconds, if any.
+
+    Understands ``Retry-After`` (seconds or HTTP date) and the
+    ``RateLimit-Reset`` / ``X-RateLimit-Reset`` headers (seconds or epoch time).
+    """
+    value = headers.get("Retry-After")
+    if value:
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    for name in ("RateLimit-Reset", "X-RateLimit-Reset"):
+        value = headers.get(name)
+        if not value:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            continue
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        return max(0.0, reset)
+
+    return None
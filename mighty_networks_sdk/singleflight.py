@@ -0,0 +1,137 @@
+"""
+Mighty Networks SDK Request Coalescing
+
+Single-flight execution: concurrent identical GET requests share one HTTP
+call and one parsed result.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+from .cache import freeze, thaw
+
+if TYPE_CHECKING:  # asyncio is imported by the first async caller
+    import asyncio
+
+
+class _Flight:
+    """One in-flight call and the callers waiting on it."""
+
+    __slots__ = ("done", "task", "result", "error", "shared", "snapshot")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.task: Optional["asyncio.Future"] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self.shared = 0
+        self.snapshot: Optional[bytes] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical GET requests into one HTTP call.
+
+    The first caller for a URL (with its query parameters) performs the
+    request; callers arriving while it is in flight wait for it and receive
+    their own copy of its result instead of calling the API again. Once the
+    call completes, the next caller starts a new one, so results are never
+    older than the request that produced them. Works for threads and asyncio
+    tasks; async callers are coalesced per event loop.
+
+    Attributes:
+        calls: HTTP calls actually made through the coalescer
+        saved: Calls avoided by sharing an in-flight result
+
+    Example:
+        >>> from mighty_networks_sdk import MightyNetworksClient, SingleFlight
+        >>>
+        >>> flights = SingleFlight()
+        >>> client = MightyNetworksClient(api_token="your_api_token_here", single_flight=flights)
+        >>> # 50 threads calling client.network.show(12345) at once make one call
+        >>> flights.stats()
+        {'calls': 1, 'saved': 49, 'in_flight': 0}
+    """
+
+    def __init__(self):
+        self._flights: Dict[Any, _Flight] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.saved = 0
+
+    def _join(self, key: Any) -> Tuple[_Flight, bool]:
+        """Return the flight for ``key`` and whether the caller leads it."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.shared += 1
+                self.saved += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            self.calls += 1
+            return flight, True
+
+    def _land(self, key: Any, flight: _Flight) -> None:
+        # Unregister before followers read, so the snapshot covers all of them
+        with self._lock:
+            del self._flights[key]
+            shared = flight.shared
+        if shared and flight.error is None:
+            flight.snapshot = freeze(flight.result)
+
+    def do(self, key: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run ``call`` unless an identical call is in flight; return its result."""
+        flight, leader = self._join(key)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return thaw(flight.snapshot)
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(key, flight)
+            flight.done.set()
+        return flight.result
+
+    async def do_async(
+        self, key: str, call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`do`; ``call`` returns an awaitable."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+        flight, leader = self._join(key)
+        if leader:
+            flight.task = loop.create_task(self._run(key, flight, call))
+        # Shielded, so a cancelled caller does not cancel the shared call
+        result = await asyncio.shield(flight.task)
+        return result if leader else thaw(flight.snapshot)
+
+    async def _run(
+        self, key: Any, flight: _Flight, call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        try:
+            flight.result = await call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(key, flight)
+        return flight.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of calls made and saved."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "saved": self.saved,
+                "in_flight": len(self._flights),
+            }
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(calls={self.calls}, saved={self.saved})"
@@ -4,8 +4,11 @@ Spaces Resource
 Handles all space-related API operations.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from .base_resource import BaseResource
+from .models import Member, Space, as_dict
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class SpacesResource(BaseResource):
@@ -37,7 +40,27 @@ class SpacesResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Space)
+
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every space in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one space at a time
+
+        Example:
+            >>> for space in client.spaces.iter_all(network_id=12345):
+            ...     print(space["name"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces"
+        return self._paginate(endpoint, model=Space)
 
     def get(self, network_id: int, space_id: int) -> Dict[str, Any]:
         """
@@ -54,7 +77,7 @@ class SpacesResource(BaseResource):
             >>> client.spaces.get(network_id=12345, space_id=67890)
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}"
-        return self._get(endpoint)
+        return self._get(endpoint, model=Space)
 
     def create(
         self,
@@ -154,7 +177,29 @@ class SpacesResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/members"
         params = {}
-        return self._get(endpoint, params=params)
+        return self._get(endpoint, params=params, model=Member)
+
+    def iter_members(
+        self,
+        network_id: int,
+        space_id: int
+    ) -> Paginator:
+        """
+        Iterate over every member of a space, following pagination links.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+
+        Returns:
+            Lazy iterator yielding one member at a time
+
+        Example:
+            >>> for member in client.spaces.iter_members(network_id=12345, space_id=67890):
+            ...     print(member["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/members"
+        return self._paginate(endpoint, model=Member)
 
     def add_member(
         self,
@@ -199,7 +244,7 @@ class SpacesResource(BaseResource):
             >>> client.spaces.get_member(network_id=12345, space_id=67890, member_id=12331)
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/members/{member_id}"
-        return self._get(endpoint)
+        return self._get(endpoint, model=Member)
 
     def update_member_role(
         self,
@@ -250,4 +295,147 @@ class SpacesResource(BaseResource):
             >>> client.spaces.remove_member(network_id=12345, space_id=67890, member_id=67890)
         """
         endpoint = f"/admin/v1/networks/{network_id}/spaces/{space_id}/members/{member_id}"
-        return self._delete(endpoint)
\ No newline at end of file
+        return self._delete(endpoint)
+
+    def enroll(
+        self,
+        network_id: int,
+        space_id: int,
+        add: Iterable[int] = (),
+        remove: Iterable[int] = (),
+        members: Optional[Iterable[int]] = None,
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Add and remove many users in a space, sending only the needed calls.
+
+        The space's current members are read with one paginated scan; users
+        already in the space are not added again and users not in it are not
+        removed. The remaining ``add_member`` and ``remove_member`` calls run
+        concurrently under the client's rate limiters.
+
+        Args:
+            network_id: The network ID
+            space_id: The space ID
+            add: User IDs that should be members
+            remove: User IDs that should not be members
+            members: The complete set of user IDs the space should have;
+                adds the missing ones and removes the others. Cannot be
+                combined with ``add`` or ``remove``
+            concurrency: Calls in flight at once (default: 8)
+
+        Returns:
+            Summary report: ``members_before``, ``added``, ``removed``,
+            ``already_members``, ``not_members``, ``failed`` (one dict per
+            failed call with ``user_id``, ``action`` and ``message``),
+            ``seconds`` and ``per_second``
+
+        Raises:
+            APIError: If the member scan fails
+            ValueError: If a user ID is both added and removed
+
+        Example:
+            >>> report = client.spaces.enroll(12345, 67890, add=buyer_ids, remove=lapsed_ids)
+            >>> report["added"], report["already_members"], len(report["failed"])
+            (1480, 20, 0)
+        """
+        current = {_member_id(member) for member in self.iter_members(network_id, space_id)}
+        plan = _Enrollment(space_id, current, add, remove, members)
+        run = self._bulk(plan.steps, self._enrollment_call(network_id, space_id), concurrency)
+        return plan.report(run.run(), run.summary())
+
+    def _enrollment_call(self, network_id: int, space_id: int) -> Callable[[Tuple[str, int]], Any]:
+        def call(step: Tuple[str, int]) -> Any:
+            action, user_id = step
+            if action == "add":
+                return self.add_member(network_id, space_id, user_id)
+            return self.remove_member(network_id, space_id, user_id)
+
+        return call
+
+
+def _member_id(member: Any) -> Any:
+    member = as_dict(member)
+    return member.get("member_id", member.get("id"))
+
+
+def _by_key(user_ids: Iterable[Any]) -> Dict[str, Any]:
+    """Map each distinct user ID, keyed by ``str``, to its first spelling."""
+    keyed: Dict[str, Any] = {}
+    for user_id in user_ids:
+        keyed.setdefault(str(user_id), user_id)
+    return keyed
+
+
+class _Enrollment:
+    """The calls needed to enroll users in a space, and their report."""
+
+    def __init__(
+        self,
+        space_id: int,
+        current: Set[int],
+        add: Iterable[int],
+        remove: Iterable[int],
+        members: Optional[Iterable[int]],
+    ):
+        # IDs are compared as strings, so "1" read from a CSV matches member 1;
+        # each call still sends the ID as the caller gave it
+        adding, removing = _by_key(add), _by_key(remove)
+        present = _by_key(current)
+        if members is not None:
+            if adding or removing:
+                raise ValueError("Pass either members or add/remove, not both")
+            wanted = _by_key(members)
+            adding = {key: user_id for key, user_id in wanted.items() if key not in present}
+            removing = {key: user_id for key, user_id in present.items() if key not in wanted}
+        overlap = adding.keys() & removing.keys()
+        if overlap:
+            raise ValueError(f"User IDs both added and removed: {sorted(overlap)[:10]}")
+        self.space_id = space_id
+        self.current = current
+        # Adds first, so a user moving between spaces is never in neither
+        adds = [("add", user_id) for key, user_id in adding.items() if key not in present]
+        removes = [("remove", user_id) for key, user_id in removing.items() if key in present]
+        self.steps: List[Tuple[str, int]] = adds + removes
+        self.already_members = len(adding) - len(adds)
+        self.not_members = len(removing) - len(removes)
+
+    def report(self, results: List[Dict[str, Any]], summary: Dict[str, Any]) -> Dict[str, Any]:
+        done = {"add": 0, "remove": 0}
+        failed = []
+        for result in results:
+            action, user_id = result["row"]
+            if result["status"]:
+                done[action] += 1
+            else:
+                failed.append({"user_id": user_id, "action": action, "message": result["message"]})
+        return {
+            "space_id": self.space_id,
+            "members_before": len(self.current),
+            "added": done["add"],
+            "removed": done["remove"],
+            "already_members": self.already_members,
+            "not_members": self.not_members,
+            "failed": failed,
+            "seconds": summary["seconds"],
+            "per_second": summary["per_second"],
+        }
+
+
+class AsyncSpacesResource(AsyncBaseResource, SpacesResource):
+    """Async variant of :class:`SpacesResource`; every method is awaitable."""
+
+    async def enroll(  # type: ignore[override]
+        self,
+        network_id: int,
+        space_id: int,
+        add: Iterable[int] = (),
+        remove: Iterable[int] = (),
+        members: Optional[Iterable[int]] = None,
+        concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`SpacesResource.enroll`."""
+        current = {_member_id(member) async for member in self.iter_members(network_id, space_id)}
+        plan = _Enrollment(space_id, current, add, remove, members)
+        run = self._bulk(plan.steps, self._enrollment_call(network_id, space_id), concurrency)
+        return plan.report(await run.run(), run.summary())
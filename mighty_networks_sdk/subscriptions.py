@@ -6,6 +6,8 @@ Handles all subscription-related API operations.
 
 from typing import Dict, Any, Optional
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class SubscriptionsResource(BaseResource):
@@ -35,6 +37,26 @@ class SubscriptionsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every subscription in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one subscription at a time
+
+        Example:
+            >>> for subscription in client.subscriptions.iter_all(network_id=12345):
+            ...     print(subscription["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/subscriptions"
+        return self._paginate(endpoint)
+
     def get(
         self,
         network_id: int,
@@ -88,3 +110,7 @@ class SubscriptionsResource(BaseResource):
         if reason:
             data["reason"] = reason
         return self._post(endpoint, json=data)
+
+
+class AsyncSubscriptionsResource(AsyncBaseResource, SubscriptionsResource):
+    """Async variant of :class:`SubscriptionsResource`; every method is awaitable."""
@@ -6,6 +6,8 @@ Handles all tag-related API operations.
 
 from typing import Dict, Any, Optional, List
 from .base_resource import BaseResource
+from .pagination import Paginator
+from .async_base_resource import AsyncBaseResource
 
 
 class TagsResource(BaseResource):
@@ -35,6 +37,26 @@ class TagsResource(BaseResource):
         params = {}
         return self._get(endpoint, params=params)
 
+    def iter_all(
+        self,
+        network_id: int
+    ) -> Paginator:
+        """
+        Iterate over every tag in a network, following pagination links.
+
+        Args:
+            network_id: The network ID
+
+        Returns:
+            Lazy iterator yielding one tag at a time
+
+        Example:
+            >>> for tag in client.tags.iter_all(network_id=12345):
+            ...     print(tag["id"])
+        """
+        endpoint = f"/admin/v1/networks/{network_id}/tags"
+        return self._paginate(endpoint)
+
     def get(self, network_id: int, tag_id: int) -> Dict[str, Any]:
         """
         Get a specific tag by ID.
@@ -122,3 +144,7 @@ class TagsResource(BaseResource):
         """
         endpoint = f"/admin/v1/networks/{network_id}/tags/{tag_id}/"
         return self._delete(endpoint)
+
+
+class AsyncTagsResource(AsyncBaseResource, TagsResource):
+    """Async variant of :class:`TagsResource`; every method is awaitable."""
@@ -0,0 +1,14 @@
+"""
+Shared fixtures
+"""
+import httpx
+import pytest
+from mighty_networks_sdk import MightyNetworksClient
+
+
+@pytest.fixture
+def make_client():
+    """Return a factory building clients whose requests are answered by ``handler``."""
+    def make(handler, client_class=MightyNetworksClient, **kwargs):
+        return client_class(api_token="test_token", transport=httpx.MockTransport(handler), **kwargs)
+    return make
@@ -0,0 +1,95 @@
+"""
+Tests for AsyncMightyNetworksClient
+"""
+import asyncio
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, MightyNetworksClient
+
+
+def test_async_client_has_same_namespaces():
+    """Test that the async client exposes every sync resource namespace."""
+    sync_client = MightyNetworksClient(api_token="test_token")
+    async_client = AsyncMightyNetworksClient(api_token="test_token")
+    assert set(async_client._resource_classes) == set(sync_client._resource_classes)
+    for name in sync_client._resource_classes:
+        assert getattr(async_client, name)._session is async_client._session
+
+
+def test_async_list_spaces(make_client):
+    """Test that resource methods are awaitable."""
+    def handler(request):
+        assert request.url.path == "/admin/v1/networks/12345/spaces"
+        return httpx.Response(200, json={"items": [{"id": 1}], "links": {}})
+
+    async def run():
+        async with make_client(handler, AsyncMightyNetworksClient) as client:
+            return await client.spaces.list(network_id=12345)
+
+    result = asyncio.run(run())
+    assert result["status"] is True
+    assert result["data"] == [{"id": 1}]
+
+
+def test_async_requests_after_aclose(make_client):
+    """Test that an async client keeps working after its pool is closed."""
+    def handler(request):
+        return httpx.Response(200, json={"id": 1})
+
+    async def run():
+        async with make_client(handler, AsyncMightyNetworksClient) as client:
+            await client.spaces.get(network_id=1, space_id=1)
+        result = await client.spaces.get(network_id=1, space_id=1)
+        await client.aclose()
+        return client, result
+
+    client, result = asyncio.run(run())
+    assert result["status"] is True
+    assert client._session_instance is None
+
+
+def test_async_concurrent_calls(make_client):
+    """Test many concurrent calls on one event loop."""
+    def handler(request):
+        user_id = int(request.url.path.rstrip("/").split("/")[-1])
+        return httpx.Response(200, json={"id": user_id})
+
+    async def run():
+        async with make_client(handler, AsyncMightyNetworksClient) as client:
+            return await asyncio.gather(*[
+                client.members.get(network_id=1, user_id=i) for i in range(50)
+            ])
+
+    results = asyncio.run(run())
+    assert [r["data"]["id"] for r in results] == list(range(50))
+
+
+def test_async_error_response(make_client):
+    """Test that error responses are normalized like the sync client."""
+    def handler(request):
+        return httpx.Response(404)
+
+    async def run():
+        async with make_client(handler, AsyncMightyNetworksClient) as client:
+            return await client.plans.get(network_id=1, plan_id=2)
+
+    result = asyncio.run(run())
+    assert result["status"] is False
+    assert result["message"].startswith("Not found")
+
+
+def test_async_upload_keeps_file_open(tmp_path, make_client):
+    """Test that uploads read the file while the request is awaited."""
+    asset = tmp_path / "image.jpg"
+    asset.write_bytes(b"image-bytes")
+
+    def handler(request):
+        assert b"image-bytes" in request.read()
+        return httpx.Response(201, json={"id": 7})
+
+    async def run():
+        async with make_client(handler, AsyncMightyNetworksClient) as client:
+            return await client.assets.upload(network_id=1, file_path=str(asset))
+
+    result = asyncio.run(run())
+    assert result["data"] == {"id": 7}
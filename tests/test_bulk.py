@@ -0,0 +1,352 @@
+"""
+Tests for bulk operations
+"""
+import asyncio
+import json
+import threading
+import time
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, TokenBucket
+from mighty_networks_sdk.bulk import BulkRun
+
+
+class FakeCreates:
+    """Creates members; emails starting with "dup" are rejected with 422."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.bodies = []
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def respond(self, request):
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        if body["email"].startswith("dup"):
+            return httpx.Response(422, json={"message": "Email has already been taken"})
+        return httpx.Response(201, json={"id": len(self.bodies), **body})
+
+    def __call__(self, request):
+        self.enter()
+        try:
+            time.sleep(self.delay)
+            return self.respond(request)
+        finally:
+            self.leave()
+
+
+def rows(count):
+    for i in range(count):
+        yield {"email": f"{'dup' if i % 5 == 4 else 'new'}{i}@example.com", "first_name": f"N{i}", "last_name": "X"}
+
+
+class TestCreateMany:
+    """Test cases for members.create_many."""
+
+    def test_results_in_input_order(self, make_client):
+        fake = FakeCreates(delay=0.01)
+        run = make_client(fake).members.create_many(1, rows(20), concurrency=4)
+        assert fake.bodies == []  # lazy until iterated
+        results = run.run()
+        assert [r["index"] for r in results] == list(range(20))
+        assert [r["status"] for r in results] == [i % 5 != 4 for i in range(20)]
+        assert results[4]["row"]["email"] == "dup4@example.com"
+        assert results[0]["data"]["last_name"] == "X"
+        assert 1 < fake.peak <= 4
+        summary = run.summary()
+        assert (summary["total"], summary["succeeded"], summary["failed"]) == (20, 16, 4)
+        assert summary["per_second"] > 0
+
+    def test_malformed_rows_fail_without_stopping(self, make_client):
+        fake = FakeCreates()
+        results = make_client(fake).members.create_many(1, [{"first_name": "A"}, {"email": "a@x.io", "first_name": "A"}]).run()
+        assert not results[0]["status"] and "no email" in results[0]["message"]
+        assert results[1]["status"]
+        assert len(fake.bodies) == 1
+
+    def test_streams_input(self, make_client):
+        consumed = []
+
+        def source():
+            for row in rows(1000):
+                consumed.append(row)
+                yield row
+
+        run = make_client(FakeCreates()).members.create_many(1, source(), concurrency=2)
+        iterator = iter(run)
+        next(iterator)
+        assert len(consumed) < 20
+        iterator.close()
+
+    def test_honors_rate_limiter(self, make_client):
+        limiter = TokenBucket(rate=200, capacity=1)
+        started = time.monotonic()
+        make_client(FakeCreates(), rate_limiter=limiter).members.create_many(1, rows(21), concurrency=8).run()
+        assert time.monotonic() - started >= 0.09
+
+    def test_async_create_many(self, make_client):
+        fake = FakeCreates()
+
+        async def handler(request):
+            fake.enter()
+            try:
+                await asyncio.sleep(0.01)
+                return fake.respond(request)
+            finally:
+                fake.leave()
+
+        client = make_client(handler, AsyncMightyNetworksClient)
+
+        async def collect():
+            run = client.members.create_many(1, rows(12), concurrency=3)
+            return [result async for result in run], run.summary()
+
+        results, summary = asyncio.run(collect())
+        assert [r["index"] for r in results] == list(range(12))
+        assert summary["failed"] == 2
+        assert fake.peak == 3
+
+
+class TestBulkRun:
+    """Test cases for the bulk runner."""
+
+    def test_slow_row_does_not_reorder(self):
+        def call(n):
+            time.sleep(0.05 if n == 0 else 0)
+            return {"status": True, "data": n * 2, "message": ""}
+
+        results = BulkRun(range(10), call, concurrency=3).run()
+        assert [r["data"] for r in results] == [n * 2 for n in range(10)]
+
+
+class FakeSpace:
+    """One space's members, listed two per page; user 13 cannot be added."""
+
+    def __init__(self, members):
+        self.members = set(members)
+        self.calls = []
+
+    def __call__(self, request):
+        parts = request.url.path.strip("/").split("/")
+        if request.method == "GET":
+            number = int(request.url.params.get("page", 1))
+            ordered = sorted(self.members)
+            more = number * 2 < len(ordered)
+            links = {"next": f"{request.url.copy_with(query=None)}?page={number + 1}"} if more else {}
+            items = [{"id": member} for member in ordered[(number - 1) * 2:number * 2]]
+            return httpx.Response(200, json={"items": items, "links": links})
+        if request.method == "POST":
+            user_id = int(request.url.params["user_id"])
+            self.calls.append(("add", user_id))
+            if user_id == 13:
+                return httpx.Response(422, json={"message": "User is banned"})
+            self.members.add(user_id)
+            return httpx.Response(200, json={"id": user_id})
+        self.calls.append(("remove", int(parts[-1])))
+        self.members.discard(int(parts[-1]))
+        return httpx.Response(204)
+
+
+class TestEnroll:
+    """Test cases for spaces.enroll."""
+
+    def test_only_needed_calls(self, make_client):
+        fake = FakeSpace({1, 2, 3, 4, 5})
+        report = make_client(fake).spaces.enroll(1, 10, add=[4, 5, 6, 7, 7, 13], remove=[1, 8])
+        assert sorted(fake.calls) == [("add", 6), ("add", 7), ("add", 13), ("remove", 1)]
+        assert fake.members == {2, 3, 4, 5, 6, 7}
+        assert report["members_before"] == 5
+        assert (report["added"], report["removed"]) == (2, 1)
+        assert (report["already_members"], report["not_members"]) == (2, 1)
+        [failure] = report["failed"]
+        assert (failure["user_id"], failure["action"]) == (13, "add")
+        assert "banned" in failure["message"]
+
+    def test_exact_membership(self, make_client):
+        fake = FakeSpace({1, 2, 3})
+        report = make_client(fake).spaces.enroll(1, 10, members=[2, 3, 4])
+        assert fake.members == {2, 3, 4}
+        assert (report["added"], report["removed"]) == (1, 1)
+
+    def test_ids_match_across_types(self, make_client):
+        # IDs read from a CSV arrive as strings
+        fake = FakeSpace({1, 2})
+        report = make_client(fake).spaces.enroll(1, 10, add=["1", "3"], remove=["2"])
+        assert sorted(fake.calls) == [("add", 3), ("remove", 2)]
+        assert fake.members == {1, 3}
+        assert (report["already_members"], report["not_members"]) == (1, 0)
+        with pytest.raises(ValueError):
+            make_client(fake).spaces.enroll(1, 10, add=[4], remove=["4"])
+
+    def test_conflicting_arguments(self, make_client):
+        client = make_client(FakeSpace({1}))
+        with pytest.raises(ValueError):
+            client.spaces.enroll(1, 10, add=[2], remove=[2])
+        with pytest.raises(ValueError):
+            client.spaces.enroll(1, 10, add=[2], members=[2])
+
+    def test_async_enroll(self, make_client):
+        fake = FakeSpace({1, 2})
+        client = make_client(fake, AsyncMightyNetworksClient)
+        report = asyncio.run(client.spaces.enroll(1, 10, add=[2, 3], remove=[1]))
+        assert fake.members == {2, 3}
+        assert (report["added"], report["removed"], report["already_members"]) == (1, 1, 1)
+
+
+class FakeAwards:
+    """Records awards; the first award of user 7 fails with 500 when ``flaky``."""
+
+    def __init__(self, flaky=False):
+        self.awarded = []
+        self.flaky = flaky
+
+    def __call__(self, request):
+        user_id = json.loads(request.content)["user_id"]
+        if self.flaky and user_id == 7:
+            self.flaky = False
+            return httpx.Response(400, json={"message": "try later"})
+        self.awarded.append(user_id)
+        return httpx.Response(200, json={"user_id": user_id})
+
+
+class TestAwardMany:
+    """Test cases for badges.award_many."""
+
+    def test_deduplicates_and_streams(self, make_client):
+        fake = FakeAwards()
+        run = make_client(fake).badges.award_many(1, 333, [5, 6, 5, "6", 7], concurrency=2)
+        results = list(run)
+        assert [r["row"] for r in results] == [5, 6, 7]
+        assert sorted(fake.awarded) == [5, 6, 7]
+        assert run.summary()["skipped"] == 2
+
+    def test_odd_user_id_does_not_abort(self, make_client):
+        fake = FakeAwards()
+        results = make_client(fake).badges.award_many(1, 333, [1, None, "x", 2]).run()
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert sorted(fake.awarded, key=str) == [1, 2, None, "x"]
+
+    def test_resume_from_checkpoint(self, tmp_path, make_client):
+        path = str(tmp_path / "award.txt")
+        fake = FakeAwards(flaky=True)
+        client = make_client(fake)
+        run = client.badges.award_many(1, 333, range(10), checkpoint=path)
+        failed = [r["row"] for r in run if not r["status"]]
+        assert failed == [7]
+        with open(path) as file:
+            assert sorted(map(int, file.read().split())) == [0, 1, 2, 3, 4, 5, 6, 8, 9]
+
+        # A partly written line from a crash is ignored
+        with open(path, "a") as file:
+            file.write("7")
+        fake.awarded.clear()
+        run = client.badges.award_many(1, 333, range(10), checkpoint=path)
+        assert [r["row"] for r in run] == [7]
+        assert fake.awarded == [7]
+        assert run.summary()["skipped"] == 9
+
+    def test_abandoned_run_keeps_progress(self, tmp_path, make_client):
+        path = str(tmp_path / "award.txt")
+        fake = FakeAwards()
+        client = make_client(fake)
+        run = iter(client.badges.award_many(1, 333, range(100), concurrency=2, checkpoint=path))
+        next(run)
+        run.close()
+        awarded = len(fake.awarded)
+        assert 0 < awarded < 100
+        fake.awarded.clear()
+        list(client.badges.award_many(1, 333, range(100), checkpoint=path))
+        assert len(fake.awarded) == 100 - awarded
+
+    def test_async_award_many(self, tmp_path, make_client):
+        fake = FakeAwards()
+        client = make_client(fake, AsyncMightyNetworksClient)
+        run = client.badges.award_many(1, 333, [1, 2, 2, 3], checkpoint=str(tmp_path / "a.txt"))
+        results = asyncio.run(run.run())
+        assert [r["row"] for r in results] == [1, 2, 3]
+        assert [r["index"] for r in results] == [0, 1, 3]
+        assert asyncio.run(client.badges.award_many(1, 333, [1, 2, 3], checkpoint=str(tmp_path / "a.txt")).run()) == []
+
+
+class FakeValues:
+    """Custom field values per member; reads fail for user 9."""
+
+    def __init__(self, values):
+        self.values = values
+        self.patches = []
+        self.reads = 0
+
+    def __call__(self, request):
+        user_id = int(request.url.path.strip("/").split("/")[-2])
+        if request.method == "GET":
+            self.reads += 1
+            if user_id == 9:
+                return httpx.Response(500, json={"message": "boom"})
+            return httpx.Response(200, json=self.values.get(user_id, {}))
+        body = json.loads(request.content)
+        self.patches.append((user_id, body))
+        self.values.setdefault(user_id, {}).update(body)
+        return httpx.Response(200, json=self.values[user_id])
+
+
+class TestSyncMemberValues:
+    """Test cases for custom_fields.sync_member_values."""
+
+    def test_writes_only_changed_fields(self, make_client):
+        fake = FakeValues({1: {"456": "Acme", "457": "Tech"}, 2: {"456": "Old", "457": 5}, 3: {}})
+        desired = {
+            1: {"456": "Acme", 457: "Tech"},
+            2: {"456": "New", "457": "5"},
+            3: {"456": "Fresh"},
+            9: {"456": "X"},
+        }
+        report = make_client(fake).custom_fields.sync_member_values(1, desired, concurrency=3)
+        assert sorted(fake.patches) == [(2, {"456": "New"}), (3, {"456": "Fresh"})]
+        assert (report["members"], report["updated"], report["unchanged"]) == (4, 2, 1)
+        assert (report["fields_written"], report["fields_unchanged"]) == (2, 3)
+        assert report["writes_skipped"] == 1
+        [failure] = report["failed"]
+        assert failure["user_id"] == 9 and "500" in failure["message"]
+
+    def test_second_run_writes_nothing(self, make_client):
+        fake = FakeValues({1: {"456": "a"}, 2: {}})
+        client = make_client(fake)
+        desired = [(1, {"456": "b"}), (2, {"456": "c", "458": ["x", "y"]})]
+        client.custom_fields.sync_member_values(1, desired)
+        fake.patches.clear()
+        report = client.custom_fields.sync_member_values(1, desired)
+        assert fake.patches == []
+        assert report["writes_skipped"] == 2
+
+    def test_streams_without_collecting_results(self, monkeypatch, make_client):
+        def collect(self):
+            raise AssertionError("results collected")
+
+        monkeypatch.setattr(BulkRun, "run", collect)
+        fake = FakeValues({})
+        desired = ((i, {"456": str(i)}) for i in range(10, 210))
+        report = make_client(fake).custom_fields.sync_member_values(1, desired, concurrency=4)
+        assert (report["members"], report["updated"]) == (200, 200)
+
+    def test_list_payload(self, make_client):
+        fake = FakeValues({1: {"items": [{"custom_field_id": 456, "value": "a"}]}})
+        report = make_client(fake).custom_fields.sync_member_values(1, {1: {"456": "a"}})
+        assert report["unchanged"] == 1 and fake.patches == []
+
+    def test_async_sync_member_values(self, make_client):
+        fake = FakeValues({1: {"456": "a"}, 2: {"456": "b"}})
+        client = make_client(fake, AsyncMightyNetworksClient)
+        report = asyncio.run(client.custom_fields.sync_member_values(1, {1: {"456": "a"}, 2: {"456": "z"}}))
+        assert fake.patches == [(2, {"456": "z"})]
+        assert (report["updated"], report["writes_skipped"]) == (1, 1)
@@ -0,0 +1,250 @@
+"""
+Tests for ResponseCache
+"""
+import asyncio
+import time
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, DiskCache, MightyNetworksClient, ResponseCache
+from mighty_networks_sdk.cache import cache_key, resource_scope
+
+
+def counting_handler(calls):
+    """Echo the request path and count calls."""
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json={"path": request.url.path, "n": len(calls)})
+    return handler
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_resource_scope(self):
+        assert resource_scope("https://api.mn.co/admin/v1/networks/1/spaces/2") == (
+            "spaces", "/admin/v1/networks/1/spaces"
+        )
+        assert resource_scope("https://api.mn.co/admin/v1/networks/1/plans/") == (
+            "plans", "/admin/v1/networks/1/plans"
+        )
+        assert resource_scope("https://api.mn.co/admin/v1/networks/1") == (
+            "network", "/admin/v1/networks/1"
+        )
+
+    def test_cache_key_includes_params(self):
+        assert cache_key("https://x/a", {"b": 2, "a": 1}) == "https://x/a?a=1&b=2"
+        assert cache_key("https://x/a?page=2", {"a": 1}) == "https://x/a?page=2&a=1"
+
+    def test_get_hits_cache(self, make_client):
+        """Test that repeated GETs are served from the cache."""
+        calls, cache = [], ResponseCache()
+        client = make_client(counting_handler(calls), cache=cache)
+        first = client.network.show(network_id=1)
+        second = client.network.show(network_id=1)
+        assert first == second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_results_are_copies(self, make_client):
+        """Test that callers cannot corrupt cached entries."""
+        calls, cache = [], ResponseCache()
+        client = make_client(counting_handler(calls), cache=cache)
+        client.network.show(network_id=1)["data"]["path"] = "changed"
+        assert client.network.show(network_id=1)["data"]["path"] == "/admin/v1/networks/1"
+
+    def test_ttl_expiry(self, make_client):
+        calls, cache = [], ResponseCache(ttls={"tags": 0.01})
+        client = make_client(counting_handler(calls), cache=cache)
+        client.tags.list(network_id=1)
+        time.sleep(0.02)
+        client.tags.list(network_id=1)
+        assert len(calls) == 2
+
+    def test_zero_ttl_disables_resource(self, make_client):
+        calls, cache = [], ResponseCache(ttls={"members": 0})
+        client = make_client(counting_handler(calls), cache=cache)
+        client.members.get(network_id=1, user_id=2)
+        client.members.get(network_id=1, user_id=2)
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, make_client):
+        calls, cache = [], ResponseCache(max_size=2)
+        client = make_client(counting_handler(calls), cache=cache)
+        client.spaces.get(network_id=1, space_id=1)
+        client.spaces.get(network_id=1, space_id=2)
+        client.spaces.get(network_id=1, space_id=1)  # refresh 1
+        client.spaces.get(network_id=1, space_id=3)  # evicts 2
+        client.spaces.get(network_id=1, space_id=1)
+        assert len(calls) == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_write_invalidates_resource_scope(self, make_client):
+        """Test that spaces.update evicts spaces.get and spaces.list."""
+        calls, cache = [], ResponseCache()
+        client = make_client(counting_handler(calls), cache=cache)
+        client.spaces.get(network_id=1, space_id=2)
+        client.spaces.list(network_id=1)
+        client.plans.list(network_id=1)
+        client.spaces.list(network_id=2)
+
+        client.spaces.update(network_id=1, space_id=2, name="New")
+        assert cache.stats()["invalidations"] == 2
+
+        client.spaces.get(network_id=1, space_id=2)
+        client.spaces.list(network_id=1)
+        client.plans.list(network_id=1)
+        client.spaces.list(network_id=2)
+        gets = [call for call in calls if call[0] == "GET"]
+        assert len(gets) == 6
+
+    def test_failures_not_cached(self):
+        cache = ResponseCache()
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda r: httpx.Response(404)),
+            cache=cache,
+        )
+        client.me.show(network_id=1)
+        assert len(cache) == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_size=0)
+
+    def test_async_client_uses_cache(self, make_client):
+        calls, cache = [], ResponseCache()
+
+        async def run():
+            async with make_client(counting_handler(calls), AsyncMightyNetworksClient, cache=cache) as client:
+                await client.me.show(network_id=1)
+                await client.me.show(network_id=1)
+
+        asyncio.run(run())
+        assert len(calls) == 1
+
+
+def _warm_from_disk(directory, queue):
+    """Run in a child process: read through a fresh cache backed by ``directory``."""
+    calls = []
+    client = MightyNetworksClient(
+        api_token="test_token",
+        transport=httpx.MockTransport(counting_handler(calls)),
+        cache=ResponseCache(disk=DiskCache(directory)),
+    )
+    result = client.spaces.get(network_id=1, space_id=2)
+    queue.put((len(calls), result["data"]["n"]))
+
+
+class TestDiskCache:
+    """Test cases for the DiskCache tier."""
+
+    def test_survives_new_cache_instance(self, tmp_path, make_client):
+        calls = []
+        make_client(
+            counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path)))
+        ).plans.list(network_id=1)
+
+        cache = ResponseCache(disk=DiskCache(str(tmp_path)))
+        result = make_client(counting_handler(calls), cache=cache).plans.list(network_id=1)
+        assert len(calls) == 1
+        assert result["data"]["n"] == 1
+        assert cache.stats()["disk_hits"] == 1
+
+        # Promoted into memory: the next hit does not touch disk
+        make_client(counting_handler(calls), cache=cache).plans.list(network_id=1)
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_honors_resource_ttls(self, tmp_path, make_client):
+        calls = []
+        ttls = {"spaces": 0.05, "plans": 0}
+        client = make_client(
+            counting_handler(calls), cache=ResponseCache(ttls=ttls, disk=DiskCache(str(tmp_path)))
+        )
+        client.spaces.list(network_id=1)
+        client.plans.list(network_id=1)
+        assert len(DiskCache(str(tmp_path))) == 1
+
+        time.sleep(0.06)
+        client = make_client(
+            counting_handler(calls), cache=ResponseCache(ttls=ttls, disk=DiskCache(str(tmp_path)))
+        )
+        client.spaces.list(network_id=1)
+        assert len(calls) == 3
+
+    def test_write_invalidates_disk(self, tmp_path, make_client):
+        calls = []
+        make_client(
+            counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path)))
+        ).spaces.list(network_id=1)
+
+        # A different process-level cache writes to the same scope
+        other = ResponseCache(disk=DiskCache(str(tmp_path)))
+        make_client(counting_handler(calls), cache=other).spaces.delete(network_id=1, space_id=2)
+        assert other.stats()["invalidations"] == 1
+
+        make_client(
+
+            counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path)))
+
+        ).spaces.list(network_id=1)
+        assert [m for m, _ in calls] == ["GET", "DELETE", "GET"]
+
+    def test_snapshots_are_json_not_pickle(self, tmp_path, make_client):
+        import json
+        import pickle
+
+        calls = []
+        make_client(
+            counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path)))
+        ).plans.list(network_id=1)
+        disk = DiskCache(str(tmp_path))
+        key = cache_key("https://api.mn.co/admin/v1/networks/1/plans", {})
+        assert json.loads(disk.load(key)[2])["result"]["data"]["n"] == 1
+
+        class Exploit:
+            def __reduce__(self):
+                return calls.append, (("PWNED", ""),)
+
+        disk.store(key, "scope", time.time() + 60, pickle.dumps({"data": Exploit()}))
+        cache = ResponseCache(disk=DiskCache(str(tmp_path)))
+        result = make_client(counting_handler(calls), cache=cache).plans.list(network_id=1)
+        assert ("PWNED", "") not in calls
+        assert result["data"]["n"] == 2  # unreadable entry is a miss
+        assert cache.stats()["disk_hits"] == 0
+
+    def test_prune_expired(self, tmp_path):
+        disk = DiskCache(str(tmp_path))
+        disk.store("a", "scope", time.time() - 1, b"x")
+        disk.store("b", "scope", time.time() + 60, b"y")
+        assert disk.load("a") is None
+        assert disk.prune() == 1
+        assert len(disk) == 1
+
+    def test_threads_share_disk(self, tmp_path, make_client):
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+        client = make_client(counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path))))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: client.spaces.get(network_id=1, space_id=i), range(32)))
+        assert len(DiskCache(str(tmp_path))) == 32
+
+    def test_shared_across_processes(self, tmp_path, make_client):
+        import multiprocessing
+
+        calls = []
+        make_client(counting_handler(calls), cache=ResponseCache(disk=DiskCache(str(tmp_path)))).spaces.get(
+            network_id=1, space_id=2
+        )
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=_warm_from_disk, args=(str(tmp_path), queue))
+        process.start()
+        child_calls, n = queue.get(timeout=30)
+        process.join()
+        assert child_calls == 0
+        assert n == 1
@@ -1,6 +1,7 @@
 """
 Tests for MightyNetworksClient
 """
+import httpx
 import pytest
 from mighty_networks_sdk import MightyNetworksClient
 from mighty_networks_sdk.exceptions import MightyNetworksException
@@ -31,3 +32,123 @@ def test_client_repr():
     """Test client string representation."""
     client = MightyNetworksClient(api_token="test_token")
     assert "MightyNetworksClient" in repr(client)
+
+def test_resources_share_connection_pool():
+    """Test that every resource uses the client's connection pool."""
+    client = MightyNetworksClient(api_token="test_token")
+    assert client.members._session is client._session
+    assert client.spaces._session is client._session
+    assert client.network._session is client._session
+
+def test_client_pool_configuration():
+    """Test custom transport and HTTP/2 configuration."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"id": 12345})
+
+    client = MightyNetworksClient(
+        api_token="test_token",
+        http2=False,
+        transport=httpx.MockTransport(handler),
+    )
+    result = client.network.show(network_id=12345)
+    assert result["status"] is True
+    assert result["data"] == {"id": 12345}
+    assert seen == ["Bearer test_token"]
+
+def test_write_listeners_see_successful_writes():
+    """Test that write listeners are called after successful writes only."""
+    seen = []
+
+    def handler(request):
+        if request.url.path.endswith("/99"):
+            return httpx.Response(404, json={"message": "missing"})
+        return httpx.Response(200, json={"id": 1})
+
+    client = MightyNetworksClient(api_token="test_token", transport=httpx.MockTransport(handler))
+    client.write_listeners.append(lambda method, url, result: seen.append((method, url)))
+    client.spaces.get(network_id=1, space_id=2)
+    client.spaces.delete(network_id=1, space_id=2)
+    client.spaces.delete(network_id=1, space_id=99)
+    assert seen == [("DELETE", "https://api.mn.co/admin/v1/networks/1/spaces/2")]
+
+def test_client_context_manager_closes_pool():
+    """Test that leaving the context manager closes the pool."""
+    with MightyNetworksClient(api_token="test_token") as client:
+        session = client._session
+        assert not session.is_closed
+    assert session.is_closed
+    assert client._session_instance is None
+
+
+def test_requests_after_close_open_new_pool(make_client):
+    """Test that a client keeps working after its pool is closed."""
+    def handler(request):
+        return httpx.Response(200, json={"id": 2})
+
+    with make_client(handler) as client:
+        client.spaces.get(network_id=1, space_id=2)
+    result = client.spaces.get(network_id=1, space_id=2)
+    assert result["status"] is True
+    assert not client._session.is_closed
+
+def test_resources_created_on_first_access():
+    """Test that resources and the pool are created lazily."""
+    client = MightyNetworksClient(api_token="test_token")
+    assert "members" not in vars(client)
+    assert client._session_instance is None
+    members = client.members
+    assert client.members is members
+    assert "members" in dir(client)
+    assert client._session_instance is None
+    with pytest.raises(AttributeError):
+        client.not_a_resource
+
+def test_import_and_construction_skip_httpx():
+    """Test that importing and constructing the client does not load httpx."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mighty_networks_sdk;"
+        "mighty_networks_sdk.MightyNetworksClient(api_token='x');"
+        "print('httpx' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+
+def test_resource_access_skips_httpx():
+    """Test that touching resources does not load httpx before the first request."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mighty_networks_sdk;"
+        "client = mighty_networks_sdk.MightyNetworksClient(api_token='x');"
+        "client.members; client.spaces.iter_all(network_id=1);"
+        "mighty_networks_sdk.AsyncMightyNetworksClient(api_token='x').members;"
+        "print('httpx' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+
+def test_import_skips_optional_modules():
+    """Test that importing the package does not load cache, mirror or index modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mighty_networks_sdk;"
+        "mighty_networks_sdk.MightyNetworksClient(api_token='x');"
+        "loaded = [name for name in ('sqlite3', 'concurrent.futures',"
+        " 'mighty_networks_sdk.cache', 'mighty_networks_sdk.mirror',"
+        " 'mighty_networks_sdk.indexes', 'mighty_networks_sdk.watermark',"
+        " 'mighty_networks_sdk.columnar') if name in sys.modules];"
+        "print(loaded, mighty_networks_sdk.Mirror.__name__, mighty_networks_sdk.ResponseCache.__name__)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "[] Mirror ResponseCache"
@@ -0,0 +1,109 @@
+"""
+Tests for JSON codecs
+"""
+import json
+import subprocess
+import sys
+import httpx
+import pytest
+from mighty_networks_sdk import MightyNetworksClient, StdlibCodec, get_codec
+from mighty_networks_sdk.codec import CODECS
+
+
+def available_codecs():
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+class CountingCodec(StdlibCodec):
+    """Stdlib codec that records how often it is used."""
+
+    def __init__(self):
+        self.encoded = []
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+class TestCodecs:
+    """Test cases for JSON codecs."""
+
+    @pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+    def test_round_trip(self, codec):
+        payload = {"items": [{"id": 1, "name": "Zoë", "fields": {"456": None, "457": [1.5, True]}}]}
+        assert codec.loads(codec.dumps(payload)) == payload
+        assert json.loads(codec.dumps(payload)) == payload
+
+    @pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+    def test_non_string_keys(self, codec):
+        assert json.loads(codec.dumps({456: "Acme Corp"})) == {"456": "Acme Corp"}
+
+    def test_auto_detects_fastest_installed(self):
+        expected = available_codecs()[0].name
+        assert get_codec().name == expected
+        assert get_codec("auto").name == expected
+
+    def test_named_and_instance(self):
+        codec = StdlibCodec()
+        assert get_codec(codec) is codec
+        assert get_codec("json").name == "json"
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_client_resolves_codec_on_first_use(self):
+        with pytest.raises(ValueError):
+            MightyNetworksClient(api_token="test_token", json_codec="yaml")
+        name = available_codecs()[0].name
+        code = (
+            "import sys; from mighty_networks_sdk import MightyNetworksClient; "
+            f"client = MightyNetworksClient(api_token='t'); print({name!r} in sys.modules); "
+            "print(client.json_codec.name)"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert output.stdout.split() == [str(name == "json"), name]
+
+    def test_client_uses_codec_for_bodies(self):
+        codec = CountingCodec()
+        sent = []
+
+        def handler(request):
+            sent.append((request.headers["Content-Type"], json.loads(request.content)))
+            return httpx.Response(200, json={"id": 7})
+
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(handler),
+            json_codec=codec,
+        )
+        order = [{"space_id": 3, "position": 1}]
+        result = client.collections.reorder_spaces(network_id=1, collection_id=2, data=order)
+        assert result["data"] == {"id": 7}
+        assert codec.encoded == [{"spaces": order}]
+        assert codec.decoded == 1
+        assert sent == [("application/json", {"spaces": order})]
+
+    def test_body_encoded_once_across_retries(self):
+        from mighty_networks_sdk import RetryPolicy
+
+        codec = CountingCodec()
+        responses = iter([httpx.Response(503), httpx.Response(200, json={})])
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            retry=RetryPolicy(backoff_factor=0, jitter=False),
+            json_codec=codec,
+        )
+        order = [{"space_id": 3, "position": 1}]
+        assert client.collections.reorder_spaces(1, 2, data=order)["status"] is True
+        assert len(codec.encoded) == 1
@@ -0,0 +1,115 @@
+"""
+Tests for columnar collection of paginated results
+"""
+import asyncio
+from datetime import datetime, timezone
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, Columns
+from mighty_networks_sdk import columnar
+
+NEXT = "https://api.mn.co/admin/v1/networks/1/purchases?page=2"
+PAGES = {
+    None: {
+        "items": [
+            {"id": 1, "email": "a@example.com", "status": "paid",
+             "created_at": "2025-01-15T09:30:00Z", "amount": 10, "meta": {"k": 1}},
+            {"id": 2, "email": "b@example.com", "status": "paid",
+             "created_at": None, "amount": 2.5},
+        ],
+        "links": {"next": NEXT},
+    },
+    "2": {
+        "items": [
+            {"id": 3, "email": None, "status": "refunded",
+             "created_at": "2025-06-01T12:00:00.123456+02:00", "amount": None, "coupon": "SPRING"},
+        ],
+        "links": {},
+    },
+}
+
+
+def handler(request):
+    return httpx.Response(200, json=PAGES[request.url.params.get("page")])
+
+
+class TestColumns:
+    """Test cases for the column buffers."""
+
+    def test_kinds_and_missing_keys(self, make_client):
+        columns = make_client(handler).purchases.iter_all(network_id=1).to_columns()
+        assert len(columns) == 3
+        kinds = {name: column.kind for name, column in columns.columns.items()}
+        assert kinds == {
+            "id": "int", "email": "string", "status": "string", "created_at": "timestamp",
+            "amount": "float", "meta": "object", "coupon": "string",
+        }
+        assert columns.columns["status"].uniques == ["paid", "refunded"]
+        assert list(columns.columns["status"].data) == [0, 0, 1]
+        assert columns.columns["coupon"].values() == [None, None, "SPRING"]
+        assert columns.columns["created_at"].values() == [
+            datetime(2025, 1, 15, 9, 30, tzinfo=timezone.utc),
+            None,
+            datetime(2025, 6, 1, 10, 0, 0, 123456, tzinfo=timezone.utc),
+        ]
+
+    def test_mismatched_values_fall_back_to_objects(self):
+        columns = Columns()
+        columns.extend([{"a": 1, "b": "2025-01-01T00:00:00Z"}, {"a": "one", "b": "soon"}])
+        assert columns.columns["a"].kind == "object"
+        assert columns.columns["a"].values() == [1, "one"]
+        assert columns.columns["b"].values() == [datetime(2025, 1, 1, tzinfo=timezone.utc), "soon"]
+
+    def test_typed_items(self, make_client):
+        columns = make_client(handler, response_mode="typed").members.iter_all(network_id=1).to_columns()
+        assert columns.columns["id"].values() == [1, 2, 3]
+
+
+class TestConversions:
+    """Test cases for the NumPy, Arrow and pandas conversions."""
+
+    def test_to_numpy(self, make_client):
+        np = pytest.importorskip("numpy")
+        arrays = make_client(handler).purchases.iter_all(network_id=1).to_numpy()
+        assert arrays["id"].dtype == np.int64
+        assert arrays["email"].tolist() == ["a@example.com", "b@example.com", None]
+        assert arrays["amount"].mask.tolist() == [False, False, True]
+        assert np.isnat(arrays["created_at"]).tolist() == [False, True, False]
+
+    def test_to_arrow(self, make_client):
+        pa = pytest.importorskip("pyarrow")
+        table = make_client(handler).purchases.iter_all(network_id=1).to_arrow()
+        assert table.schema.field("id").type == pa.int64()
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+        assert table.column("meta").to_pylist() == ['{"k": 1}', None, None]
+        assert table.column("email").to_pylist() == ["a@example.com", "b@example.com", None]
+
+    def test_to_arrow_mixed_timestamps(self):
+        pytest.importorskip("pyarrow")
+        columns = Columns()
+        columns.extend([{"b": "2025-01-01T00:00:00Z"}, {"b": "soon"}, {"b": None}])
+        assert columns.columns["b"].kind == "object"
+        assert columns.to_arrow().column("b").to_pylist() == ['"2025-01-01T00:00:00+00:00"', '"soon"', None]
+
+    def test_to_pandas(self, make_client):
+        pytest.importorskip("pandas")
+        frame = make_client(handler).purchases.iter_all(network_id=1).to_pandas()
+        assert str(frame["status"].dtype) == "category"
+        assert str(frame["created_at"].dtype).startswith("datetime64")
+        assert frame["id"].tolist() == [1, 2, 3]
+        assert frame["coupon"].isna().tolist() == [True, True, False]
+
+    def test_async_to_arrow(self, make_client):
+        pytest.importorskip("pyarrow")
+        client = make_client(handler, AsyncMightyNetworksClient)
+        table = asyncio.run(client.purchases.iter_all(network_id=1).to_arrow())
+        assert table.column("id").to_pylist() == [1, 2, 3]
+
+    def test_missing_dependency(self, monkeypatch):
+        def missing(name, *args, **kwargs):
+            raise ImportError(name)
+
+        monkeypatch.setattr(columnar.importlib, "import_module", missing)
+        with pytest.raises(ImportError, match=r"mighty-networks-sdk\[arrow\]"):
+            columnar._require("pyarrow", "arrow")
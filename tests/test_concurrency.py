@@ -0,0 +1,163 @@
+"""
+Tests for AdaptiveConcurrencyLimiter
+"""
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from mighty_networks_sdk import (
+    AdaptiveConcurrencyLimiter,
+    AsyncMightyNetworksClient,
+    MightyNetworksClient,
+    RetryPolicy,
+)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+    def test_additive_increase(self):
+        """Test that successes grow the limit by about one per window."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=1e9)
+        for _ in range(10):
+            limiter.release(limiter.acquire(), 200)
+        assert limiter.limit > 2
+        assert limiter.metrics()["successes"] == 10
+
+    def test_increase_capped(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, latency_tolerance=1e9)
+        for _ in range(100):
+            limiter.release(limiter.acquire(), 200)
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        """Test that concurrent 429s halve the limit only once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        starts = [limiter.acquire() for _ in range(8)]
+        for started in starts:
+            limiter.release(started, 429)
+        assert limiter.limit == 4
+        assert limiter.metrics()["overloads"] == 8
+
+        limiter.release(limiter.acquire(), 429)
+        assert limiter.limit == 2
+
+    def test_network_error_decreases(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        limiter.release(limiter.acquire(), None)
+        assert limiter.limit == 2
+
+    def test_latency_spike_decreases(self):
+        """Test that latency well above the baseline counts as overload."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, smoothing=1.0)
+        limiter.release(limiter.acquire(), 200)
+        limiter.release(limiter.acquire() - 10, 200)
+        assert limiter.limit == 4
+
+    def test_only_2xx_latency_sets_baseline(self):
+        """Test that a fast error response does not make healthy 200s look slow."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=16, smoothing=1.0)
+        limiter.release(limiter.acquire() - 0.005, 404)
+        for _ in range(50):
+            limiter.release(limiter.acquire() - 0.03, 200)
+        assert limiter.limit == 16
+        assert limiter.metrics()["overloads"] == 0
+
+    def test_latency_cuts_are_spaced_and_baseline_recovers(self, monkeypatch):
+        """Test that slowness cuts at most once per ``limit`` samples, until the baseline catches up."""
+        clock = [0.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, smoothing=1.0, baseline_window=10)
+
+        def respond(latency):
+            started = limiter.acquire()
+            clock[0] += latency
+            limiter.release(started, 200)
+
+        respond(0.01)
+        limits = []
+        for _ in range(30):
+            respond(1.0)
+            limits.append(limiter.limit)
+        # One cut, then none until ``limit`` more samples have come back
+        assert limits[:10] == [8] * 9 + [4]
+        assert limiter.metrics()["overloads"] == 4
+        # Once the fast sample ages out of the window, 1 s is the new normal
+        assert limiter.metrics()["baseline_latency"] == 1.0
+        assert limits[-1] > min(limits)
+
+    def test_threads_respect_limit(self):
+        """Test that no more than ``limit`` threads are in flight."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3, latency_tolerance=1e9)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def worker():
+            started = limiter.acquire()
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            limiter.release(started, 200)
+
+        threads = [threading.Thread(target=worker) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert state["peak"] == 3
+        assert limiter.in_flight == 0
+
+    def test_async_tasks_respect_limit(self):
+        """Test that asyncio tasks wait for a free slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2, latency_tolerance=1e9)
+        state = {"active": 0, "peak": 0}
+
+        async def worker():
+            started = await limiter.acquire_async()
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            limiter.release(started, 200)
+
+        async def run():
+            await asyncio.gather(*[worker() for _ in range(10)])
+
+        asyncio.run(run())
+        assert state["peak"] == 2
+
+    def test_client_feeds_back_429(self):
+        """Test that the request layer reports throttled responses."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda r: httpx.Response(429)),
+            retry=RetryPolicy(max_attempts=1),
+            concurrency_limiter=limiter,
+        )
+        client.me.show(network_id=1)
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_async_client_uses_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=1e9)
+
+        async def run():
+            async with AsyncMightyNetworksClient(
+                api_token="test_token",
+                transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+                concurrency_limiter=limiter,
+            ) as client:
+                await asyncio.gather(*[client.me.show(network_id=1) for _ in range(20)])
+
+        asyncio.run(run())
+        assert limiter.metrics()["successes"] == 20
+        assert limiter.in_flight == 0
@@ -0,0 +1,88 @@
+"""
+Tests for conditional GET requests
+"""
+import asyncio
+import httpx
+from mighty_networks_sdk import AsyncMightyNetworksClient, ETagCache, MightyNetworksClient
+
+
+def etag_handler(state):
+    """Serve a body with an ETag and answer 304 when it still matches."""
+    def handler(request):
+        state["requests"].append(dict(request.headers))
+        etag = f'"v{state["version"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            json={"items": [{"id": 1, "version": state["version"]}], "links": {}},
+            headers={"ETag": etag, "Last-Modified": "Wed, 21 Oct 2025 07:28:00 GMT"},
+        )
+    return handler
+
+
+class TestConditionalRequests:
+    """Test cases for ETagCache."""
+
+    def test_sends_validators_and_serves_304(self, make_client):
+        state = {"version": 1, "requests": []}
+        etags = ETagCache()
+        client = make_client(etag_handler(state), etag_cache=etags)
+
+        first = client.posts.list(network_id=1, space_id=2)
+        assert first["not_modified"] is False
+        assert "if-none-match" not in state["requests"][0]
+
+        second = client.posts.list(network_id=1, space_id=2)
+        assert second["not_modified"] is True
+        assert second["data"] == first["data"]
+        assert state["requests"][1]["if-none-match"] == '"v1"'
+        assert state["requests"][1]["if-modified-since"] == "Wed, 21 Oct 2025 07:28:00 GMT"
+        assert etags.stats()["not_modified"] == 1
+
+    def test_changed_body_replaces_stored(self, make_client):
+        state = {"version": 1, "requests": []}
+        client = make_client(etag_handler(state), etag_cache=ETagCache())
+        client.members.get(network_id=1, user_id=1)
+        state["version"] = 2
+        changed = client.members.get(network_id=1, user_id=1)
+        assert changed["not_modified"] is False
+        assert changed["data"][0]["version"] == 2
+        assert client.members.get(network_id=1, user_id=1)["not_modified"] is True
+
+    def test_served_results_are_copies(self, make_client):
+        state = {"version": 1, "requests": []}
+        client = make_client(etag_handler(state), etag_cache=ETagCache())
+        client.abuse_reports.list(network_id=1)
+        client.abuse_reports.list(network_id=1)["data"].clear()
+        assert client.abuse_reports.list(network_id=1)["data"] == [{"id": 1, "version": 1}]
+
+    def test_responses_without_validators_not_stored(self):
+        etags = ETagCache()
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+            etag_cache=etags,
+        )
+        client.me.show(network_id=1)
+        assert len(etags) == 0
+
+    def test_lru_bound(self, make_client):
+        state = {"version": 1, "requests": []}
+        etags = ETagCache(max_size=2)
+        client = make_client(etag_handler(state), etag_cache=etags)
+        for user_id in range(5):
+            client.members.get(network_id=1, user_id=user_id)
+        assert len(etags) == 2
+
+    def test_async_conditional(self, make_client):
+        state = {"version": 1, "requests": []}
+
+        async def run():
+            async with make_client(
+                etag_handler(state), AsyncMightyNetworksClient, etag_cache=ETagCache()
+            ) as client:
+                await client.posts.list(network_id=1, space_id=2)
+                return await client.posts.list(network_id=1, space_id=2)
+
+        assert asyncio.run(run())["not_modified"] is True
@@ -0,0 +1,181 @@
+"""
+Tests for streaming export
+"""
+import asyncio
+import csv
+import gzip
+import io
+import json
+import os
+import httpx
+import pytest
+from mighty_networks_sdk import APIError, AsyncMightyNetworksClient, MightyNetworksClient
+from mighty_networks_sdk.__main__ import main
+from mighty_networks_sdk.export import export, infer_format
+
+BASE = "https://api.mn.co/admin/v1/networks/1/members"
+
+
+def member(i):
+    return {"id": i, "email": f"m{i}@example.com", "tags": ["a", "b"] if i % 2 else None}
+
+
+def make_handler(pages=3, per_page=2, fail_on=None):
+    """Serve ``pages`` pages; the first request for page ``fail_on`` returns 400."""
+    failures = {fail_on} if fail_on else set()
+
+    def handler(request):
+        number = int(request.url.params.get("page", 1))
+        if number in failures:
+            failures.discard(number)
+            return httpx.Response(400, json={"message": "boom"})
+        items = [member(i) for i in range((number - 1) * per_page, number * per_page)]
+        links = {"next": f"{BASE}?page={number + 1}"} if number < pages else {}
+        return httpx.Response(200, json={"items": items, "links": links})
+
+    return handler
+
+
+def read_ndjson(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestExport:
+    """Test cases for client.export()."""
+
+    def test_infer_format(self):
+        assert infer_format("m.ndjson.gz") == ("ndjson", "gzip")
+        assert infer_format("m.CSV") == ("csv", None)
+        assert infer_format("out/m.parquet/") == ("parquet", None)
+        assert infer_format("m.jsonl.zst") == ("ndjson", "zstd")
+        assert infer_format("m.txt") == (None, None)
+
+    def test_ndjson_gzip(self, tmp_path, make_client):
+        path = str(tmp_path / "members.ndjson.gz")
+        summary = make_client(make_handler()).export("members", path, network_id=1)
+        assert summary == {
+            "path": path, "format": "ndjson", "compression": "gzip",
+            "rows": 6, "pages": 3, "resumed": False,
+        }
+        assert read_ndjson(path) == [member(i) for i in range(6)]
+        assert not os.path.exists(path + ".export-state")
+
+    def test_csv(self, tmp_path, make_client):
+        path = str(tmp_path / "members.csv")
+        make_client(make_handler()).export("members", path, network_id=1)
+        with open(path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 6
+        assert rows[1] == {"id": "1", "email": "m1@example.com", "tags": '["a","b"]'}
+        assert rows[0]["tags"] == ""
+
+    def test_csv_fields(self, tmp_path, make_client):
+        path = str(tmp_path / "members.csv")
+        make_client(make_handler()).export("members", path, network_id=1, fields=["email"])
+        with open(path) as file:
+            assert file.read().splitlines()[:2] == ["email", "m0@example.com"]
+
+    def test_resume_after_failure(self, tmp_path, make_client):
+        path = str(tmp_path / "members.ndjson.gz")
+        client = make_client(make_handler(pages=4, fail_on=3))
+        with pytest.raises(APIError):
+            client.export("members", path, network_id=1)
+        with open(path + ".export-state") as file:
+            state = json.load(file)
+        assert state["rows"] == 4 and state["next"].endswith("page=3")
+
+        # Garbage after the checkpoint (a half-written page) is discarded
+        with open(path, "ab") as file:
+            file.write(b"\x1f\x8b partial")
+        summary = client.export("members", path, network_id=1, resume=True)
+        assert summary["resumed"] and summary["rows"] == 8 and summary["pages"] == 4
+        assert read_ndjson(path) == [member(i) for i in range(8)]
+
+    def test_resume_without_checkpoint_starts_over(self, tmp_path, make_client):
+        path = str(tmp_path / "members.ndjson")
+        client = make_client(make_handler())
+        client.export("members", path, network_id=1)
+        summary = client.export("members", path, network_id=1, resume=True)
+        assert not summary["resumed"]
+        assert len(read_ndjson(path)) == 6
+
+    def test_resume_rejects_other_export(self, tmp_path, make_client):
+        path = str(tmp_path / "members.ndjson")
+        with pytest.raises(APIError):
+            make_client(make_handler(fail_on=2)).export("members", path, network_id=1)
+        with pytest.raises(ValueError, match="different export"):
+            make_client(make_handler()).export("members", path, network_id=1, format="csv", resume=True)
+
+    def test_typed_and_lazy_items(self, tmp_path, make_client):
+        for mode in ("typed", "lazy"):
+            if mode == "lazy":
+                pytest.importorskip("msgspec")
+            path = str(tmp_path / f"{mode}.ndjson")
+            make_client(make_handler(), response_mode=mode).export("members", path, network_id=1)
+            rows = read_ndjson(path)
+            assert [row["email"] for row in rows] == [member(i)["email"] for i in range(6)]
+
+    def test_parquet(self, tmp_path, make_client):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "members.parquet")
+        summary = make_client(make_handler(pages=5)).export(
+            "members", path, network_id=1, compression="zstd"
+        )
+        assert summary["rows"] == 10
+        table = pq.read_table(path)
+        assert sorted(table.column("id").to_pylist()) == list(range(10))
+
+    def test_parquet_parts_resume(self, tmp_path, make_client):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "members.parquet")
+        client = make_client(make_handler(pages=5, fail_on=4))
+        with pytest.raises(APIError):
+            export(client.members.iter_all(network_id=1), path, rows_per_part=4)
+        assert sorted(os.listdir(path)) == ["part-00000.parquet"]
+
+        summary = export(client.members.iter_all(network_id=1), path, rows_per_part=4, resume=True)
+        assert summary["rows"] == 10 and summary["resumed"]
+        assert sorted(os.listdir(path)) == ["part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+        table = pq.read_table(path)
+        assert sorted(table.column("id").to_pylist()) == list(range(10))
+        assert table.schema.field("tags").type == pq.read_schema(os.path.join(path, "part-00000.parquet")).field("tags").type
+
+    def test_source_errors(self, tmp_path, make_client):
+        client = make_client(make_handler())
+        with pytest.raises(ValueError):
+            client.export("nope", str(tmp_path / "x.ndjson"))
+        with pytest.raises(ValueError):
+            client.export("members.list", str(tmp_path / "x.ndjson"), network_id=1)
+        with pytest.raises(ValueError, match="format"):
+            client.export("members", str(tmp_path / "x.ndjson"), network_id=1, format="xml")
+
+    def test_async_export(self, tmp_path, make_client):
+        path = str(tmp_path / "members.ndjson")
+        client = make_client(make_handler(), AsyncMightyNetworksClient)
+        summary = asyncio.run(client.export("members", path, network_id=1))
+        assert summary["rows"] == 6
+        assert read_ndjson(path) == [member(i) for i in range(6)]
+
+
+class TestExportCommand:
+    """Test cases for python -m mighty_networks_sdk export."""
+
+    def test_export_command(self, tmp_path, monkeypatch, capsys):
+        transport = httpx.MockTransport(make_handler())
+        monkeypatch.setattr(
+            "mighty_networks_sdk.__main__.MightyNetworksClient",
+            lambda api_token: MightyNetworksClient(api_token=api_token, transport=transport),
+        )
+        monkeypatch.setenv("MIGHTY_NETWORKS_TOKEN", "test_token")
+        path = str(tmp_path / "members.csv")
+        assert main(["export", "members", path, "--network-id", "1"]) == 0
+        assert "Exported 6 rows (3 pages)" in capsys.readouterr().out
+        with open(path) as file:
+            assert len(list(csv.reader(io.StringIO(file.read())))) == 7
+
+    def test_requires_token(self, monkeypatch):
+        monkeypatch.delenv("MIGHTY_NETWORKS_TOKEN", raising=False)
+        with pytest.raises(SystemExit):
+            main(["export", "members", "out.ndjson", "--network-id", "1"])
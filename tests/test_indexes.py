@@ -0,0 +1,247 @@
+"""
+Tests for the lookup indexes
+"""
+import httpx
+import pytest
+from mighty_networks_sdk import (
+    APIError,
+    MemberEmailIndex,
+    Mirror,
+    SpaceMembershipIndex,
+)
+
+BASE = "https://api.mn.co/admin/v1/networks/1/members"
+
+
+class FakeMembers:
+    """Serves members newest-first and the by_email endpoint; records requests."""
+
+    def __init__(self, count=4, per_page=2, by_id=False):
+        self.per_page = per_page
+        self.by_id = by_id
+        self.members = {}
+        self.requests = []
+        for i in range(count):
+            self.put(i, f"m{i}@example.com", i)
+
+    def put(self, member_id, email, stamp):
+        self.members[member_id] = {
+            "id": member_id, "email": email, "updated_at": f"2025-01-01T00:00:{stamp:02d}Z",
+        }
+
+    def __call__(self, request):
+        self.requests.append(request.url)
+        if request.url.path.endswith("/by_email"):
+            email = request.url.params["email"]
+            for member in self.members.values():
+                if member["email"].lower() == email.lower():
+                    return httpx.Response(200, json=member)
+            if email == "broken@example.com":
+                return httpx.Response(500, json={"message": "boom"})
+            return httpx.Response(404, json={"message": "not found"})
+        number = int(request.url.params.get("page", 1))
+        if self.by_id:
+            ordered = sorted(self.members.values(), key=lambda m: m["id"])
+        else:
+            ordered = sorted(self.members.values(), key=lambda m: m["updated_at"], reverse=True)
+        items = ordered[(number - 1) * self.per_page:number * self.per_page]
+        more = number * self.per_page < len(ordered)
+        links = {"next": f"{BASE}?page={number + 1}"} if more else {}
+        return httpx.Response(200, json={"items": items, "links": links})
+
+    def by_email_requests(self):
+        return [url for url in self.requests if url.path.endswith("/by_email")]
+
+
+class TestGetByEmail:
+    """Test cases for members.get_by_email."""
+
+    def test_email_is_encoded(self, make_client):
+        fake = FakeMembers()
+        fake.put(9, "a+b&c@example.com", 9)
+        result = make_client(fake).members.get_by_email(1, "a+b&c@example.com")
+        assert result["status"] and result["data"]["id"] == 9
+        assert "a%2Bb%26c%40example.com" in str(fake.requests[0])
+
+
+class TestMemberEmailIndex:
+    """Test cases for MemberEmailIndex."""
+
+    def test_batch_lookup_from_index(self, make_client):
+        fake = FakeMembers()
+        index = MemberEmailIndex(make_client(fake), network_id=1)
+        assert index.build() == 4
+        fake.requests.clear()
+        found = index.lookup_emails(["M1@Example.com", "m3@example.com", "m1@example.com"])
+        assert [member["id"] for member in found.values()] == [1, 3, 1]
+        assert fake.requests == []
+        assert index.stats["hits"] == 3
+
+    def test_misses_fall_back_and_are_negatively_cached(self, make_client):
+        fake = FakeMembers()
+        index = MemberEmailIndex(make_client(fake), network_id=1)
+        index.build()
+        assert index.lookup("nobody@example.com") is None
+        assert index.lookup("nobody@example.com") is None
+        assert len(fake.by_email_requests()) == 1
+        assert index.stats["negative_hits"] == 1
+
+        # A refresh that finds the member clears the negative entry
+        fake.put(7, "nobody@example.com", 30)
+        index.refresh()
+        assert index.lookup("NOBODY@example.com")["id"] == 7
+
+    def test_negative_entries_expire(self, make_client):
+        fake = FakeMembers()
+        index = MemberEmailIndex(make_client(fake), network_id=1, negative_ttl=0)
+        index.lookup("x@example.com")
+        index.lookup("x@example.com")
+        assert len(fake.by_email_requests()) == 2
+
+    def test_several_misses_refresh_once(self, make_client):
+        fake = FakeMembers(count=8)
+        index = MemberEmailIndex(make_client(fake), network_id=1, order_param=("sort", "-updated_at"))
+        index.build()
+        fake.put(8, "new8@example.com", 40)
+        fake.put(9, "new9@example.com", 41)
+        fake.requests.clear()
+        found = index.lookup_emails(["new8@example.com", "new9@example.com", "m0@example.com"])
+        assert [found[e]["id"] for e in ("new8@example.com", "new9@example.com", "m0@example.com")] == [8, 9, 0]
+        assert fake.by_email_requests() == []
+        assert len(fake.requests) == 2  # one incremental pass, stopped early
+
+    def test_misses_skip_refresh_without_order(self, make_client):
+        fake = FakeMembers(count=20)
+        index = MemberEmailIndex(make_client(fake), network_id=1)
+        index.build()
+        fake.requests.clear()
+        found = index.lookup_emails(["x@example.com", "y@example.com"])
+        assert found == {"x@example.com": None, "y@example.com": None}
+        assert len(fake.requests) == len(fake.by_email_requests()) == 2
+
+    def test_refresh_stops_early_when_sorted(self, make_client):
+        fake = FakeMembers()
+        index = MemberEmailIndex(make_client(fake), network_id=1, order_param=("sort", "-updated_at"))
+        index.build()
+        fake.put(5, "new5@example.com", 40)
+        fake.requests.clear()
+        assert index.refresh() == 1
+        assert len(fake.requests) == 2
+        assert fake.requests[0].params["sort"] == "-updated_at"
+
+    def test_changed_email(self, make_client):
+        fake = FakeMembers()
+        index = MemberEmailIndex(make_client(fake), network_id=1)
+        index.build()
+        fake.put(2, "renamed@example.com", 50)
+        index.refresh()
+        assert "m2@example.com" not in index
+        assert index.lookup("renamed@example.com")["id"] == 2
+
+    def test_changed_email_on_later_page(self, make_client):
+        fake = FakeMembers(by_id=True)
+        for i in range(4):
+            fake.put(i, f"m{i}@example.com", 5)
+        index = MemberEmailIndex(make_client(fake), network_id=1)
+        index.build()
+        fake.put(3, "moved@example.com", 50)
+        assert index.refresh() == 1
+        assert "m3@example.com" not in index
+        assert index.lookup("moved@example.com")["id"] == 3
+
+    def test_api_errors_raise(self, make_client):
+        index = MemberEmailIndex(make_client(FakeMembers()), network_id=1)
+        with pytest.raises(APIError):
+            index.lookup("broken@example.com")
+
+    def test_mirror_backed(self, tmp_path, make_client):
+        fake = FakeMembers()
+        client = make_client(fake)
+        with Mirror(client, str(tmp_path / "mirror.db"), network_id=1) as mirror:
+            index = MemberEmailIndex(client, network_id=1, mirror=mirror)
+            index.build()
+            assert len(index) == 4
+            assert mirror.member_by_email("m2@example.com")["id"] == 2
+            assert index.lookup("M2@example.com")["id"] == 2
+            with pytest.raises(ValueError):
+                MemberEmailIndex(client, network_id=2, mirror=mirror)
+
+
+class FakeSpaces:
+    """Serves spaces, their members and membership writes."""
+
+    def __init__(self, memberships, per_page=2):
+        self.memberships = {space: list(members) for space, members in memberships.items()}
+        self.per_page = per_page
+
+    def page(self, request, items):
+        number = int(request.url.params.get("page", 1))
+        chunk = items[(number - 1) * self.per_page:number * self.per_page]
+        more = number * self.per_page < len(items)
+        links = {"next": f"{request.url.copy_with(query=None)}?page={number + 1}"} if more else {}
+        return httpx.Response(200, json={"items": chunk, "links": links})
+
+    def __call__(self, request):
+        parts = request.url.path.strip("/").split("/")[4:]
+        if parts == ["spaces"]:
+            return self.page(request, [{"id": space} for space in self.memberships])
+        space = int(parts[1])
+        if request.method == "POST":
+            self.memberships.setdefault(space, []).append(int(request.url.params["user_id"]))
+            return httpx.Response(200, json={"id": int(request.url.params["user_id"])})
+        if request.method == "DELETE" and len(parts) == 4:
+            self.memberships[space].remove(int(parts[3]))
+            return httpx.Response(204)
+        if request.method == "DELETE":
+            del self.memberships[space]
+            return httpx.Response(204)
+        return self.page(request, [{"id": member} for member in self.memberships[space]])
+
+
+class TestSpaceMembershipIndex:
+    """Test cases for SpaceMembershipIndex."""
+
+    @pytest.fixture
+    def built(self, make_client):
+        fake = FakeSpaces({10: [1, 2, 3, 4], 20: [3, 4, 5], 30: [4, 6]})
+        client = make_client(fake)
+        index = SpaceMembershipIndex(client, network_id=1, max_workers=3)
+        return client, index
+
+    def test_build_and_queries(self, built):
+        _, index = built
+        assert index.build() == {"spaces": 3, "members": 6, "memberships": 9}
+        assert index.spaces_of(4) == [10, 20, 30]
+        assert index.spaces_of(99) == []
+        assert index.members_of(20) == [3, 4, 5]
+        assert index.count(10) == 4
+        assert index.shared_members(10, 20) == [3, 4]
+        assert index.shared_members(10, 20, 30) == [4]
+        assert index.members_in_any(20, 30) == [3, 4, 5, 6]
+        assert index.members_only_in(10, 20) == [1, 2]
+        assert index.shared_spaces(3, 4) == [10, 20]
+        assert index.is_member(6, 30) and not index.is_member(6, 10)
+
+    def test_follows_writes_through_the_client(self, built):
+        client, index = built
+        index.build()
+        client.spaces.add_member(network_id=1, space_id=30, user_id=1)
+        client.spaces.remove_member(network_id=1, space_id=10, member_id=4)
+        assert index.spaces_of(1) == [10, 30]
+        assert index.spaces_of(4) == [20, 30]
+        client.spaces.add_member(network_id=1, space_id=40, user_id=7)
+        assert index.members_of(40) == [7]
+        client.spaces.delete(network_id=1, space_id=20)
+        assert index.members_of(20) == [] and index.spaces_of(5) == []
+
+        index.close()
+        client.spaces.add_member(network_id=1, space_id=30, user_id=2)
+        assert not index.is_member(2, 30)
+        assert index.refresh_space(30) == 4
+        assert index.is_member(2, 30)
+
+    def test_other_networks_are_ignored(self, built):
+        client, index = built
+        index.build()
+        client.write_listeners[0]("DELETE", "https://api.mn.co/admin/v1/networks/2/spaces/10/members/1", {})
+        assert index.is_member(1, 10)
@@ -0,0 +1,107 @@
+"""
+Tests for response_mode="lazy"
+"""
+import asyncio
+import json
+import pickle
+import subprocess
+import sys
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, LazyItem, MightyNetworksClient, ResponseCache
+
+pytest.importorskip("msgspec")
+
+MEMBERS = [
+    {
+        "id": i,
+        "email": f"m{i}@example.com",
+        "bio": 'Says "hi", uses [brackets] and {braces}: \\ok',
+        "custom_fields": [{"id": 456, "value": ["a", {"b": None}]}],
+    }
+    for i in range(3)
+]
+PAGE = {"items": MEMBERS, "links": {"next": None}}
+
+
+def serve(body):
+    """Answer every request with ``body``, indented so raw fields keep whitespace."""
+    content = json.dumps(body, indent=1).encode()
+    return lambda request: httpx.Response(200, content=content)
+
+
+class TestLazyMode:
+    """Test cases for LazyItem and lazy responses."""
+
+    def test_list_items_are_lazy(self, make_client):
+        result = make_client(serve(PAGE), response_mode="lazy").members.list(network_id=1)
+        assert result["links"] == {"next": None}
+        assert all(isinstance(item, LazyItem) for item in result["data"])
+        assert [item["email"] for item in result["data"]] == [m["email"] for m in MEMBERS]
+        assert result["data"] == MEMBERS
+
+    def test_fields_decoded_on_access(self, make_client):
+        item = make_client(serve(PAGE), response_mode="lazy").members.list(network_id=1)["data"][1]
+        assert item._values == {}
+        assert item["id"] == 1
+        assert list(item._values) == ["id"]
+        assert item["bio"] == MEMBERS[1]["bio"]
+        assert item.to_dict() == MEMBERS[1]
+        assert set(item) == set(MEMBERS[1])
+        assert "custom_fields" in item and "nickname" not in item
+        with pytest.raises(KeyError):
+            item["nickname"]
+
+    def test_single_object_body(self, make_client):
+        client = make_client(serve(MEMBERS[0]), response_mode="lazy")
+        result = client.members.get(network_id=1, user_id=0)
+        assert isinstance(result["data"], LazyItem)
+        assert result["data"]["custom_fields"] == MEMBERS[0]["custom_fields"]
+        assert result["links"] == {}
+
+    def test_non_object_items_decoded(self, make_client):
+        client = make_client(serve({"items": [1, "two", None, {"id": 3}]}), response_mode="lazy")
+        result = client.tags.list(network_id=1)
+        assert result["data"][:3] == [1, "two", None]
+        assert result["data"][3]["id"] == 3
+
+    def test_empty_and_non_object_bodies(self, make_client):
+        for body in ({"items": []}, [1, 2]):
+            client = make_client(serve(body), response_mode="lazy")
+            assert client.tags.list(network_id=1)["data"] == []
+
+    def test_iterator_and_cache(self, make_client):
+        cache = ResponseCache()
+        client = make_client(serve(PAGE), response_mode="lazy", cache=cache)
+        assert [m["id"] for m in client.members.iter_all(network_id=1)] == [0, 1, 2]
+        cached = client.members.list(network_id=1)["data"]
+        assert cache.stats()["hits"] == 1
+        assert isinstance(cached[2], LazyItem)
+        assert cached[2]["email"] == "m2@example.com"
+
+    def test_pickle_round_trip(self):
+        item = LazyItem.from_json(json.dumps(MEMBERS[0]).encode())
+        item["id"]
+        copy = pickle.loads(pickle.dumps(item))
+        assert copy._values == {}
+        assert copy == item == MEMBERS[0]
+
+    def test_async_lazy(self, make_client):
+        async def run():
+            async with make_client(serve(PAGE), AsyncMightyNetworksClient, response_mode="lazy") as client:
+                return await client.members.list(network_id=1)
+
+        assert asyncio.run(run())["data"][0]["id"] == 0
+
+    def test_dict_mode_does_not_import_msgspec(self):
+        code = (
+            "import sys; from mighty_networks_sdk import MightyNetworksClient; "
+            "MightyNetworksClient(api_token='t').members; print('msgspec' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert output.stdout.strip() == "False"
+
+    def test_requires_msgspec(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        with pytest.raises(ImportError):
+            MightyNetworksClient(api_token="test_token", response_mode="lazy")
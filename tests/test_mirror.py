@@ -0,0 +1,129 @@
+"""
+Tests for the SQLite mirror
+"""
+import re
+import httpx
+import pytest
+from mighty_networks_sdk import APIError, AsyncMightyNetworksClient, MightyNetworksClient, Mirror
+
+
+class FakeNetwork:
+    """In-memory API serving network 1 with two spaces."""
+
+    def __init__(self):
+        self.members = {i: {"id": i, "email": f"M{i}@Example.com", "first_name": f"M{i}",
+                            "updated_at": f"2025-01-0{i}T00:00:00Z"} for i in range(1, 6)}
+        self.spaces = {10: {"id": 10, "name": "General"}, 20: {"id": 20, "name": "Founders"}}
+        self.space_members = {10: [1, 2, 3], 20: [3, 4]}
+        self.posts = {10: [{"id": 100, "title": "Hello", "author_id": 1}], 20: []}
+        self.requests = []
+
+    def handler(self, request):
+        path = request.url.path.rstrip("/")
+        self.requests.append(path)
+        match = re.fullmatch(r"/admin/v1/networks/1/(\w+)(?:/(\d+))?(?:/(\w+))?", path)
+        resource, item_id, sub = match.groups()
+        if resource == "members" and item_id:
+            member = self.members.get(int(item_id))
+            return httpx.Response(200, json=member) if member else httpx.Response(404, json={})
+        if resource == "members":
+            items = list(self.members.values())
+        elif resource == "spaces" and sub == "members":
+            items = [{"id": m, "role": "member"} for m in self.space_members[int(item_id)]]
+        elif resource == "posts":
+            items = self.posts[int(request.url.params["space_id"])]
+        elif resource == "spaces" and sub == "events":
+            items = []
+        elif resource == "spaces":
+            items = list(self.spaces.values())
+        else:
+            items = []
+        return httpx.Response(200, json={"items": items, "links": {}})
+
+
+@pytest.fixture
+def network():
+    return FakeNetwork()
+
+
+@pytest.fixture
+def mirror(network, tmp_path):
+    client = MightyNetworksClient(api_token="test_token", transport=httpx.MockTransport(network.handler))
+    with Mirror(client, str(tmp_path / "mirror.sqlite3"), network_id=1) as mirror:
+        yield mirror
+
+
+class TestMirror:
+    """Test cases for Mirror."""
+
+    def test_sync_and_queries(self, mirror):
+        stats = mirror.sync(["members", "space_members", "posts"])
+        assert list(stats) == ["members", "space_members", "posts"]
+        assert stats["members"] == {"fetched": 5, "inserted": 5, "updated": 0, "unchanged": 0, "deleted": 0}
+        assert mirror.synced_at("spaces") is not None  # synced for the per-space resources
+
+        assert mirror.get("members", 2)["first_name"] == "M2"
+        assert mirror.member_by_email("m3@example.com")["id"] == 3
+        assert mirror.count("members") == 5
+        assert [m["id"] for m in mirror.find("members", order_by="-updated_at", limit=2)] == [5, 4]
+        assert [m["id"] for m in mirror.find("members", id=[1, 4])] == [1, 4]
+        assert [m["id"] for m in mirror.space_members(10)] == [1, 2, 3]
+        assert [s["name"] for s in mirror.member_spaces(3)] == ["General", "Founders"]
+        assert mirror.find("posts", space_id=10)[0]["title"] == "Hello"
+        assert mirror.query("SELECT COUNT(*) AS n FROM space_members")[0]["n"] == 5
+
+    def test_resync_writes_only_changes(self, mirror, network):
+        mirror.sync(["members", "space_members"])
+        network.members[2]["first_name"] = "Renamed"
+        network.members[6] = {"id": 6, "email": "m6@example.com"}
+        del network.members[5]
+        network.space_members[20] = [4]
+
+        stats = mirror.sync(["members", "space_members"])
+        assert stats["members"] == {"fetched": 5, "inserted": 1, "updated": 1, "unchanged": 3, "deleted": 1}
+        assert stats["space_members"]["deleted"] == 1
+        assert mirror.get("members", 2)["first_name"] == "Renamed"
+        assert mirror.get("members", 5) is None
+        assert [s["id"] for s in mirror.member_spaces(3)] == [10]
+
+    def test_reads_do_not_call_the_api(self, mirror, network):
+        mirror.sync(["members"])
+        before = len(network.requests)
+        mirror.member_by_email("M1@example.com")
+        mirror.find("members", first_name="M1")
+        assert len(network.requests) == before
+
+    def test_refresh(self, mirror, network):
+        mirror.sync(["members"])
+        network.members[1]["first_name"] = "Fresh"
+        assert mirror.refresh("members", 1)["first_name"] == "Fresh"
+        assert mirror.get("members", 1)["first_name"] == "Fresh"
+        del network.members[1]
+        assert mirror.refresh("members", 1) is None
+        assert mirror.get("members", 1) is None
+
+    def test_typed_client(self, network, tmp_path):
+        client = MightyNetworksClient(api_token="test_token", response_mode="typed",
+                                      transport=httpx.MockTransport(network.handler))
+        mirror = Mirror(client, str(tmp_path / "typed.sqlite3"), network_id=1)
+        mirror.sync(["members"])
+        assert mirror.get("members", 1)["email"] == "M1@Example.com"
+
+    def test_rejects_bad_input(self, mirror, tmp_path):
+        with pytest.raises(ValueError):
+            mirror.sync(["comments"])
+        with pytest.raises(ValueError):
+            mirror.find("members", bio="x")
+        with pytest.raises(ValueError):
+            mirror.find("members", order_by="data; DROP TABLE members")
+        with pytest.raises(TypeError):
+            Mirror(AsyncMightyNetworksClient(api_token="t"), str(tmp_path / "a.sqlite3"), network_id=1)
+
+    def test_failed_page_keeps_rows(self, mirror, network):
+        mirror.sync(["members"])
+        del network.members[5]
+        mirror.client._session_instance = None
+        mirror.client._transport = httpx.MockTransport(lambda request: httpx.Response(400, json={}))
+        with pytest.raises(APIError):
+            mirror.sync(["members"])
+        assert mirror.count("members") == 5
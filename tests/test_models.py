@@ -0,0 +1,133 @@
+"""
+Tests for typed models and response_mode="typed"
+"""
+import asyncio
+import pickle
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, Member, MightyNetworksClient, Space
+from mighty_networks_sdk import models
+
+MEMBER = {
+    "id": 1,
+    "email": "ada@example.com",
+    "first_name": "Ada",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-06-01T00:00:00Z",
+    "permalink": "https://example.mn.co/members/1",
+    "custom_fields": {"456": "Acme Corp"},
+}
+
+
+def serve(body):
+    """Answer every request with ``body``."""
+    return lambda request: httpx.Response(200, json=body)
+
+
+class TestModels:
+    """Test cases for the slotted models."""
+
+    def test_from_dict_keeps_unknown_fields(self):
+        member = Member.from_dict(MEMBER)
+        assert member.email == "ada@example.com"
+        assert member.last_name is None
+        assert member.extra == {"custom_fields": {"456": "Acme Corp"}}
+        assert member.to_dict() == {**MEMBER, **{
+            name: None for name in ("last_name", "time_zone", "location", "bio",
+                                    "referral_count", "avatar", "categories", "ambassador_level")
+        }}
+
+    def test_no_extra_when_all_fields_known(self):
+        assert Member.from_dict({"id": 1, "email": "a@example.com"}).extra is None
+
+    def test_slotted(self):
+        member = Member.from_dict(MEMBER)
+        assert not hasattr(member, "__dict__")
+        with pytest.raises(AttributeError):
+            member.nickname = "ada"
+
+    def test_dataclass_behaviour_kept(self):
+        space = Space(id=1, name="General", created_at="", updated_at="")
+        assert space == Space(id=1, name="General", created_at="", updated_at="")
+        assert space.extra is None
+        assert pickle.loads(pickle.dumps(space)) == space
+
+
+class TestTypedMode:
+    """Test cases for response_mode="typed"."""
+
+    def test_list_returns_models(self, make_client):
+        client = make_client(serve({"items": [MEMBER, MEMBER], "links": {}}), response_mode="typed")
+        result = client.members.list(network_id=1)
+        assert [type(m) for m in result["data"]] == [Member, Member]
+        assert result["data"][0].extra == {"custom_fields": {"456": "Acme Corp"}}
+
+    def test_get_returns_model(self, make_client):
+        client = make_client(serve({**MEMBER, "id": 9, "name": "General"}), response_mode="typed")
+        assert client.spaces.get(network_id=1, space_id=9)["data"].name == "General"
+        assert client.spaces.get_member(1, 9, 1)["data"].id == 9
+
+    def test_iterators_yield_models(self, make_client):
+        client = make_client(serve({"items": [MEMBER], "links": {}}), response_mode="typed")
+        assert [m.email for m in client.members.iter_all(network_id=1)] == ["ada@example.com"]
+
+    def test_untyped_methods_and_dict_mode_unchanged(self, make_client):
+        client = make_client(serve({"items": [MEMBER], "links": {}}), response_mode="typed")
+        assert client.tags.list(network_id=1)["data"] == [MEMBER]
+        dict_client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=MEMBER)),
+        )
+        assert dict_client.members.get(network_id=1, user_id=1)["data"] == MEMBER
+
+    def test_cached_results_are_typed(self, make_client):
+        from mighty_networks_sdk import ResponseCache
+
+        client = make_client(
+            serve({"items": [MEMBER], "links": {}}), response_mode="typed", cache=ResponseCache()
+        )
+        client.members.list(network_id=1)
+        assert isinstance(client.members.list(network_id=1)["data"][0], Member)
+
+    def test_async_typed(self, make_client):
+        async def run():
+            async with make_client(serve(MEMBER), AsyncMightyNetworksClient, response_mode="typed") as client:
+                return await client.members.get(network_id=1, user_id=1)
+
+        assert asyncio.run(run())["data"].first_name == "Ada"
+
+    def test_exact_bodies_decode_straight_to_models(self, make_client, monkeypatch):
+        pytest.importorskip("msgspec")
+        known = {key: value for key, value in MEMBER.items() if key != "custom_fields"}
+
+        def from_dict(cls, data):
+            raise AssertionError("built from a dict")
+
+        monkeypatch.setattr(Member, "from_dict", classmethod(from_dict))
+        client = make_client(serve({"items": [known], "links": {}}), response_mode="typed")
+        [member] = client.members.list(network_id=1)["data"]
+        assert type(member) is Member and member.extra is None
+        assert member.to_dict() == Member(**known).to_dict()
+        client = make_client(serve(known), response_mode="typed")
+        assert client.members.get(network_id=1, user_id=1)["data"].first_name == "Ada"
+
+    def test_exact_bodies_cached(self, make_client):
+        from mighty_networks_sdk import ResponseCache
+
+        known = {key: value for key, value in MEMBER.items() if key != "custom_fields"}
+        client = make_client(
+            serve({"items": [known], "links": {}}), response_mode="typed", cache=ResponseCache()
+        )
+        first = client.members.list(network_id=1)["data"]
+        assert client.members.list(network_id=1)["data"] == first
+
+    def test_fallback_without_msgspec(self, make_client, monkeypatch):
+        monkeypatch.setattr(models, "_msgspec", False)
+        known = {key: value for key, value in MEMBER.items() if key != "custom_fields"}
+        client = make_client(serve({"items": [known, MEMBER], "links": {}}), response_mode="typed")
+        members = client.members.list(network_id=1)["data"]
+        assert [member.extra for member in members] == [None, {"custom_fields": {"456": "Acme Corp"}}]
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            MightyNetworksClient(api_token="test_token", response_mode="objects")
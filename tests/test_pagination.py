@@ -0,0 +1,153 @@
+"""
+Tests for pagination iterators
+"""
+import asyncio
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient
+from mighty_networks_sdk.exceptions import APIError
+
+BASE = "https://api.mn.co/admin/v1/networks/12345/members"
+
+
+def paged_handler(pages, calls=None):
+    """Serve ``pages`` (lists of items) linked through ``links.next``."""
+    def handler(request):
+        if calls is not None:
+            calls.append(str(request.url))
+        page = int(request.url.params.get("page", 1))
+        links = {"self": f"{BASE}?page={page}"}
+        if page < len(pages):
+            links["next"] = f"{BASE}?page={page + 1}"
+        return httpx.Response(200, json={"items": pages[page - 1], "links": links})
+    return handler
+
+
+class TestPagination:
+    """Test cases for Paginator."""
+
+    def test_list_exposes_links(self, make_client):
+        """Test that list results carry pagination metadata."""
+        client = make_client(paged_handler([[{"id": 1}], [{"id": 2}]]))
+        result = client.members.list(network_id=12345)
+        assert result["data"] == [{"id": 1}]
+        assert result["links"]["next"] == f"{BASE}?page=2"
+
+    def test_iter_all_follows_next_links(self, make_client):
+        """Test that iter_all yields items from every page."""
+        calls = []
+        client = make_client(paged_handler([[{"id": 1}, {"id": 2}], [{"id": 3}], [{"id": 4}]], calls))
+        iterator = client.members.iter_all(network_id=12345)
+        assert calls == []
+        assert [m["id"] for m in iterator] == [1, 2, 3, 4]
+        assert len(calls) == 3
+
+    def test_iter_all_is_lazy(self, make_client):
+        """Test that pages are fetched only as items are consumed."""
+        calls = []
+        client = make_client(paged_handler([[{"id": 1}], [{"id": 2}]], calls))
+        iterator = iter(client.members.iter_all(network_id=12345))
+        assert next(iterator) == {"id": 1}
+        assert len(calls) == 1
+
+    def test_iter_keeps_initial_params(self, make_client):
+        """Test that the first request carries the list parameters."""
+        calls = []
+        client = make_client(paged_handler([[{"id": 1}]], calls))
+        list(client.posts.iter_all(network_id=12345, space_id=67890))
+        assert "space_id=67890" in calls[0]
+
+    def test_iter_raises_on_error(self, make_client):
+        """Test that a failing page raises APIError."""
+        client = make_client(lambda request: httpx.Response(403))
+        with pytest.raises(APIError):
+            list(client.spaces.iter_members(network_id=12345, space_id=1))
+
+    def test_async_iter_all(self, make_client):
+        """Test async iteration over every page."""
+        async def run():
+            async with make_client(
+                paged_handler([[{"id": 1}], [{"id": 2}]]), AsyncMightyNetworksClient
+            ) as client:
+                return [m["id"] async for m in client.members.iter_all(network_id=12345)]
+
+        assert asyncio.run(run()) == [1, 2]
+
+
+def cursor_handler(count, calls=None):
+    """Serve ``count`` single-item pages linked by opaque cursors."""
+    def handler(request):
+        if calls is not None:
+            calls.append(str(request.url))
+        index = int(request.url.params.get("cursor", "c0")[1:])
+        links = {}
+        if index + 1 < count:
+            links["next"] = f"{BASE}?cursor=c{index + 1}"
+        return httpx.Response(200, json={"items": [{"id": index}], "links": links})
+    return handler
+
+
+class TestPrefetch:
+    """Test cases for prefetching paginators."""
+
+    def test_prefetch_numbered_pages(self, make_client):
+        """Test that predicted pages are yielded in order."""
+        pages = [[{"id": i}] for i in range(1, 11)]
+        client = make_client(paged_handler(pages))
+        members = client.members.iter_all(network_id=12345).prefetch(4)
+        assert [m["id"] for m in members] == list(range(1, 11))
+        assert members.stats.pages == 10
+        assert members.stats.items == 10
+        assert members.stats.pages_per_second > 0
+
+    def test_prefetch_keeps_pages_in_flight(self, make_client):
+        """Test that numbered pages are requested concurrently."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        serve = paged_handler([[{"id": i}] for i in range(1, 9)])
+
+        def handler(request):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return serve(request)
+
+        client = make_client(handler)
+        assert len(list(client.members.iter_all(network_id=12345).prefetch(4))) == 8
+        assert state["peak"] > 1
+
+    def test_prefetch_lookahead_cursor_links(self, make_client):
+        """Test look-ahead prefetching when next links are opaque cursors."""
+        client = make_client(cursor_handler(6))
+        members = client.members.iter_all(network_id=12345).prefetch(2)
+        assert [m["id"] for m in members] == list(range(6))
+        assert members.stats.pages == 6
+
+    def test_prefetch_stops_early(self, make_client):
+        """Test that breaking out of a prefetching iterator stops cleanly."""
+        client = make_client(cursor_handler(50))
+        for member in client.members.iter_all(network_id=12345).prefetch(3):
+            if member["id"] == 2:
+                break
+
+    def test_prefetch_rejects_invalid_depth(self, make_client):
+        """Test that prefetch depth must be positive."""
+        client = make_client(cursor_handler(1))
+        with pytest.raises(ValueError):
+            client.members.iter_all(network_id=12345).prefetch(0)
+
+    def test_async_prefetch(self, make_client):
+        """Test async prefetching in both modes."""
+        async def run(handler):
+            async with make_client(handler, AsyncMightyNetworksClient) as client:
+                members = client.members.iter_all(network_id=12345).prefetch(3)
+                return [m["id"] async for m in members]
+
+        assert asyncio.run(run(paged_handler([[{"id": i}] for i in range(1, 8)]))) == list(range(1, 8))
+        assert asyncio.run(run(cursor_handler(5))) == list(range(5))
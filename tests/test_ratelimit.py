@@ -0,0 +1,122 @@
+"""
+Tests for client-side rate limiters
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+import httpx
+import pytest
+from mighty_networks_sdk import (
+    AsyncMightyNetworksClient,
+    FileTokenBucket,
+    MightyNetworksClient,
+    TokenBucket,
+)
+
+
+def _reserve_many(path, count, queue):
+    bucket = FileTokenBucket(path, rate=10, capacity=5)
+    queue.put([bucket.reserve() for _ in range(count)])
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_paced(self):
+        """Test that the burst is free and later tokens are paced."""
+        bucket = TokenBucket(rate=10, capacity=3)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_refills_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        bucket.reserve()
+        time.sleep(0.02)
+        assert bucket.reserve() == 0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_thread_safe(self):
+        """Test that concurrent reservations never double-spend tokens."""
+        bucket = TokenBucket(rate=100, capacity=10)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(10):
+                delay = bucket.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 50 tokens at 100/s with a burst of 10: the last waits ~0.4s
+        assert sum(1 for d in delays if d == 0) <= 10
+        assert max(delays) == pytest.approx(0.4, abs=0.05)
+
+    def test_client_paces_requests(self):
+        """Test that the client waits on its rate limiter."""
+        client = MightyNetworksClient(
+            api_token="test_token",
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+            rate_limiter=TokenBucket(rate=50, capacity=1),
+        )
+        start = time.monotonic()
+        for _ in range(4):
+            client.me.show(network_id=1)
+        assert time.monotonic() - start >= 0.05
+
+    def test_async_client_paces_requests(self):
+        """Test that the async client waits on its rate limiter."""
+        async def run():
+            async with AsyncMightyNetworksClient(
+                api_token="test_token",
+                transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+                rate_limiter=TokenBucket(rate=50, capacity=1),
+            ) as client:
+                await asyncio.gather(*[client.me.show(network_id=1) for _ in range(4)])
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.05
+
+
+class TestFileTokenBucket:
+    """Test cases for FileTokenBucket."""
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test that buckets on the same file share tokens."""
+        path = str(tmp_path / "bucket")
+        first = FileTokenBucket(path, rate=10, capacity=2)
+        second = FileTokenBucket(path, rate=10, capacity=2)
+        assert first.reserve() == 0
+        assert second.reserve() == 0
+        assert first.reserve() == pytest.approx(0.1, abs=0.02)
+
+    def test_shared_between_processes(self, tmp_path):
+        """Test that processes draw from one bucket."""
+        path = str(tmp_path / "bucket")
+        queue = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_reserve_many, args=(path, 5, queue))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        delays = queue.get(timeout=10) + queue.get(timeout=10)
+        for worker in workers:
+            worker.join()
+
+        # Only the 5-token burst is free; the rest are paced at 10/s, minus
+        # whatever refilled while the second process was starting
+        assert sum(1 for d in delays if d == 0) <= 6
+        assert 0.2 <= max(delays) <= 0.55
@@ -0,0 +1,148 @@
+"""
+Tests for RetryPolicy
+"""
+import asyncio
+import time
+from email.utils import formatdate
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, MightyNetworksClient, RetryPolicy
+from mighty_networks_sdk.retry import parse_retry_after
+
+
+def sequence_handler(responses, calls):
+    """Return the queued responses (or raise queued errors) in order."""
+    def handler(request):
+        calls.append(request.method)
+        item = responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+    return handler
+
+
+# Retry immediately so the tests do not sleep
+NO_BACKOFF = RetryPolicy(backoff_factor=0)
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    def test_default_policy(self):
+        """Test that the client retries by default."""
+        client = MightyNetworksClient(api_token="test_token")
+        assert client.retry.max_attempts == 3
+        assert "GET" in client.retry.retry_methods
+        assert "POST" not in client.retry.retry_methods
+
+    def test_invalid_attempts(self):
+        """Test that at least one attempt is required."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_retries_server_error(self, make_client):
+        """Test that a GET is retried after a 503."""
+        calls = []
+        client = make_client(sequence_handler(
+            [httpx.Response(503), httpx.Response(200, json={"id": 1})], calls
+        ), retry=NO_BACKOFF)
+        result = client.network.show(network_id=1)
+        assert result["status"] is True
+        assert len(calls) == 2
+
+    def test_gives_up_after_max_attempts(self, make_client):
+        """Test that the last failure is returned once attempts run out."""
+        calls = []
+        client = make_client(sequence_handler([httpx.Response(429)] * 3, calls), retry=NO_BACKOFF)
+        result = client.network.show(network_id=1)
+        assert result == {"status": False, "data": [], "message": "Rate limit exceeded"}
+        assert len(calls) == 3
+
+    def test_post_not_retried_by_default(self, make_client):
+        """Test that POST requests are not retried unless opted in."""
+        calls = []
+        client = make_client(sequence_handler([httpx.Response(503)], calls), retry=NO_BACKOFF)
+        result = client.spaces.create(network_id=1, name="Space")
+        assert result["status"] is False
+        assert calls == ["POST"]
+
+    def test_post_retried_when_opted_in(self, make_client):
+        """Test retry_post opt-in."""
+        calls = []
+        client = make_client(
+            sequence_handler([httpx.Response(503), httpx.Response(201, json={"id": 2})], calls),
+            retry=RetryPolicy(backoff_factor=0, retry_post=True),
+        )
+        assert client.spaces.create(network_id=1, name="Space")["status"] is True
+        assert calls == ["POST", "POST"]
+
+    def test_connect_error_retried_for_any_method(self, make_client):
+        """Test that errors raised before sending are always retried."""
+        calls = []
+        client = make_client(sequence_handler(
+            [httpx.ConnectError("refused"), httpx.Response(201, json={})], calls
+        ), retry=NO_BACKOFF)
+        assert client.spaces.create(network_id=1, name="Space")["status"] is True
+        assert len(calls) == 2
+
+    def test_read_error_not_retried_for_post(self, make_client):
+        """Test that POSTs interrupted mid-flight are not replayed."""
+        calls = []
+        client = make_client(sequence_handler([httpx.ReadError("reset")], calls), retry=NO_BACKOFF)
+        result = client.spaces.create(network_id=1, name="Space")
+        assert result["message"].startswith("Network error")
+        assert len(calls) == 1
+
+    def test_retry_after_header(self):
+        """Test that Retry-After extends the backoff delay."""
+        policy = RetryPolicy(backoff_factor=0)
+        response = httpx.Response(429, headers={"Retry-After": "2"})
+        assert policy.retry_delay("GET", 1, response=response) == 2.0
+
+    def test_retry_after_capped(self):
+        """Test that server-requested waits are capped."""
+        policy = RetryPolicy(backoff_factor=0, max_retry_after=5)
+        response = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert policy.retry_delay("GET", 1, response=response) == 5
+
+    def test_backoff_with_jitter(self):
+        """Test that jittered backoff stays within the exponential bound."""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=3)
+        for attempt in range(1, 6):
+            assert 0 <= policy.backoff(attempt) <= min(3, 2 ** (attempt - 1))
+
+    def test_async_retry(self, make_client):
+        """Test that the async client retries too."""
+        calls = []
+
+        async def run():
+            async with make_client(
+                sequence_handler([httpx.Response(502), httpx.Response(200, json={})], calls),
+                client_class=AsyncMightyNetworksClient,
+                retry=NO_BACKOFF,
+            ) as client:
+                return await client.me.show(network_id=1)
+
+        assert asyncio.run(run())["status"] is True
+        assert len(calls) == 2
+
+
+class TestParseRetryAfter:
+    """Test cases for parse_retry_after."""
+
+    def test_seconds(self):
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+
+    def test_http_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= parse_retry_after({"Retry-After": value}) <= 30
+
+    def test_rate_limit_reset_epoch(self):
+        value = str(int(time.time()) + 10)
+        assert 8 <= parse_retry_after({"X-RateLimit-Reset": value}) <= 10
+
+    def test_rate_limit_reset_delta(self):
+        assert parse_retry_after({"RateLimit-Reset": "4"}) == 4.0
+
+    def test_missing(self):
+        assert parse_retry_after({}) is None
@@ -0,0 +1,132 @@
+"""
+Tests for SingleFlight request coalescing
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import pytest
+from mighty_networks_sdk import AsyncMightyNetworksClient, SingleFlight
+
+
+def gated_handler(calls, gate):
+    """Hold every response until ``gate`` is set, counting calls per path."""
+    def handler(request):
+        calls.append(request.url.path)
+        gate.wait(5)
+        return httpx.Response(200, json={"id": 1, "path": request.url.path})
+    return handler
+
+
+def wait_for(predicate, timeout=5.0):
+    done = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        done.wait(0.01)
+    raise AssertionError("condition not reached")
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_threads_share_one_call(self, make_client):
+        calls, gate, flights = [], threading.Event(), SingleFlight()
+        client = make_client(gated_handler(calls, gate), single_flight=flights)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            futures = [pool.submit(client.network.show, 12345) for _ in range(10)]
+            wait_for(lambda: flights.stats()["saved"] == 9)
+            gate.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r["data"]["id"] == 1 for r in results)
+        assert flights.stats() == {"calls": 1, "saved": 9, "in_flight": 0}
+
+    def test_results_are_independent_copies(self, make_client):
+        calls, gate, flights = [], threading.Event(), SingleFlight()
+        client = make_client(gated_handler(calls, gate), single_flight=flights)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(client.members.get, 1, 2) for _ in range(3)]
+            wait_for(lambda: flights.stats()["saved"] == 2)
+            gate.set()
+            results = [f.result() for f in futures]
+
+        results[0]["data"]["id"] = 99
+        assert [r["data"]["id"] for r in results[1:]] == [1, 1]
+
+    def test_different_urls_and_writes_not_coalesced(self, make_client):
+        calls, gate, flights = [], threading.Event(), SingleFlight()
+        gate.set()
+        client = make_client(gated_handler(calls, gate), single_flight=flights)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda uid: client.members.get(1, uid), range(4)))
+            list(pool.map(lambda _: client.spaces.delete(1, 2), range(4)))
+        assert len(calls) == 8
+        assert flights.stats()["saved"] == 0
+
+    def test_sequential_calls_not_shared(self, make_client):
+        calls, gate, flights = [], threading.Event(), SingleFlight()
+        gate.set()
+        client = make_client(gated_handler(calls, gate), single_flight=flights)
+        client.network.show(1)
+        client.network.show(1)
+        assert len(calls) == 2
+
+    def test_error_propagates_to_followers(self):
+        flights = SingleFlight()
+        gate = threading.Event()
+
+        def failing():
+            gate.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flights.do, "key", failing) for _ in range(3)]
+            wait_for(lambda: flights.stats()["saved"] == 2)
+            gate.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result()
+        assert flights.stats()["in_flight"] == 0
+
+    def test_async_tasks_share_one_call(self):
+        calls, flights = [], SingleFlight()
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": 1})
+
+        async def run():
+            async with AsyncMightyNetworksClient(
+                api_token="test_token",
+                transport=httpx.MockTransport(handler),
+                single_flight=flights,
+            ) as client:
+                return await asyncio.gather(*(client.network.show(12345) for _ in range(20)))
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(r["data"] == {"id": 1} for r in results)
+        assert flights.stats()["saved"] == 19
+
+    def test_async_cancelled_leader_does_not_cancel_followers(self):
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return {"status": True, "data": {"id": 1}}
+
+        async def run():
+            leader = asyncio.ensure_future(flights.do_async("key", call))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.do_async("key", call))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(run())["data"] == {"id": 1}
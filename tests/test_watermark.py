@@ -0,0 +1,157 @@
+"""
+Tests for watermark-based incremental sync
+"""
+import asyncio
+import httpx
+from mighty_networks_sdk import (
+    AsyncMightyNetworksClient,
+    IncrementalSync,
+    MightyNetworksClient,
+    Mirror,
+    WatermarkStore,
+)
+
+BASE = "https://api.mn.co/admin/v1/networks/1/members"
+
+
+class FakeMembers:
+    """Serves members newest-first (or by id), ``per_page`` per page, and records requests."""
+
+    def __init__(self, per_page=2, by_id=False):
+        self.per_page = per_page
+        self.by_id = by_id
+        self.members = {}
+        self.requests = []
+
+    def touch(self, member_id, stamp):
+        self.members[member_id] = {
+            "id": member_id,
+            "email": f"m{member_id}@example.com",
+            "updated_at": f"2025-01-01T00:00:{stamp:02d}Z",
+        }
+
+    def __call__(self, request):
+        self.requests.append(request.url)
+        number = int(request.url.params.get("page", 1))
+        if self.by_id:
+            ordered = sorted(self.members.values(), key=lambda m: m["id"])
+        else:
+            ordered = sorted(self.members.values(), key=lambda m: (m["updated_at"], m["id"]), reverse=True)
+        items = ordered[(number - 1) * self.per_page:number * self.per_page]
+        more = number * self.per_page < len(ordered)
+        links = {"next": f"{BASE}?page={number + 1}"} if more else {}
+        return httpx.Response(200, json={"items": items, "links": links})
+
+
+def make_fake(count=6):
+    fake = FakeMembers()
+    for i in range(count):
+        fake.touch(i, i)
+    return fake
+
+
+def ids(items):
+    return sorted(item["id"] for item in items)
+
+
+class TestIncrementalSync:
+    """Test cases for IncrementalSync."""
+
+    def test_first_pass_emits_everything(self, make_client):
+        fake = make_fake()
+        sync = IncrementalSync(make_client(fake))
+        assert ids(sync.changes("members", network_id=1)) == list(range(6))
+        assert sync.mark("members", network_id=1) == "2025-01-01T00:00:05Z"
+        assert sync.stats == {"pages": 3, "fetched": 6, "emitted": 6, "stopped_early": False}
+
+    def test_stops_early_on_newest_first_listing(self, make_client):
+        fake = make_fake()
+        sync = IncrementalSync(make_client(fake), order="desc")
+        list(sync.changes("members", network_id=1))
+        fake.touch(1, 30)
+        fake.requests.clear()
+        assert ids(sync.changes("members", network_id=1)) == [1]
+        assert len(fake.requests) == 2
+        assert sync.stats["stopped_early"]
+        assert sync.mark("members", network_id=1) == "2025-01-01T00:00:30Z"
+        assert list(sync.changes("members", network_id=1)) == []
+
+    def test_records_sharing_the_mark(self, make_client):
+        fake = make_fake(2)
+        sync = IncrementalSync(make_client(fake))
+        list(sync.changes("members", network_id=1))
+        # A record written in the same second as the mark is still emitted, once
+        fake.touch(7, 1)
+        assert ids(sync.changes("members", network_id=1)) == [7]
+        assert list(sync.changes("members", network_id=1)) == []
+
+    def test_unordered_listing_reads_every_page(self, make_client):
+        fake = make_fake()
+        sync = IncrementalSync(make_client(fake), order="none")
+        list(sync.changes("members", network_id=1))
+        fake.touch(0, 40)
+        fake.requests.clear()
+        assert ids(sync.changes("members", network_id=1)) == [0]
+        assert len(fake.requests) == 3
+
+    def test_auto_does_not_trust_tied_first_page(self, make_client):
+        # Listed by id, with a bulk-imported first page sharing one timestamp
+        fake = FakeMembers(by_id=True)
+        for i in range(6):
+            fake.touch(i, 10 if i < 2 else i)
+        sync = IncrementalSync(make_client(fake))
+        list(sync.changes("members", network_id=1))
+        fake.touch(4, 30)
+        fake.requests.clear()
+        assert ids(sync.changes("members", network_id=1)) == [4]
+        assert len(fake.requests) == 3
+        assert not sync.stats["stopped_early"]
+
+    def test_server_side_params(self, make_client):
+        fake = make_fake()
+        sync = IncrementalSync(make_client(fake), filter_param="updated_since",
+                               order_param=("sort", "-updated_at"))
+        list(sync.changes("members", network_id=1))
+        assert "updated_since" not in fake.requests[0].params
+        assert fake.requests[0].params["sort"] == "-updated_at"
+        list(sync.changes("members", network_id=1))
+        assert fake.requests[-1].params["updated_since"] == "2025-01-01T00:00:05Z"
+
+    def test_abandoned_pass_keeps_mark(self, tmp_path, make_client):
+        fake = make_fake()
+        path = str(tmp_path / "marks.json")
+        sync = IncrementalSync(make_client(fake), WatermarkStore(path))
+        changes = sync.changes("members", network_id=1)
+        next(changes)
+        changes.close()
+        assert sync.mark("members", network_id=1) is None
+
+        list(sync.changes("members", network_id=1))
+        reopened = IncrementalSync(make_client(fake), WatermarkStore(path))
+        assert reopened.mark("members", network_id=1) == "2025-01-01T00:00:05Z"
+        assert reopened.mark("members", network_id=2) is None
+        reopened.reset("members", network_id=1)
+        assert len(list(reopened.changes("members", network_id=1))) == 6
+
+    def test_feeds_mirror(self, tmp_path, make_client):
+        fake = make_fake()
+        client = make_client(fake)
+        sync = IncrementalSync(client)
+        with Mirror(client, str(tmp_path / "mirror.db"), network_id=1) as mirror:
+            counts = mirror.upsert("members", sync.changes("members", network_id=1))
+            assert counts["inserted"] == 6
+            fake.touch(2, 50)
+            counts = mirror.upsert("members", sync.changes("members", network_id=1))
+            assert counts == {"fetched": 1, "inserted": 0, "updated": 1, "unchanged": 0}
+            assert mirror.get("members", 2)["updated_at"] == "2025-01-01T00:00:50Z"
+
+    def test_async_changes(self, make_client):
+        fake = make_fake()
+        sync = IncrementalSync(make_client(fake, AsyncMightyNetworksClient))
+
+        async def collect():
+            return [item async for item in sync.achanges("members", network_id=1)]
+
+        assert ids(asyncio.run(collect())) == list(range(6))
+        fake.touch(3, 20)
+        assert ids(asyncio.run(collect())) == [3]